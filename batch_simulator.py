@@ -0,0 +1,377 @@
+"""
+Batch season simulator for Monte Carlo league forecasting.
+
+Replays the schedule of a `Season` once per seed and records the outcome of every
+game of every replica in flat, typed arrays. The draws made for a replica are
+exactly the draws `Season.simulate_season` makes after `RandomGen.set_seed(seed)`,
+so the leaderboard and player stats of any replica match a real simulation.
+
+The result buffers are `array('q')` objects laid out in row-major order, so they
+can be wrapped without copying, e.g. `numpy.frombuffer(results.home_goals, dtype='int64')`
+reshaped to `(replicas, games)`.
+"""
+from __future__ import annotations
+from array import array
+from typing import Iterable, Union
+
+from algorithms.mergesort import mergesort
+from constants import GameResult, PlayerPosition, PlayerStats
+from data_structures.compact_hash_table import CompactLinearProbeTable
+from data_structures.hash_set import ElementTable
+from data_structures.referential_array import ArrayR
+from game_simulator import GameSimulator
+from player import Player
+from random_gen import RandomGen
+from season import Season
+from team import Team
+from team_registry import TeamRegistry
+from weighted_index import CumulativeWeights
+
+
+class BatchResults:
+    """
+    Results of a batch of simulated seasons.
+
+    Attributes:
+        home_goals, away_goals (array[int]): Goals per (replica, game), index `replica * num_games + game`.
+        scorers, assists, tackles, interceptions (array[int]): Player ids per (replica, game, event),
+            index `(replica * num_games + game) * MAX_EVENTS + event`, padded with `NO_PLAYER`.
+        player_index (ElementTable[Player, int]): player -> the player's id, their position in `players`
+        stat_columns (CompactLinearProbeTable[str, int]): tracked statistic's value -> its column in a `player_stats` row
+    """
+
+    # Event slots per game: the goals of both sides, or the interceptions (or tackles) of the game.
+    MAX_EVENTS = max(2 * max(GameSimulator.GOAL_DISTRIBUTION), GameSimulator.MAX_DEFENSIVE_EVENTS)
+    NO_PLAYER = -1
+
+    # The statistics tracked per player, in `player_stats` column order.
+    PLAYER_STATS = (PlayerStats.GAMES_PLAYED, PlayerStats.GOALS, PlayerStats.ASSISTS,
+                    PlayerStats.TACKLES, PlayerStats.INTERCEPTIONS)
+
+    def __init__(self, seeds: ArrayR[int], teams: ArrayR[Team], players: ArrayR[Player],
+                 player_index: ElementTable[Player, int], player_team: array, home: array, away: array) -> None:
+        """
+        Allocate the result buffers for every replica.
+
+        Complexity:
+            Best/Worst Case Complexity: O(R * G) where R is the number of seeds and G the number of games.
+        """
+        self.seeds = seeds
+        self.teams = teams
+        self.players = players
+        self.player_index = player_index
+        self.player_team = player_team
+        self.stat_columns: CompactLinearProbeTable[str, int] = CompactLinearProbeTable()
+        for column, statistic in enumerate(self.PLAYER_STATS):
+            self.stat_columns[statistic.value] = column
+        self.home = home
+        self.away = away
+        self.num_replicas = len(seeds)
+        self.num_games = len(home)
+
+        cells = self.num_replicas * self.num_games
+        self.home_goals = array('q', bytes(8 * cells))
+        self.away_goals = array('q', bytes(8 * cells))
+        events = array('q', [self.NO_PLAYER]) * (cells * self.MAX_EVENTS)
+        self.scorers = events
+        self.assists = array('q', events)
+        self.tackles = array('q', events)
+        self.interceptions = array('q', events)
+
+        # player_stats of each replica, computed on first use
+        self.player_stats_cache: ArrayR[Union[ArrayR[array], None]] = ArrayR(self.num_replicas)
+
+    def team_stats(self, replica: int) -> ArrayR[array]:
+        """
+        Compute the final table of a replica.
+
+        Returns:
+            ArrayR[array]: One array per team, with the entries
+                [games played, points, wins, draws, losses, goals for, goals against, goal difference]
+
+        Complexity:
+            Best/Worst Case Complexity: O(G + T) where G is the number of games and T the number of teams.
+        """
+        stats = ArrayR(len(self.teams))
+        for i in range(len(self.teams)):
+            stats[i] = array('q', bytes(8 * 8))
+
+        base = replica * self.num_games
+        for game in range(self.num_games):
+            home_goals = self.home_goals[base + game]
+            away_goals = self.away_goals[base + game]
+            home_row = stats[self.home[game]]
+            away_row = stats[self.away[game]]
+            if home_goals > away_goals:
+                home_result, away_result = GameResult.WIN, GameResult.LOSS
+            elif away_goals > home_goals:
+                home_result, away_result = GameResult.LOSS, GameResult.WIN
+            else:
+                home_result, away_result = GameResult.DRAW, GameResult.DRAW
+            BatchResults.__record(home_row, home_result, home_goals, away_goals)
+            BatchResults.__record(away_row, away_result, away_goals, home_goals)
+        return stats
+
+    @staticmethod
+    def __record(row: array, result: GameResult, goals_for: int, goals_against: int) -> None:
+        """ Add one game to a team's row of `team_stats`. """
+        row[0] += 1
+        row[1] += result.value
+        if result == GameResult.WIN:
+            row[2] += 1
+        elif result == GameResult.DRAW:
+            row[3] += 1
+        else:
+            row[4] += 1
+        row[5] += goals_for
+        row[6] += goals_against
+        row[7] = row[5] - row[6]
+
+    def last_results(self, replica: int, team_index: int, count: int = 5) -> Union[ArrayR[GameResult], None]:
+        """
+        The last `count` results of a team in a replica, oldest first.
+
+        Returns:
+            ArrayR[GameResult]: The results, or None if the team never played.
+
+        Complexity:
+            Best Case Complexity: O(count) when the team plays in the last `count` games.
+            Worst Case Complexity: O(G) where G is the number of games.
+        """
+        found: list[GameResult] = []
+        base = replica * self.num_games
+        game = self.num_games - 1
+        while game >= 0 and len(found) < count:
+            if self.home[game] == team_index or self.away[game] == team_index:
+                home_goals = self.home_goals[base + game]
+                away_goals = self.away_goals[base + game]
+                if self.away[game] == team_index:
+                    home_goals, away_goals = away_goals, home_goals
+                if home_goals > away_goals:
+                    found.append(GameResult.WIN)
+                elif home_goals < away_goals:
+                    found.append(GameResult.LOSS)
+                else:
+                    found.append(GameResult.DRAW)
+            game -= 1
+        found.reverse()
+        return ArrayR.from_list(found)
+
+    def get_leaderboard(self, replica: int) -> ArrayR[ArrayR[Union[int, str]]]:
+        """
+        Generates the leaderboard of a replica in the same layout and order as `Season.get_leaderboard`.
+        The previous five results are returned as an ArrayR[GameResult] (oldest first).
+
+        Complexity:
+            Best/Worst Case Complexity: O(G + T*log(T)) where G is the number of games and T the number of teams.
+        """
+        stats = self.team_stats(replica)
+        order = mergesort(
+            list(range(len(self.teams))),
+            key=lambda t: (stats[t][1], stats[t][7], stats[t][5], self.teams[t].get_name()),
+        )
+
+        leaderboard = ArrayR(len(self.teams))
+        for rank in range(len(order)):
+            team_index = order[len(order) - 1 - rank]
+            row = stats[team_index]
+            data_row = ArrayR(10)
+            data_row[0] = self.teams[team_index].get_name()
+            data_row[1] = row[0]
+            data_row[2] = row[1]
+            data_row[3] = row[2]
+            data_row[4] = row[3]
+            data_row[5] = row[4]
+            data_row[6] = row[5]
+            data_row[7] = row[6]
+            data_row[8] = row[7]
+            data_row[9] = self.last_results(replica, team_index)
+            leaderboard[rank] = data_row
+        return leaderboard
+
+    def player_stats(self, replica: int) -> ArrayR[array]:
+        """
+        Compute the player stats accumulated during a replica.
+        The result is cached and shared between calls, so callers must not modify it.
+
+        Returns:
+            ArrayR[array]: One array per player (in `self.players` order), with the entries
+                [games played, goals, assists, tackles, interceptions]
+
+        Complexity:
+            Best Case Complexity: O(1) when the replica's stats were computed before.
+            Worst Case Complexity: O(G * E + P) where G is the number of games,
+            E is MAX_EVENTS and P the number of players.
+        """
+        cached = self.player_stats_cache[replica]
+        if cached is not None:
+            return cached
+
+        stats = ArrayR(len(self.players))
+        for i in range(len(self.players)):
+            stats[i] = array('q', bytes(8 * 5))
+
+        games_per_team = array('q', bytes(8 * len(self.teams)))
+        for game in range(self.num_games):
+            games_per_team[self.home[game]] += 1
+            games_per_team[self.away[game]] += 1
+        for i in range(len(self.players)):
+            stats[i][0] = games_per_team[self.player_team[i]]
+
+        start = replica * self.num_games * self.MAX_EVENTS
+        stop = start + self.num_games * self.MAX_EVENTS
+        for column, events in enumerate((self.scorers, self.assists, self.tackles, self.interceptions), 1):
+            for i in range(start, stop):
+                if events[i] != self.NO_PLAYER:
+                    stats[events[i]][column] += 1
+        self.player_stats_cache[replica] = stats
+        return stats
+
+    def get_player_stat(self, replica: int, player: Player, statistic: PlayerStats) -> int:
+        """
+        The value a simulated season would have added to `player[statistic]` in a replica.
+
+        Raises:
+            KeyError: If the player or statistic is not tracked by the batch.
+
+        Complexity:
+            Best Case Complexity: O(1) when the replica's stats were computed before.
+            Worst Case Complexity: O(P + G * E), see `player_stats`.
+        """
+        if statistic.value not in self.stat_columns:
+            raise KeyError(statistic)
+        if player not in self.player_index:
+            raise KeyError(player.get_name())
+        return self.player_stats(replica)[self.player_index[player]][self.stat_columns[statistic.value]]
+
+
+class BatchSeasonSimulator:
+    """
+    Simulates the schedule of a season for many seeds.
+
+    Player weightings and rosters are captured once when the simulator is created; the
+    per-team cumulative weights used for scorer, assist and defensive draws are built
+    once and reused by every game of every replica.
+
+    Usage:
+    ```
+    results = BatchSeasonSimulator(season).simulate([1, 2, 3])
+    results.get_leaderboard(0)   # Same as season.get_leaderboard() after RandomGen.set_seed(1); season.simulate_season()
+    ```
+    """
+
+    def __init__(self, season: Season) -> None:
+        """
+        Snapshot the teams, players and schedule of a season.
+
+        Raises:
+            ValueError: If no team has any players.
+
+        Complexity:
+            Best/Worst Case Complexity: O(G + T*N*M) where G is the number of games, T the number of teams,
+            N the number of players per team and M the number of PlayerPositions.
+        """
+        self.teams: ArrayR[Team] = season.get_teams()
+        players: list[Player] = []
+        player_team = array('q')
+
+        # Per team: ids of all players and outfield players, in `Team.get_players` order.
+        self.squad = ArrayR(len(self.teams))
+        self.outfield = ArrayR(len(self.teams))
+        self.scorer_weights = ArrayR(len(self.teams))
+        self.assist_weights = ArrayR(len(self.teams))
+        self.defence_weights = ArrayR(len(self.teams))
+
+        for t in range(len(self.teams)):
+            squad = array('q')
+            outfield = array('q')
+            team_players = self.teams[t].get_roster() or []
+            for player in team_players:
+                squad.append(len(players))
+                if player.get_position() != PlayerPosition.GOALKEEPER:
+                    outfield.append(len(players))
+                players.append(player)
+                player_team.append(t)
+            self.squad[t] = squad
+            self.outfield[t] = outfield
+
+        if len(players) == 0:
+            raise ValueError("At least one player is required.")
+        self.players: ArrayR[Player] = ArrayR.from_list(players)
+        self.player_team = player_team
+        self.player_index: ElementTable[Player, int] = ElementTable()
+        for i in range(len(self.players)):
+            self.player_index[self.players[i]] = i
+        for t in range(len(self.teams)):
+            self.scorer_weights[t] = self.__weights(self.outfield[t], GameSimulator.SCORER_STATS)
+            self.assist_weights[t] = self.__weights(self.outfield[t], GameSimulator.ASSIST_STATS)
+            self.defence_weights[t] = self.__weights(self.squad[t], GameSimulator.DEFENCE_STATS)
+
+        # Registry IDs are handed out 1..T in registration order, so a team's index is its ID - 1
+        registry = TeamRegistry()
+        for t in range(len(self.teams)):
+            registry.register(self.teams[t])
+        self.home = array('q')
+        self.away = array('q')
+        for game in season.get_next_game():
+            self.home.append(registry.id_of(game.home_team) - 1)
+            self.away.append(registry.id_of(game.away_team) - 1)
+
+    def __weights(self, ids: array, attributes: tuple[PlayerStats, ...]) -> CumulativeWeights[int]:
+        """
+        Cumulative weight index over the player ids in `ids`.
+
+        Complexity:
+            Best/Worst Case Complexity: O(N * A) where N is len(ids) and A is len(attributes).
+        """
+        return CumulativeWeights(ids, [sum(self.players[i][attr] for attr in attributes) for i in ids])
+
+    def simulate(self, seeds: Iterable[int]) -> BatchResults:
+        """
+        Simulate one season per seed.
+
+        Note: this reseeds the shared `RandomGen` for every replica.
+
+        Complexity:
+            Best/Worst Case Complexity: O(R * G * E * log(N)) where R is the number of seeds,
+            G the number of games, E the number of events per game and N the squad size.
+        """
+        seeds = ArrayR.from_list(list(seeds))
+        if seeds is None:
+            raise ValueError("At least one seed is required.")
+        results = BatchResults(seeds, self.teams, self.players, self.player_index, self.player_team,
+                               self.home, self.away)
+        max_events = BatchResults.MAX_EVENTS
+
+        for replica in range(len(seeds)):
+            RandomGen.set_seed(seeds[replica])
+            for game in range(results.num_games):
+                cell = replica * results.num_games + game
+                self.__simulate_game(results, cell, cell * max_events, self.home[game], self.away[game])
+        return results
+
+    def __simulate_game(self, results: BatchResults, cell: int, offset: int, home: int, away: int) -> None:
+        """
+        Simulates a single game into the result buffers, in the same draw order as `GameSimulator.simulate`.
+
+        Complexity:
+            Best/Worst Case Complexity: O(E * log(N)), see `simulate`.
+        """
+        home_goals = RandomGen.random_choice(GameSimulator.GOAL_DISTRIBUTION)
+        away_goals = RandomGen.random_choice(GameSimulator.GOAL_DISTRIBUTION)
+        results.home_goals[cell] = home_goals
+        results.away_goals[cell] = away_goals
+
+        scored = 0
+        assisted = 0
+        for team, goals in ((home, home_goals), (away, away_goals)):
+            for _ in range(goals):
+                results.scorers[offset + scored] = self.scorer_weights[team].choose()
+                scored += 1
+                if RandomGen.random_chance(0.7):
+                    results.assists[offset + assisted] = self.assist_weights[team].choose()
+                    assisted += 1
+
+        for events in (results.interceptions, results.tackles):
+            for i in range(RandomGen.randint(0, GameSimulator.MAX_DEFENSIVE_EVENTS)):
+                events[offset + i] = CumulativeWeights.choose_from_both(self.defence_weights[home], self.defence_weights[away])
@@ -0,0 +1,7 @@
+"""
+Micro-benchmarks for the data structures and simulation code.
+
+Importing the package registers every suite in benchmarks.harness.SUITES.
+Run them with run_benchmarks.py from the repository root.
+"""
+from benchmarks import adt_benchmarks, build_benchmarks, churn_benchmarks, probe_benchmarks, set_benchmarks, stat_benchmarks, tail_benchmarks
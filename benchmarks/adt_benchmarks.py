@@ -0,0 +1,292 @@
+"""
+Insert, lookup, delete, iterate and memory benchmarks for every ADT in data_structures,
+plus the two assignment hash tables.
+
+Structures whose operations are linear per element (ArraySortedList, ASet, ...) are capped at
+a smaller size, so a full run finishes in minutes rather than days. Operations an ADT does not offer are simply not measured.
+"""
+from __future__ import annotations
+from typing import Callable, Union
+
+from benchmarks.harness import BenchmarkResult, int_keys, memory_footprint, string_keys, suite, time_per_operation
+from constants import PlayerStats
+from data_structures.array_sorted_list import ArraySortedList
+from data_structures.aset import ASet
+from data_structures.bset import BSet
+from data_structures.compact_hash_table import CompactLinearProbeTable
+from data_structures.cuckoo_table import CuckooTable
+from data_structures.hash_table import LinearProbeTable
+from data_structures.hash_table_separate_chaining import HashTableSeparateChaining
+from data_structures.linked_list import LinkedList
+from data_structures.linked_queue import LinkedQueue
+from data_structures.linked_stack import LinkedStack
+from data_structures.referential_array import ArrayR
+from data_structures.robin_hood_table import RobinHoodTable
+from hashy_perfection_table import HashyPerfectionTable
+from hashy_step_table import HashyStepTable
+
+# Operations that walk a linear structure per call are only timed on this many keys.
+SAMPLE_LIMIT = 1_000
+
+
+class AdtCase:
+    """
+    How to drive one ADT through the standard operations.
+
+    Attributes:
+        name (str): name used in the results
+        build (Callable[[list], object]): creates the ADT and inserts every key, timed as "insert"
+        lookup (Callable[[object, list], int]): looks keys up, returns the number of lookups
+        delete (Callable[[object, list], int]): removes keys, returns the number of removals
+        iterate (Callable[[object], int]): visits every element, returns the number visited
+        keys (Callable[[int], list]): generates the keys for a size
+        max_size (Union[int, None]): largest size measured, None for no limit
+        fixed_keys (Union[list, None]): run once with exactly these keys instead of at every size
+    """
+
+    def __init__(self, name: str, build: Callable[[list], object],
+                 lookup: Union[Callable[[object, list], int], None] = None,
+                 delete: Union[Callable[[object, list], int], None] = None,
+                 iterate: Union[Callable[[object], int], None] = None,
+                 keys: Callable[[int], list] = string_keys,
+                 max_size: Union[int, None] = None,
+                 fixed_keys: Union[list, None] = None) -> None:
+        self.name = name
+        self.build = build
+        self.lookup = lookup
+        self.delete = delete
+        self.iterate = iterate
+        self.keys = keys
+        self.max_size = max_size
+        self.fixed_keys = fixed_keys
+
+    def run(self, sizes: list[int], repeat: int) -> list[BenchmarkResult]:
+        """ Measures every supported operation at every size up to max_size. """
+        if self.fixed_keys is not None:
+            workloads = [self.fixed_keys]
+        else:
+            workloads = [self.keys(size) for size in sizes if self.max_size is None or size <= self.max_size]
+
+        results = []
+        for keys in workloads:
+            results.extend(self.run_size(keys, repeat))
+        return results
+
+    def run_size(self, keys: list, repeat: int) -> list[BenchmarkResult]:
+        """ Measures every supported operation for one set of keys. """
+        size = len(keys)
+
+        def result(operation: str, value: float, unit: str = "s/op") -> BenchmarkResult:
+            return BenchmarkResult("adt", self.name, operation, size, value, unit)
+
+        def insert() -> int:
+            self.build(keys)
+            return size
+
+        results = [result("insert", time_per_operation(insert, repeat))]
+
+        structure = self.build(keys)
+        if self.lookup is not None:
+            results.append(result("lookup", time_per_operation(lambda: self.lookup(structure, keys), repeat)))
+        if self.iterate is not None:
+            results.append(result("iterate", time_per_operation(lambda: self.iterate(structure), repeat)))
+        if self.delete is not None:
+            fresh = [structure]
+
+            def rebuild() -> None:
+                fresh[0] = self.build(keys)
+
+            results.append(result("delete", time_per_operation(lambda: self.delete(fresh[0], keys), repeat, rebuild)))
+
+        results.append(result("memory", memory_footprint(lambda: self.build(keys)), "bytes"))
+        return results
+
+
+def sample(keys: list) -> list:
+    """ The keys timed for operations that are linear per call. """
+    return keys[:SAMPLE_LIMIT]
+
+
+# --- ArrayR ---
+
+def build_array(keys: list) -> ArrayR:
+    array = ArrayR(max(1, len(keys)))
+    for i, key in enumerate(keys):
+        array[i] = key
+    return array
+
+
+def lookup_array(array: ArrayR, keys: list) -> int:
+    for i in range(len(keys)):
+        _ = array[i]
+    return len(keys)
+
+
+# --- LinkedList ---
+
+def build_linked_list(keys: list) -> LinkedList:
+    lst = LinkedList()
+    for key in keys:
+        lst.append(key)
+    return lst
+
+
+def lookup_linked_list(lst: LinkedList, keys: list) -> int:
+    indices = sample(range(0, len(keys), max(1, len(keys) // SAMPLE_LIMIT)))
+    for i in indices:
+        _ = lst[i]
+    return len(indices)
+
+
+def delete_linked_list(lst: LinkedList, keys: list) -> int:
+    for _ in range(len(keys)):
+        lst.delete_at_index(0)
+    return len(keys)
+
+
+# --- LinkedQueue / LinkedStack ---
+
+def build_queue(keys: list) -> LinkedQueue:
+    queue = LinkedQueue()
+    for key in keys:
+        queue.append(key)
+    return queue
+
+
+def serve_queue(queue: LinkedQueue, keys: list) -> int:
+    for _ in range(len(keys)):
+        queue.serve()
+    return len(keys)
+
+
+def build_stack(keys: list) -> LinkedStack:
+    stack = LinkedStack()
+    for key in keys:
+        stack.push(key)
+    return stack
+
+
+def pop_stack(stack: LinkedStack, keys: list) -> int:
+    for _ in range(len(keys)):
+        stack.pop()
+    return len(keys)
+
+
+# --- ArraySortedList ---
+
+def build_sorted_list(keys: list) -> ArraySortedList:
+    sorted_list = ArraySortedList(max(1, len(keys)))
+    for key in keys:
+        sorted_list.add(key)
+    return sorted_list
+
+
+def lookup_sorted_list(sorted_list: ArraySortedList, keys: list) -> int:
+    for key in keys:
+        sorted_list.index(key)
+    return len(keys)
+
+
+def delete_sorted_list(sorted_list: ArraySortedList, keys: list) -> int:
+    for _ in range(len(keys)):
+        sorted_list.delete_at_index(len(sorted_list) - 1)
+    return len(keys)
+
+
+def iterate_sorted_list(sorted_list: ArraySortedList) -> int:
+    for i in range(len(sorted_list)):
+        _ = sorted_list[i]
+    return len(sorted_list)
+
+
+# --- Sets ---
+
+def build_aset(keys: list) -> ASet:
+    aset = ASet(max(1, len(keys)))
+    for key in keys:
+        aset.add(key)
+    return aset
+
+
+def build_bset(keys: list) -> BSet:
+    bset = BSet()
+    for key in keys:
+        bset.add(key)
+    return bset
+
+
+def lookup_set(set_adt: Union[ASet, BSet], keys: list) -> int:
+    for key in keys:
+        _ = key in set_adt
+    return len(keys)
+
+
+def delete_set(set_adt: Union[ASet, BSet], keys: list) -> int:
+    for key in keys:
+        set_adt.remove(key)
+    return len(keys)
+
+
+# --- Hash tables ---
+
+def table_builder(table_type: type) -> Callable[[list], object]:
+    """ Returns a build function inserting every key, mapped to itself, into a new table_type. """
+    def build(keys: list) -> object:
+        table = table_type()
+        for key in keys:
+            table[key] = key
+        return table
+    return build
+
+
+def lookup_table(table, keys: list) -> int:
+    for key in keys:
+        _ = table[key]
+    return len(keys)
+
+
+def delete_table(table, keys: list) -> int:
+    for key in keys:
+        del table[key]
+    return len(keys)
+
+
+def iterate_table(table) -> int:
+    return len(table.keys())
+
+
+CASES = [
+    AdtCase("ArrayR", build_array, lookup=lookup_array),
+    AdtCase("LinkedList", build_linked_list, lookup=lookup_linked_list, delete=delete_linked_list,
+            iterate=lambda lst: sum(1 for _ in lst)),
+    AdtCase("LinkedQueue", build_queue, delete=serve_queue),
+    AdtCase("LinkedStack", build_stack, delete=pop_stack),
+    AdtCase("ArraySortedList", build_sorted_list, lookup=lookup_sorted_list, delete=delete_sorted_list,
+            iterate=iterate_sorted_list, max_size=10_000),
+    AdtCase("ASet", build_aset, lookup=lookup_set, delete=delete_set, keys=int_keys, max_size=10_000),
+    AdtCase("BSet", build_bset, lookup=lookup_set, delete=delete_set, iterate=lambda bset: sum(1 for _ in bset),
+            keys=int_keys, max_size=100_000),
+    AdtCase("LinearProbeTable", table_builder(LinearProbeTable), lookup=lookup_table, delete=delete_table,
+            iterate=iterate_table),
+    AdtCase("CompactLinearProbeTable", table_builder(CompactLinearProbeTable), lookup=lookup_table,
+            delete=delete_table, iterate=iterate_table),
+    AdtCase("RobinHoodTable", table_builder(RobinHoodTable), lookup=lookup_table, delete=delete_table,
+            iterate=iterate_table),
+    AdtCase("CuckooTable", table_builder(CuckooTable), lookup=lookup_table, delete=delete_table,
+            iterate=iterate_table),
+    AdtCase("HashTableSeparateChaining", table_builder(HashTableSeparateChaining), lookup=lookup_table,
+            delete=delete_table, iterate=iterate_table),
+    AdtCase("HashyStepTable", table_builder(HashyStepTable), lookup=lookup_table, delete=delete_table,
+            iterate=iterate_table),
+    AdtCase("HashyPerfectionTable", table_builder(HashyPerfectionTable), lookup=lookup_table,
+            delete=delete_table, iterate=iterate_table, fixed_keys=[stat.value for stat in PlayerStats]),
+]
+
+
+@suite("adt")
+def run(sizes: list[int], repeat: int) -> list[BenchmarkResult]:
+    """ Runs every ADT case. """
+    results = []
+    for case in CASES:
+        results.extend(case.run(sizes, repeat))
+    return results
@@ -0,0 +1,37 @@
+"""
+Build time of the hash tables, one insert at a time against presized bulk construction.
+
+Inserting keys one at a time into a new table grows it through every size on the way up,
+rehashing every key already in it each time. from_items picks the final size before the
+first insert, so every key is hashed and placed once.
+"""
+from __future__ import annotations
+
+from benchmarks.adt_benchmarks import table_builder
+from benchmarks.harness import BenchmarkResult, string_keys, suite, time_per_operation
+from data_structures.compact_hash_table import CompactLinearProbeTable
+from data_structures.hash_table import LinearProbeTable
+from data_structures.hash_table_separate_chaining import HashTableSeparateChaining
+from hashy_step_table import HashyStepTable
+
+TABLE_TYPES = [LinearProbeTable, HashyStepTable, HashTableSeparateChaining, CompactLinearProbeTable]
+
+
+@suite("build")
+def run(sizes: list[int], repeat: int) -> list[BenchmarkResult]:
+    """ Times building each table type from every key, per key. """
+    results = []
+    for size in sizes:
+        keys = string_keys(size)
+        items = [(key, key) for key in keys]
+        for table_type in TABLE_TYPES:
+            name = table_type.__name__
+            build = table_builder(table_type)
+            for operation, run_build in [("insert", lambda: build(keys)),
+                                         ("from_items", lambda: table_type.from_items(items, len(items)))]:
+                def timed() -> int:
+                    run_build()
+                    return size
+                value = time_per_operation(timed, repeat)
+                results.append(BenchmarkResult("build", name, operation, size, value, "s/op"))
+    return results
@@ -0,0 +1,89 @@
+"""
+Mixed insert/delete benchmarks for the linear probing tables at fixed load factors.
+
+Each table is sized so that n keys fill it to the load factor and is never resized. One
+churn operation deletes a random key and inserts a fresh one, so the load stays put
+while clusters keep being broken up and rebuilt. ReinsertDeleteTable keeps the deletion
+LinearProbeTable used before backward shifting, for comparison.
+"""
+from __future__ import annotations
+
+from benchmarks.harness import KEY_SEED, BenchmarkResult, suite, time_per_operation
+from data_structures.compact_hash_table import CompactLinearProbeTable
+from data_structures.hash_table import LinearProbeTable
+from data_structures.hash_table_separate_chaining import next_prime
+from random_gen import RandomStream
+
+LOAD_FACTORS = [0.3, 0.4, 0.5]
+
+# Largest number of keys measured, and most churn operations timed per run.
+MAX_SIZE = 100_000
+CHURN_LIMIT = 10_000
+
+
+class ReinsertDeleteTable(LinearProbeTable):
+    """ LinearProbeTable that deletes by clearing and re-probing the rest of the cluster, hashing every key again. """
+
+    def __delitem__(self, key) -> None:
+        position = self._linear_probe(key, False)
+        self.array[position] = None
+        self.count -= 1
+        position = (position + 1) % self.table_size
+        while self.array[position] is not None:
+            key2, value = self.array[position]
+            self.array[position] = None
+            newpos = self._linear_probe(key2, True)
+            self.array[newpos] = (key2, value)
+            position = (position + 1) % self.table_size
+
+
+# Table name -> table type, constructed with a single table size
+TABLE_TYPES: list[tuple[str, type]] = [
+    ("ReinsertDeleteTable", ReinsertDeleteTable),
+    ("LinearProbeTable", LinearProbeTable),
+    ("CompactLinearProbeTable", CompactLinearProbeTable),
+]
+
+
+def churn_plan(size: int, operations: int) -> tuple[list[str], list[tuple[str, str]]]:
+    """ The starting keys, and (key to delete, key to insert) pairs that keep `size` keys in the table. """
+    stream = RandomStream(KEY_SEED)
+    live = [f"key{i}" for i in range(size)]
+    plan = []
+    for step in range(operations):
+        index = stream.randint(0, size - 1)
+        fresh = f"new{step}"
+        plan.append((live[index], fresh))
+        live[index] = fresh
+    return [f"key{i}" for i in range(size)], plan
+
+
+@suite("churn")
+def run(sizes: list[int], repeat: int) -> list[BenchmarkResult]:
+    """ Times delete + insert pairs on full tables at every load factor. """
+    results = []
+    for load in LOAD_FACTORS:
+        for size in sizes:
+            if size > MAX_SIZE:
+                continue
+            keys, plan = churn_plan(size, min(size, CHURN_LIMIT))
+            table_size = next_prime(int(size / load) + 1)
+
+            for name, table_type in TABLE_TYPES:
+                table = [None]
+
+                def fill() -> None:
+                    table[0] = table_type([table_size])
+                    for key in keys:
+                        table[0][key] = key
+
+                def churn() -> int:
+                    current = table[0]
+                    for old, new in plan:
+                        del current[old]
+                        current[new] = new
+                    return len(plan)
+
+                value = time_per_operation(churn, repeat, fill)
+                results.append(BenchmarkResult("churn", f"{name}@{load}", "delete+insert", size, value, "s/op"))
+    return results
@@ -0,0 +1,171 @@
+"""
+Timing, memory measurement, result files and regression checks shared by every benchmark suite.
+"""
+from __future__ import annotations
+import csv
+import json
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Callable, Iterable, Union
+
+from random_gen import RandomStream
+
+# Suite name -> function(sizes, repeat) returning the suite's results. Filled in by the @suite decorator.
+SUITES: dict[str, Callable[[list[int], int], list[BenchmarkResult]]] = {}
+
+# Sizes every suite is run at unless told otherwise.
+DEFAULT_SIZES = [10, 100, 1_000, 10_000, 100_000, 1_000_000]
+
+# Seed for the keys fed to the structures, so every run measures the same workload.
+KEY_SEED = 1008
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    One measurement.
+
+    value is seconds per operation for timings, bytes for memory footprints and a plain
+    count (e.g. probes) otherwise. Lower is better for every unit.
+    """
+    suite: str
+    name: str
+    operation: str
+    size: int
+    value: float
+    unit: str
+
+    def key(self) -> tuple[str, str, str, int]:
+        """ Identifies the same measurement across runs. """
+        return self.suite, self.name, self.operation, self.size
+
+
+def suite(name: str):
+    """
+    Registers a benchmark suite under `name`.
+
+    Usage:
+    ```
+    @suite("adt")
+    def run(sizes: list[int], repeat: int) -> list[BenchmarkResult]: ...
+    ```
+    """
+    def register(func):
+        SUITES[name] = func
+        return func
+    return register
+
+
+def string_keys(size: int) -> list[str]:
+    """ `size` distinct string keys in a reproducible shuffled order. """
+    keys = [f"key{i}" for i in range(size)]
+    RandomStream(KEY_SEED).random_shuffle(keys)
+    return keys
+
+
+def int_keys(size: int) -> list[int]:
+    """ The integers 1..size in a reproducible shuffled order. """
+    keys = list(range(1, size + 1))
+    RandomStream(KEY_SEED).random_shuffle(keys)
+    return keys
+
+
+def time_per_operation(run: Callable[[], int], repeat: int, setup: Union[Callable[[], None], None] = None) -> float:
+    """
+    Times `run`, which returns the number of operations it performed, and returns the best seconds per operation.
+    `setup` is called untimed before every run.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        operations = run()
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed / max(1, operations))
+    return best
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """
+    Returns the value below which `fraction` (0..1) of the values fall, by the nearest rank.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def memory_footprint(build: Callable[[], object]) -> int:
+    """
+    Returns the bytes still allocated by `build` once it has returned, while its result is alive.
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        structure = build()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del structure
+    return after - before
+
+
+def write_results(results: Iterable[BenchmarkResult], path: str) -> None:
+    """ Writes results as JSON, or as CSV when the path ends in .csv. """
+    rows = [asdict(result) for result in results]
+    if path.endswith(".csv"):
+        with open(path, "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=["suite", "name", "operation", "size", "value", "unit"])
+            writer.writeheader()
+            writer.writerows(rows)
+    else:
+        with open(path, "w") as file:
+            json.dump(rows, file, indent=2)
+
+
+def load_results(path: str) -> list[BenchmarkResult]:
+    """ Reads results written by write_results. """
+    if path.endswith(".csv"):
+        with open(path, newline="") as file:
+            rows = list(csv.DictReader(file))
+        return [BenchmarkResult(row["suite"], row["name"], row["operation"], int(row["size"]),
+                                float(row["value"]), row["unit"]) for row in rows]
+    with open(path) as file:
+        return [BenchmarkResult(**row) for row in json.load(file)]
+
+
+def find_regressions(results: Iterable[BenchmarkResult], baseline: Iterable[BenchmarkResult],
+                     threshold: float) -> list[tuple[BenchmarkResult, BenchmarkResult, float]]:
+    """
+    Compares results against a baseline run.
+
+    Returns:
+        list[tuple[BenchmarkResult, BenchmarkResult, float]]: (result, baseline result, relative change)
+        for every measurement that got worse by more than `threshold` (0.2 is 20% slower or larger).
+    """
+    previous = {}
+    for result in baseline:
+        previous[result.key()] = result
+
+    regressions = []
+    for result in results:
+        old = previous.get(result.key())
+        if old is None or old.value <= 0:
+            continue
+        change = (result.value - old.value) / old.value
+        if change > threshold:
+            regressions.append((result, old, change))
+    return regressions
+
+
+def format_result(result: BenchmarkResult) -> str:
+    """ One aligned line for the console report. """
+    if result.unit == "bytes":
+        value = f"{result.value / 1024:12.1f} KiB"
+    elif result.unit != "s/op":
+        value = f"{result.value:12.2f} {result.unit}"
+    else:
+        value = f"{result.value * 1e9:12.1f} ns/op"
+    return f"{result.suite:<8} {result.name:<28} {result.operation:<10} {result.size:>9}  {value}"
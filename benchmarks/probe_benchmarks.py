@@ -0,0 +1,72 @@
+"""
+Probe length distributions of LinearProbeTable and RobinHoodTable at matched memory.
+
+For each size n and load factor, both tables get the same single table size, so they hold the
+same n keys in the same number of slots and neither resizes. Every key is looked up (hits),
+as are n keys that are not in the table (misses), recording how many slots each lookup
+inspects and how long it takes.
+"""
+from __future__ import annotations
+
+from benchmarks.harness import BenchmarkResult, memory_footprint, percentile, string_keys, suite, time_per_operation
+from data_structures.hash_table import LinearProbeTable
+from data_structures.hash_table_separate_chaining import next_prime
+from data_structures.robin_hood_table import RobinHoodTable
+
+LOAD_FACTORS = [0.5, 0.7, 0.85]
+
+# Probing every key of a table is slow in pure Python, so sizes are capped here.
+MAX_SIZE = 100_000
+
+# Table name -> function(table size) creating an empty table that never grows
+TABLE_TYPES = [
+    ("LinearProbeTable", lambda table_size: LinearProbeTable([table_size])),
+    ("RobinHoodTable", lambda table_size: RobinHoodTable([table_size], max_load_factor=1.0)),
+]
+
+
+@suite("probes")
+def run(sizes: list[int], repeat: int) -> list[BenchmarkResult]:
+    """ Measures hit and miss probe lengths and lookup times at every size and load factor. """
+    results = []
+    for load in LOAD_FACTORS:
+        for size in sizes:
+            if size > MAX_SIZE:
+                continue
+            keys = string_keys(size)
+            misses = [f"miss{i}" for i in range(size)]
+            table_size = next_prime(int(size / load) + 1)
+
+            for name, create in TABLE_TYPES:
+                label = f"{name}@{load}"
+
+                def result(operation: str, value: float, unit: str) -> BenchmarkResult:
+                    return BenchmarkResult("probes", label, operation, size, value, unit)
+
+                def build() -> object:
+                    table = create(table_size)
+                    for key in keys:
+                        table[key] = key
+                    return table
+
+                table = build()
+                for operation, lookups in [("hit", keys), ("miss", misses)]:
+                    lengths = [table.probe_length(key) for key in lookups]
+                    results.append(result(f"{operation} probes mean", sum(lengths) / len(lengths), "probes"))
+                    results.append(result(f"{operation} probes p99", percentile(lengths, 0.99), "probes"))
+                    results.append(result(f"{operation} probes max", max(lengths), "probes"))
+
+                def hit() -> int:
+                    for key in keys:
+                        _ = table[key]
+                    return size
+
+                def miss() -> int:
+                    for key in misses:
+                        _ = key in table
+                    return size
+
+                results.append(result("hit lookup", time_per_operation(hit, repeat), "s/op"))
+                results.append(result("miss lookup", time_per_operation(miss, repeat), "s/op"))
+                results.append(result("memory", memory_footprint(build), "bytes"))
+    return results
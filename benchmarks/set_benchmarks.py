@@ -0,0 +1,90 @@
+"""
+Set algebra benchmarks across densities.
+
+For each size n and density d, two sets of n random elements are drawn from 1..n/d and
+each Set implementation is timed building them, testing membership, and computing their
+union, intersection and difference. Memory is the footprint of one built set.
+"""
+from __future__ import annotations
+from typing import Callable
+
+from benchmarks.harness import KEY_SEED, BenchmarkResult, memory_footprint, suite, time_per_operation
+from data_structures.aset import ASet
+from data_structures.bset import BSet
+from data_structures.hash_set import HashSet
+from data_structures.roaring_set import RoaringSet
+from data_structures.sorted_aset import SortedASet
+from random_gen import RandomStream
+
+# Fraction of the element range that is in each set.
+DENSITIES = [0.0001, 0.01, 0.5]
+
+# Set algebra cost grows with n (and, for BSet, with n/d), so sizes are capped here.
+MAX_SIZE = 100_000
+
+# ASet algebra is O(n*m), so it is only measured on small sets.
+ASET_MAX_SIZE = 1_000
+
+
+def random_elements(size: int, density: float, seed: int) -> list[int]:
+    """ `size` distinct elements drawn from 1..size/density. """
+    universe = max(size, int(size / density))
+    stream = RandomStream(seed)
+    elements = set()
+    while len(elements) < size:
+        elements.add(stream.randint(1, universe))
+    return list(elements)
+
+
+def build_aset(items: list[int]) -> ASet:
+    aset = ASet(max(1, len(items)))
+    for item in items:
+        aset.add(item)
+    return aset
+
+
+# Set type name -> (build from a list of items, largest size measured)
+SET_TYPES: list[tuple[str, Callable[[list[int]], object], int]] = [
+    ("ASet", build_aset, ASET_MAX_SIZE),
+    ("BSet", BSet.from_iterable, MAX_SIZE),
+    ("RoaringSet", RoaringSet.from_iterable, MAX_SIZE),
+    ("SortedASet", SortedASet.from_iterable, MAX_SIZE),
+    ("HashSet", HashSet.from_iterable, MAX_SIZE),
+]
+
+
+@suite("sets")
+def run(sizes: list[int], repeat: int) -> list[BenchmarkResult]:
+    """ Times every set implementation at every size and density. """
+    results = []
+    for density in DENSITIES:
+        for size in sizes:
+            if size > MAX_SIZE:
+                continue
+            first_items = random_elements(size, density, KEY_SEED)
+            second_items = random_elements(size, density, KEY_SEED + 1)
+            probes = second_items[:1000]
+
+            for name, build, max_size in SET_TYPES:
+                if size > max_size:
+                    continue
+                label = f"{name}@{density}"
+
+                def result(operation: str, value: float, unit: str = "s/op") -> BenchmarkResult:
+                    return BenchmarkResult("sets", label, operation, size, value, unit)
+
+                first = build(first_items)
+                second = build(second_items)
+
+                def membership() -> int:
+                    for item in probes:
+                        _ = item in first
+                    return len(probes)
+
+                results.append(result("build", time_per_operation(lambda: (build(first_items), size)[1], repeat)))
+                results.append(result("contains", time_per_operation(membership, repeat)))
+                results.append(result("union", time_per_operation(lambda: (first.union(second), 1)[1], repeat)))
+                results.append(result("intersect", time_per_operation(lambda: (first.intersection(second), 1)[1], repeat)))
+                results.append(result("difference", time_per_operation(lambda: (first.difference(second), 1)[1], repeat)))
+                results.append(result("memory", memory_footprint(lambda: build(first_items)), "bytes"))
+    return results
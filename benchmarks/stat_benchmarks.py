@@ -0,0 +1,79 @@
+"""
+Per-update cost of the Player and Team stat storage.
+
+Compares the string keyed tables the stats used to live in (HashyPerfectionTable for
+players, HashyStepTable for teams) with PerfectHashTable and StatVector, and times the full Player/Team
+__setitem__ path on top of it. Each update is one read and one write, like `stats[stat] += 1`.
+"""
+from __future__ import annotations
+from enum import Enum
+from typing import Callable
+
+from benchmarks.harness import BenchmarkResult, suite, time_per_operation
+from constants import PlayerPosition, PlayerStats, TeamStats
+from data_structures.perfect_hash_table import PerfectHashTable
+from data_structures.referential_array import ArrayR
+from hashy_perfection_table import HashyPerfectionTable
+from hashy_step_table import HashyStepTable
+from player import Player
+from stat_vector import StatVector
+from team import Team
+
+# Updates per measurement are capped here, the cost per update does not depend on the count.
+MAX_UPDATES = 100_000
+
+# Team stats updated in the benchmarks; LAST_FIVE_RESULTS is not an integer stat.
+TEAM_STATS = [stat for stat in TeamStats if stat != TeamStats.LAST_FIVE_RESULTS]
+
+
+def string_table_updates(table, stats: list[Enum]) -> Callable[[int], int]:
+    """ Updates `table` keyed by each stat's value, as Player/Team did before StatVector. """
+    for stat in stats:
+        table[stat.value] = 0
+
+    def run(count: int) -> int:
+        for i in range(count):
+            key = stats[i % len(stats)].value
+            table[key] = table[key] + 1
+        return count
+    return run
+
+
+def indexed_updates(target, stats: list[Enum]) -> Callable[[int], int]:
+    """ Updates `target` keyed by the stat members themselves. """
+    def run(count: int) -> int:
+        for i in range(count):
+            stat = stats[i % len(stats)]
+            target[stat] = target[stat] + 1
+        return count
+    return run
+
+
+def team_update_sequence() -> list[TeamStats]:
+    """ The stats Season._apply_result updates for one side of a game. """
+    return [TeamStats.WINS, TeamStats.GOALS_FOR, TeamStats.GOALS_AGAINST]
+
+
+@suite("stats")
+def run(sizes: list[int], repeat: int) -> list[BenchmarkResult]:
+    """ Times one stat update for each storage, at each number of updates. """
+    player_stats = list(PlayerStats)
+    player = Player("Benchmark", PlayerPosition.STRIKER, 20)
+    cases = [
+        ("Player/HashyPerfectionTable", string_table_updates(HashyPerfectionTable(), player_stats)),
+        ("Player/PerfectHashTable", string_table_updates(PerfectHashTable(PlayerStats), player_stats)),
+        ("Player/StatVector", indexed_updates(StatVector(PlayerStats), player_stats)),
+        ("Player.__setitem__", indexed_updates(player, player_stats)),
+        ("Team/HashyStepTable", string_table_updates(HashyStepTable(), TEAM_STATS)),
+        ("Team/PerfectHashTable", string_table_updates(PerfectHashTable(TeamStats), TEAM_STATS)),
+        ("Team/StatVector", indexed_updates(StatVector(TeamStats), TEAM_STATS)),
+        ("Team.__setitem__", indexed_updates(Team("Benchmark", ArrayR.from_list([player])), team_update_sequence())),
+    ]
+
+    results = []
+    for size in sizes:
+        count = min(size, MAX_UPDATES)
+        for name, updates in cases:
+            seconds = time_per_operation(lambda: updates(count), repeat)
+            results.append(BenchmarkResult("stats", name, "update", count, seconds, "s/op"))
+    return results
@@ -0,0 +1,48 @@
+"""
+Lookup tail latency of the hash tables.
+
+Every key of a table is looked up and each lookup is timed on its own, `repeat` times over,
+so the suite reports the distribution of single lookups rather than an average over many.
+The p99 and p99.9 of that distribution are what a read-heavy caller waits for on its slow lookups.
+"""
+from __future__ import annotations
+import time
+
+from benchmarks.adt_benchmarks import table_builder
+from benchmarks.harness import BenchmarkResult, percentile, string_keys, suite
+from data_structures.cuckoo_table import CuckooTable
+from data_structures.hash_table import LinearProbeTable
+from data_structures.hash_table_separate_chaining import HashTableSeparateChaining
+from data_structures.robin_hood_table import RobinHoodTable
+from hashy_step_table import HashyStepTable
+
+# Timing every lookup separately is slow in pure Python, so sizes are capped here.
+MAX_SIZE = 100_000
+
+TABLE_TYPES = [LinearProbeTable, HashyStepTable, HashTableSeparateChaining, RobinHoodTable, CuckooTable]
+
+
+@suite("tail")
+def run(sizes: list[int], repeat: int) -> list[BenchmarkResult]:
+    """ Times single lookups of every key in every table type. """
+    results = []
+    clock = time.perf_counter_ns
+    for size in sizes:
+        if size > MAX_SIZE:
+            continue
+        keys = string_keys(size)
+        for table_type in TABLE_TYPES:
+            table = table_builder(table_type)(keys)
+            timings = []
+            for _ in range(repeat):
+                for key in keys:
+                    start = clock()
+                    _ = table[key]
+                    timings.append(clock() - start)
+
+            name = table_type.__name__
+            for operation, value in [("lookup mean", sum(timings) / len(timings)),
+                                     ("lookup p99", percentile(timings, 0.99)),
+                                     ("lookup p99.9", percentile(timings, 0.999))]:
+                results.append(BenchmarkResult("tail", name, operation, size, value * 1e-9, "s/op"))
+    return results
@@ -0,0 +1,118 @@
+""" Bloom filter
+
+A compact, probabilistic record of a set of keys. It can answer "definitely not added",
+which lets a hash table turn away most absent keys before it starts probing.
+"""
+from __future__ import annotations
+
+import math
+from typing import Generic, TypeVar
+
+from data_structures.hashing import mix64
+
+K = TypeVar('K')
+
+
+class BloomFilter(Generic[K]):
+    """
+    Bloom filter over string keys.
+
+    Each key sets hash_count bits of a bit array, chosen by double hashing one 64 bit hash of the key.
+    A key whose bits are not all set was never added. A key whose bits are all set was probably
+    added, or is a false positive, at a rate of about false_positive_rate while at most capacity
+    keys have been added. Keys cannot be removed: a table using the filter rebuilds it from its
+    live keys instead.
+
+    Usage:
+    ```
+    bloom = BloomFilter(100)
+    bloom.add("Goals")
+    "Goals" in bloom        # True
+    "Assists" in bloom      # False, with probability about 0.99
+    ```
+
+    Attributes:
+        bits (bytearray): the bit array, bit i is bits[i // 8] >> (i % 8) & 1
+        bit_count (int): number of bits
+        hash_count (int): number of bits set per key
+        count (int): number of keys added since the filter was created or cleared
+    """
+
+    DEFAULT_FALSE_POSITIVE_RATE = 0.01
+
+    HASH_BASE = 31
+    HASH_MASK = (1 << 64) - 1
+
+    def __init__(self, capacity: int, false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE) -> None:
+        """
+        Sizes the filter for capacity keys at the given false positive rate.
+
+        :complexity: O(B) where B is the number of bits
+        :raises ValueError: if the false positive rate is not strictly between 0 and 1.
+        """
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("The false positive rate should be between 0 and 1")
+        capacity = max(1, capacity)
+        self.bit_count = max(8, math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.bit_count / capacity * math.log(2)))
+        self.bits = bytearray((self.bit_count + 7) // 8)
+        self.count = 0
+
+    def hash(self, key: K) -> int:
+        """
+        Hash a key into a 64 bit integer, mixed so that every bit depends on every character.
+
+        :complexity: O(len(key))
+        """
+        value = 0
+        for char in key:
+            value = (value * self.HASH_BASE + ord(char)) & self.HASH_MASK
+        return mix64(value)
+
+    def __len__(self) -> int:
+        """ Returns the number of keys added. """
+        return self.count
+
+    def add(self, key: K) -> None:
+        """
+        Records a key.
+
+        :complexity: O(len(key) + hash_count)
+        """
+        key_hash = self.hash(key)
+        # Double hashing: bit i of the key is first + i * step
+        first, step = key_hash & 0xFFFFFFFF, (key_hash >> 32) | 1
+        for i in range(self.hash_count):
+            bit = (first + i * step) % self.bit_count
+            self.bits[bit >> 3] |= 1 << (bit & 7)
+        self.count += 1
+
+    def __contains__(self, key: K) -> bool:
+        """
+        False if the key was definitely never added, True if it probably was.
+
+        :complexity best: O(len(key)) the first bit is not set
+        :complexity worst: O(len(key) + hash_count)
+        """
+        key_hash = self.hash(key)
+        first, step = key_hash & 0xFFFFFFFF, (key_hash >> 32) | 1
+        for i in range(self.hash_count):
+            bit = (first + i * step) % self.bit_count
+            if not self.bits[bit >> 3] >> (bit & 7) & 1:
+                return False
+        return True
+
+    def clear(self) -> None:
+        """
+        Forget every key.
+
+        :complexity: O(B) where B is the number of bits
+        """
+        self.bits = bytearray(len(self.bits))
+        self.count = 0
+
+    def __str__(self) -> str:
+        return f"BloomFilter({self.count} keys, {self.bit_count} bits, {self.hash_count} hashes)"
+
+    def __repr__(self) -> str:
+        return str(self)
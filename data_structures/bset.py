@@ -3,6 +3,10 @@
 """
 
 from __future__ import annotations
+import sys
+from array import array
+from typing import Iterable, Iterator
+
 from data_structures.set_adt import Set
 
 
@@ -15,11 +19,45 @@ class BSet(Set[int]):
         elems (int): bitwise representation of the set
     """
 
+    WORD_BITS = 64
+
     def __init__(self, dummy_capacity: int = 1) -> None:
         """ Initialization. """
         Set.__init__(self)
         self.elems = 0
 
+    @classmethod
+    def from_iterable(cls, items: Iterable[int]) -> BSet:
+        """ Creates a set holding the given items.
+        The bits are set in a byte buffer that is converted to an integer once,
+        instead of building a new integer for every item.
+        :complexity: O(n + m/8) where n is the number of items and m the largest item
+        :raises TypeError: if an item is not integer or if not positive.
+        """
+        items = list(items)
+        res = cls()
+        if not items:
+            return res
+        for item in items:
+            if not isinstance(item, int) or item <= 0:
+                raise TypeError('Set elements should be integers')
+        buffer = bytearray((max(items) + 7) // 8)
+        for item in items:
+            buffer[(item - 1) >> 3] |= 1 << ((item - 1) & 7)
+        res.elems = int.from_bytes(buffer, 'little')
+        return res
+
+    def _words(self) -> array:
+        """ The set as 64 bit words, least significant first.
+        :complexity: O(m/64) where m is the largest element
+        """
+        num_words = (self.elems.bit_length() + BSet.WORD_BITS - 1) // BSet.WORD_BITS
+        words = array('Q')
+        words.frombytes(self.elems.to_bytes(8 * num_words, 'little'))
+        if sys.byteorder == 'big':
+            words.byteswap()
+        return words
+
     def clear(self) -> None:
         """ Makes the set empty. """
         self.elems = 0
@@ -38,14 +76,51 @@ class BSet(Set[int]):
 
     def __len__(self) -> int:
         """
-        Size computation. The most expensive operation.
-        Use int.bit_length(your_integer) to calculate the bit length.
+        Size computation, a population count of the bits.
+        :complexity: O(m/w) where m is the largest element and w the machine word size
         """
-        res = 0
-        for item in range(1, int.bit_length(self.elems) + 1):
-            if item in self:
-                res += 1
-        return res
+        return self.elems.bit_count()
+
+    def __iter__(self) -> Iterator[int]:
+        """ Iterates over the elements in increasing order.
+        Empty words are skipped, and within a word each step jumps straight
+        to the lowest set bit.
+        :complexity: O(m/64 + n) where m is the largest element and n the number of elements
+        """
+        for index, word in enumerate(self._words()):
+            base = index * BSet.WORD_BITS
+            while word:
+                lowest = word & -word
+                yield base + lowest.bit_length()
+                word ^= lowest
+
+    def rank(self, item: int) -> int:
+        """ Returns the number of elements less than or equal to item.
+        :complexity: O(m/w) where m is the largest element and w the machine word size
+        :raises TypeError: if the item is not integer or if not positive.
+        """
+        if not isinstance(item, int) or item <= 0:
+            raise TypeError('Set elements should be integers')
+        return (self.elems & ((1 << item) - 1)).bit_count()
+
+    def select(self, k: int) -> int:
+        """ Returns the k-th smallest element, counting from 1, so select(rank(x)) == x for x in the set.
+        :complexity: O(m/64) where m is the largest element
+        :raises IndexError: if k is not between 1 and len(self).
+        """
+        if k < 1:
+            raise IndexError(k)
+        remaining = k
+        for index, word in enumerate(self._words()):
+            count = word.bit_count()
+            if remaining > count:
+                remaining -= count
+                continue
+            # Drop the lowest remaining - 1 set bits of this word
+            for _ in range(remaining - 1):
+                word &= word - 1
+            return index * BSet.WORD_BITS + (word & -word).bit_length()
+        raise IndexError(k)
 
     def add(self, item: int) -> None:
         """ Adds an element to the set.
@@ -99,17 +174,27 @@ class BSet(Set[int]):
     def __or__(self, other: BSet):
         return self.union(other)
 
+    def __sub__(self, other: BSet):
+        return self.difference(other)
+
+    def __ior__(self, other: BSet) -> BSet:
+        """ In-place union, no new set is created. """
+        self.elems |= other.elems
+        return self
+
+    def __iand__(self, other: BSet) -> BSet:
+        """ In-place intersection, no new set is created. """
+        self.elems &= other.elems
+        return self
+
+    def __isub__(self, other: BSet) -> BSet:
+        """ In-place difference, no new set is created. """
+        self.elems &= ~other.elems
+        return self
+
     def __str__(self):
         """ Construct a nice string representation. """
-        bit_elems = self.elems
-        out_elems = []
-        current = 0
-        while bit_elems:
-            if bit_elems & (1 << current):
-                out_elems.append(str(current+1))
-                bit_elems &= ~(1 << current)
-            current += 1
-        return '{' + ', '.join(out_elems) + '}'
+        return '{' + ', '.join(str(item) for item in self) + '}'
 
 
 if __name__ == '__main__':
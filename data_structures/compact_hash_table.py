@@ -0,0 +1,338 @@
+""" Hash Table ADT
+
+Defines a compact Hash Table using Linear Probing for conflict resolution.
+Keys, values and full key hashes are stored in parallel arrays instead of as
+(key, value) tuples, so updates reuse their slot without allocating and resizing
+never hashes a key again.
+"""
+from __future__ import annotations
+
+from array import array
+from typing import Generic, Iterable, TypeVar, Union
+
+from data_structures.hash_table import FullError, LinearProbeTable
+from data_structures.referential_array import ArrayR
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+
+class CompactLinearProbeTable(Generic[K, V]):
+    """
+    Compact Linear Probe Table.
+
+    Has the same public API and growth sequence as LinearProbeTable, so it can be used wherever a
+    LinearProbeTable is. Unlike LinearProbeTable, the hash of a key does not depend on the table size:
+    `hash` returns a 64 bit hash which is cached, and the home position is that hash modulo the table size.
+
+    Type Arguments:
+        - K:    Key Type. In most cases should be string.
+                Otherwise `hash` should be overwritten.
+        - V:    Value Type.
+
+    Attributes:
+        key_array (ArrayR[K]): the keys, None marks an empty slot
+        value_array (ArrayR[V]): the value stored with the key in the same slot
+        hash_array (array[int]): the cached hash of the key in the same slot
+
+    Unless stated otherwise, all methods have O(1) complexity.
+    """
+
+    TABLE_SIZES = LinearProbeTable.TABLE_SIZES
+
+    HASH_BASE = 31
+    HASH_MASK = (1 << 64) - 1
+
+    # The table grows once more than this fraction of its slots are taken, as LinearProbeTable does.
+    max_load_factor = 0.5
+
+    def __init__(self, sizes=None) -> None:
+        """
+        Initialise the Hash Table.
+        """
+        if sizes is not None:
+            self.TABLE_SIZES = sizes
+        self.size_index = 0
+        self.count = 0
+        self._allocate(self.TABLE_SIZES[self.size_index])
+
+    @classmethod
+    def from_items(cls, items: Iterable[tuple[K, V]], expected_size: Union[int, None] = None,
+                   sizes=None) -> CompactLinearProbeTable[K, V]:
+        """
+        Creates a table holding the given (key, value) pairs, see update_many.
+
+        :complexity: See update_many.
+        """
+        table = cls(sizes)
+        table.update_many(items, expected_size)
+        return table
+
+    def update_many(self, items: Iterable[tuple[K, V]], expected_size: Union[int, None] = None) -> None:
+        """
+        Set every (key, value) pair of items, later pairs overwriting earlier ones with the same key.
+        The table first grows, at most once, to the smallest size that holds len(self) + expected_size
+        keys, so the pairs go in without a rehash. expected_size defaults to the number of items.
+
+        :complexity best: O(T + N*hash(K)) No probing.
+        :complexity worst: O(T + N*hash(K) + N^2*comp(K)) Lots of probing.
+        Where T is the table size picked and N is len(self) + the number of items
+        """
+        if expected_size is None:
+            items = list(items)
+            expected_size = len(items)
+        self._reserve(len(self) + expected_size)
+        for key, value in items:
+            self[key] = value
+
+    def _reserve(self, total: int) -> None:
+        """
+        Grow to the smallest table size that holds total keys without a rehash.
+
+        :complexity: See _resize, O(1) when the table is already large enough.
+        """
+        size_index = self.size_index
+        while size_index + 1 < len(self.TABLE_SIZES) and total > self.TABLE_SIZES[size_index] * self.max_load_factor:
+            size_index += 1
+        if size_index > self.size_index:
+            self._resize(size_index)
+
+    def _allocate(self, size: int) -> None:
+        """
+        Replace the storage with empty arrays of the given size.
+
+        :complexity: O(size)
+        """
+        self.key_array: ArrayR[Union[K, None]] = ArrayR(size)
+        self.value_array: ArrayR[V] = ArrayR(size)
+        self.hash_array = array('Q', bytes(8 * size))
+
+    def hash(self, key: K) -> int:
+        """
+        Hash a key into a 64 bit integer. The home position is this hash modulo the table size.
+
+        :complexity: O(len(key))
+        """
+        value = 0
+        for char in key:
+            value = (value * self.HASH_BASE + ord(char)) & self.HASH_MASK
+        return value
+
+    @property
+    def table_size(self) -> int:
+        return len(self.key_array)
+
+    def __len__(self) -> int:
+        """
+        Returns number of elements in the hash table
+        """
+        return self.count
+
+    def _linear_probe(self, key: K, key_hash: int, is_insert: bool) -> int:
+        """
+        Find the correct position for this key in the hash table using linear probing.
+        Cached hashes are compared before keys, so most collisions never compare keys.
+
+        :complexity best: O(1) first position is empty
+        :complexity worst: O(N*comp(K)) when we've searched the entire table
+                        where N is the tablesize
+        :raises KeyError: When the key is not in the table, but is_insert is False.
+        :raises FullError: When a table is full and cannot be inserted.
+        """
+        position = key_hash % self.table_size
+
+        for _ in range(self.table_size):
+            if self.key_array[position] is None:
+                # Empty spot. Am I upserting or retrieving?
+                if is_insert:
+                    return position
+                else:
+                    raise KeyError(key)
+            elif self.hash_array[position] == key_hash and self.key_array[position] == key:
+                return position
+            else:
+                # Taken by something else. Time to linear probe.
+                position = (position + 1) % self.table_size
+
+        if is_insert:
+            raise FullError("Table is full!")
+        else:
+            raise KeyError(key)
+
+    def _place(self, key: K, data: V, key_hash: int) -> None:
+        """
+        Store a key that is known not to be in the table at the first empty slot from its home position.
+
+        :complexity best: O(1) home position is empty
+        :complexity worst: O(N) where N is the table size
+        """
+        position = key_hash % self.table_size
+        while self.key_array[position] is not None:
+            position = (position + 1) % self.table_size
+        self.key_array[position] = key
+        self.value_array[position] = data
+        self.hash_array[position] = key_hash
+
+    def probe_index(self, key: K) -> int:
+        """
+        Returns the position of the key in the table, or -1 if it is not there. Never raises.
+
+        :complexity: O(hash(key)) plus linear probe.
+        """
+        try:
+            return self._linear_probe(key, self.hash(key), False)
+        except KeyError:
+            return -1
+
+    def get(self, key: K, default: Union[V, None] = None) -> Union[V, None]:
+        """
+        Returns the value of the key, or default if it is not in the table.
+
+        :complexity: See probe_index.
+        """
+        position = self.probe_index(key)
+        if position < 0:
+            return default
+        return self.value_array[position]
+
+    def keys(self) -> ArrayR[K]:
+        """
+        Returns all keys in the hash table.
+
+        :complexity: O(N) where N is self.table_size.
+        """
+        res = ArrayR(self.count)
+        i = 0
+        for x in range(self.table_size):
+            if self.key_array[x] is not None:
+                res[i] = self.key_array[x]
+                i += 1
+        return res
+
+    def values(self) -> ArrayR[V]:
+        """
+        Returns all values in the hash table.
+
+        :complexity: O(N) where N is self.table_size.
+        """
+        res = ArrayR(self.count)
+        i = 0
+        for x in range(self.table_size):
+            if self.key_array[x] is not None:
+                res[i] = self.value_array[x]
+                i += 1
+        return res
+
+    def __contains__(self, key: K) -> bool:
+        """
+        Checks to see if the given key is in the Hash Table
+
+        :complexity: See probe_index.
+        """
+        return self.probe_index(key) >= 0
+
+    def __getitem__(self, key: K) -> V:
+        """
+        Get the value at a certain key
+
+        :complexity: O(hash(key)) plus linear probe.
+        :raises KeyError: when the key doesn't exist.
+        """
+        position = self._linear_probe(key, self.hash(key), False)
+        return self.value_array[position]
+
+    def __setitem__(self, key: K, data: V) -> None:
+        """
+        Set an (key, value) pair in our hash table.
+        Updating an existing key only overwrites its value slot.
+
+        :complexity: O(hash(key)) plus linear probe.
+        :raises FullError: when the table cannot be resized further.
+        """
+        key_hash = self.hash(key)
+        position = self._linear_probe(key, key_hash, True)
+
+        if self.key_array[position] is None:
+            self.key_array[position] = key
+            self.hash_array[position] = key_hash
+            self.count += 1
+
+        self.value_array[position] = data
+
+        if len(self) > self.table_size * self.max_load_factor:
+            self._rehash()
+
+    def __delitem__(self, key: K) -> None:
+        """
+        Deletes a (key, value) pair in our hash table.
+        Backward-shift deletion: each later entry of the cluster moves back into the hole
+        if the hole lies between its home position, read from its cached hash, and its slot.
+
+        :complexity best: O(hash(key)) deleting item is not probed and in correct spot.
+        :complexity worst: O(hash(key) + N) deleting item is midway through large chain.
+        :raises KeyError: when the key doesn't exist.
+        """
+        hole = self._linear_probe(key, self.hash(key), False)
+        # Remove the element
+        self.key_array[hole] = None
+        self.value_array[hole] = None
+        self.count -= 1
+        # Start moving over the cluster
+        size = self.table_size
+        position = (hole + 1) % size
+        while self.key_array[position] is not None:
+            key_hash = self.hash_array[position]
+            # The entry may fill the hole only if it would still be reached probing from its home
+            if (position - key_hash % size) % size >= (position - hole) % size:
+                self.key_array[hole] = self.key_array[position]
+                self.value_array[hole] = self.value_array[position]
+                self.hash_array[hole] = key_hash
+                self.key_array[position] = None
+                self.value_array[position] = None
+                hole = position
+            position = (position + 1) % size
+
+    def is_empty(self) -> bool:
+        return self.count == 0
+
+    def is_full(self) -> bool:
+        return self.count == self.table_size
+
+    def _rehash(self) -> None:
+        """
+        Need to resize table and reinsert all values.
+        Entries are placed from their cached hashes, so no key is hashed or compared.
+
+        :complexity best: O(N) No probing.
+        :complexity worst: O(N^2) Lots of probing.
+        Where N is len(self)
+        """
+        if self.size_index + 1 == len(self.TABLE_SIZES):
+            # Cannot be resized further.
+            return
+        self._resize(self.size_index + 1)
+
+    def _resize(self, size_index: int) -> None:
+        """
+        Move to table size TABLE_SIZES[size_index], placing every entry from its cached hash.
+
+        :complexity: See _rehash.
+        """
+        self.size_index = size_index
+        old_keys, old_values, old_hashes = self.key_array, self.value_array, self.hash_array
+        self._allocate(self.TABLE_SIZES[self.size_index])
+        for x in range(len(old_keys)):
+            if old_keys[x] is not None:
+                self._place(old_keys[x], old_values[x], old_hashes[x])
+
+    def __str__(self) -> str:
+        """
+        Returns all they key/value pairs in our hash table (no particular
+        order).
+        :complexity: O(N * (str(key) + str(value))) where N is the table size
+        """
+        result = ""
+        for x in range(self.table_size):
+            if self.key_array[x] is not None:
+                result += "(" + str(self.key_array[x]) + "," + str(self.value_array[x]) + ")\n"
+        return result
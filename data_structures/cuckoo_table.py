@@ -0,0 +1,333 @@
+""" Hash Table ADT
+
+Defines a Hash Table using two-choice cuckoo hashing, with a small stash, for conflict resolution.
+"""
+from __future__ import annotations
+
+from array import array
+from typing import Generic, TypeVar, Union
+
+from data_structures.hash_table import FullError, LinearProbeTable
+from data_structures.hashing import mix64
+from data_structures.referential_array import ArrayR
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+
+class CuckooTable(Generic[K, V]):
+    """
+    Cuckoo Table.
+
+    Has the same public API as LinearProbeTable. Every key has exactly one candidate slot in each of
+    two sub-tables, plus a stash of at most STASH_SIZE entries, so a lookup inspects at most
+    2 + STASH_SIZE slots however full or unlucky the table is. An insert that finds both of its
+    slots taken evicts one occupant, which moves to its other slot, possibly evicting another, for
+    at most MAX_KICKS moves. The entry still homeless then goes to the stash, and once the stash is
+    full the table grows and every entry is placed again from its cached hash.
+
+    Type Arguments:
+        - K:    Key Type. In most cases should be string.
+                Otherwise `hash` should be overwritten.
+        - V:    Value Type.
+
+    Attributes:
+        key_arrays (tuple[ArrayR[K], ArrayR[K]]): the keys of each sub-table, None marks an empty slot
+        value_arrays (tuple[ArrayR[V], ArrayR[V]]): the value stored with the key in the same slot
+        hash_arrays (tuple[array[int], array[int]]): the cached hash of the key in the same slot
+        stash (ArrayR[tuple[K, V, int]]): (key, value, hash) of the entries that fit in neither sub-table
+        stash_count (int): number of entries in the stash
+
+    Unless stated otherwise, all methods have O(1) complexity.
+    """
+
+    # Size of each sub-table.
+    TABLE_SIZES = LinearProbeTable.TABLE_SIZES
+
+    HASH_BASE = 31
+    HASH_MASK = (1 << 64) - 1
+
+    STASH_SIZE = 4
+    MAX_KICKS = 32
+
+    # Two-choice cuckoo hashing stops finding places for new keys a little before half load.
+    MAX_LOAD_FACTOR = 0.45
+
+    def __init__(self, sizes=None) -> None:
+        """
+        Initialise the Hash Table.
+        """
+        if sizes is not None:
+            self.TABLE_SIZES = sizes
+        self.size_index = 0
+        self.count = 0
+        self._allocate(self.TABLE_SIZES[self.size_index])
+
+    def _allocate(self, size: int) -> None:
+        """
+        Replace the storage with empty sub-tables of the given size and an empty stash.
+
+        :complexity: O(size)
+        """
+        self.key_arrays = (ArrayR(size), ArrayR(size))
+        self.value_arrays = (ArrayR(size), ArrayR(size))
+        self.hash_arrays = (array('Q', bytes(8 * size)), array('Q', bytes(8 * size)))
+        # One spare slot holds the entry that overflowed a full stash until the table grows
+        self.stash: ArrayR[Union[tuple[K, V, int], None]] = ArrayR(self.STASH_SIZE + 1)
+        self.stash_count = 0
+
+    def hash(self, key: K) -> int:
+        """
+        Hash a key into a 64 bit integer, from which both of its slots are derived.
+
+        :complexity: O(len(key))
+        """
+        value = 0
+        for char in key:
+            value = (value * self.HASH_BASE + ord(char)) & self.HASH_MASK
+        return mix64(value)
+
+    def _slot(self, key_hash: int, side: int) -> int:
+        """
+        Returns the slot of a hash in sub-table side. The two sides use the low and the high half of the hash.
+        """
+        if side == 0:
+            return (key_hash & 0xFFFFFFFF) % self.table_size
+        return (key_hash >> 32) % self.table_size
+
+    @property
+    def table_size(self) -> int:
+        """ Size of each sub-table. """
+        return len(self.key_arrays[0])
+
+    def __len__(self) -> int:
+        """
+        Returns number of elements in the hash table
+        """
+        return self.count
+
+    def _find(self, key: K, key_hash: int) -> tuple[int, int]:
+        """
+        Returns (side, position) of the key: side 0 or 1 for a sub-table, 2 for the stash.
+
+        :complexity: O(STASH_SIZE * comp(K))
+        :raises KeyError: When the key is not in the table.
+        """
+        size = self.table_size
+        # Both slots are inlined from _slot, this is the path every lookup takes
+        position = (key_hash & 0xFFFFFFFF) % size
+        if self.hash_arrays[0][position] == key_hash and self.key_arrays[0][position] == key:
+            return 0, position
+        position = (key_hash >> 32) % size
+        if self.hash_arrays[1][position] == key_hash and self.key_arrays[1][position] == key:
+            return 1, position
+        for position in range(self.stash_count):
+            if self.stash[position][2] == key_hash and self.stash[position][0] == key:
+                return 2, position
+        raise KeyError(key)
+
+    def keys(self) -> ArrayR[K]:
+        """
+        Returns all keys in the hash table.
+
+        :complexity: O(N) where N is self.table_size.
+        """
+        res = ArrayR(self.count)
+        i = 0
+        for side in range(2):
+            for x in range(self.table_size):
+                if self.key_arrays[side][x] is not None:
+                    res[i] = self.key_arrays[side][x]
+                    i += 1
+        for x in range(self.stash_count):
+            res[i] = self.stash[x][0]
+            i += 1
+        return res
+
+    def values(self) -> ArrayR[V]:
+        """
+        Returns all values in the hash table.
+
+        :complexity: O(N) where N is self.table_size.
+        """
+        res = ArrayR(self.count)
+        i = 0
+        for side in range(2):
+            for x in range(self.table_size):
+                if self.key_arrays[side][x] is not None:
+                    res[i] = self.value_arrays[side][x]
+                    i += 1
+        for x in range(self.stash_count):
+            res[i] = self.stash[x][1]
+            i += 1
+        return res
+
+    def __contains__(self, key: K) -> bool:
+        """
+        Checks to see if the given key is in the Hash Table
+
+        :complexity: O(hash(key) + STASH_SIZE * comp(K))
+        """
+        try:
+            self._find(key, self.hash(key))
+        except KeyError:
+            return False
+        else:
+            return True
+
+    def __getitem__(self, key: K) -> V:
+        """
+        Get the value at a certain key
+
+        :complexity: O(hash(key) + STASH_SIZE * comp(K))
+        :raises KeyError: when the key doesn't exist.
+        """
+        side, position = self._find(key, self.hash(key))
+        if side == 2:
+            return self.stash[position][1]
+        return self.value_arrays[side][position]
+
+    def __setitem__(self, key: K, data: V) -> None:
+        """
+        Set an (key, value) pair in our hash table.
+
+        :complexity best: O(hash(key)) the key is present or one of its slots is free
+        :complexity worst: O(hash(key) + N) where N is the number of items, when the table grows
+        :raises FullError: when the table is at its largest size and the stash is full, or when growing
+            could not place every entry. In the second case the pair is still stored, in the stash's spare slot,
+            and no further key can be added.
+        """
+        key_hash = self.hash(key)
+        try:
+            side, position = self._find(key, key_hash)
+        except KeyError:
+            can_grow = self.size_index + 1 < len(self.TABLE_SIZES)
+            if self.stash_count > self.STASH_SIZE or (not can_grow and self.stash_count == self.STASH_SIZE):
+                # The key might still find a slot, but there would be nowhere to put an entry it kicked out
+                raise FullError("Table is full!")
+            self.count += 1
+            self._place(key, data, key_hash)
+            if can_grow and self.count > 2 * self.table_size * self.MAX_LOAD_FACTOR:
+                self._rehash()
+        else:
+            if side == 2:
+                self.stash[position] = (key, data, key_hash)
+            else:
+                self.value_arrays[side][position] = data
+
+    def _place(self, key: K, data: V, key_hash: int) -> None:
+        """
+        Store a key that is known not to be in the table, growing the table if there is no room for it.
+
+        :complexity best: O(1) one of the key's slots is free
+        :complexity worst: O(N) where N is the number of items, when the table grows
+        """
+        if not self._try_place(key, data, key_hash):
+            self._rehash()
+
+    def _try_place(self, key: K, data: V, key_hash: int) -> bool:
+        """
+        Store a key that is known not to be in the table, evicting occupants along the way.
+        When no sub-table slot turns up within MAX_KICKS evictions the entry left over goes
+        to the stash. Returns False, with that entry in the stash's spare slot, if the stash was full.
+
+        :complexity best: O(1) one of the key's slots is free
+        :complexity worst: O(MAX_KICKS)
+        """
+        for side in range(2):
+            position = self._slot(key_hash, side)
+            if self.key_arrays[side][position] is None:
+                self._store(side, position, key, data, key_hash)
+                return True
+
+        side = 0
+        for _ in range(self.MAX_KICKS):
+            position = self._slot(key_hash, side)
+            evicted = (self.key_arrays[side][position], self.value_arrays[side][position],
+                       self.hash_arrays[side][position])
+            self._store(side, position, key, data, key_hash)
+            key, data, key_hash = evicted
+            # The evicted entry moves to its slot in the other sub-table
+            side = 1 - side
+            position = self._slot(key_hash, side)
+            if self.key_arrays[side][position] is None:
+                self._store(side, position, key, data, key_hash)
+                return True
+
+        self.stash[self.stash_count] = (key, data, key_hash)
+        self.stash_count += 1
+        return self.stash_count <= self.STASH_SIZE
+
+    def _store(self, side: int, position: int, key: K, data: V, key_hash: int) -> None:
+        self.key_arrays[side][position] = key
+        self.value_arrays[side][position] = data
+        self.hash_arrays[side][position] = key_hash
+
+    def __delitem__(self, key: K) -> None:
+        """
+        Deletes a (key, value) pair in our hash table.
+        Nothing else moves, the stash keeps its entries packed at the front.
+
+        :complexity: O(hash(key) + STASH_SIZE * comp(K))
+        :raises KeyError: when the key doesn't exist.
+        """
+        side, position = self._find(key, self.hash(key))
+        if side == 2:
+            self.stash_count -= 1
+            self.stash[position] = self.stash[self.stash_count]
+            self.stash[self.stash_count] = None
+        else:
+            self.key_arrays[side][position] = None
+            self.value_arrays[side][position] = None
+        self.count -= 1
+
+    def is_empty(self) -> bool:
+        return self.count == 0
+
+    def is_full(self) -> bool:
+        return self.count == 2 * self.table_size + self.STASH_SIZE
+
+    def _rehash(self) -> None:
+        """
+        Grows both sub-tables to the next size and places every entry again from its cached hash.
+        Keeps growing while some entry still cannot be placed.
+
+        :complexity best: O(N) where N is the number of items
+        :complexity worst: O(N * S) where S is the number of sizes left in TABLE_SIZES
+        :raises FullError: when the entries cannot be placed in the largest table size, leaving the table unchanged.
+        """
+        entries = []
+        for side in range(2):
+            for x in range(self.table_size):
+                if self.key_arrays[side][x] is not None:
+                    entries.append((self.key_arrays[side][x], self.value_arrays[side][x], self.hash_arrays[side][x]))
+        for x in range(self.stash_count):
+            entries.append(self.stash[x])
+
+        old_state = (self.size_index, self.key_arrays, self.value_arrays, self.hash_arrays, self.stash, self.stash_count)
+        placed = False
+        while not placed:
+            if self.size_index + 1 == len(self.TABLE_SIZES):
+                # Put everything back as it was, the spare stash slot included
+                (self.size_index, self.key_arrays, self.value_arrays, self.hash_arrays,
+                 self.stash, self.stash_count) = old_state
+                raise FullError("Table is full!")
+            self.size_index += 1
+            self._allocate(self.TABLE_SIZES[self.size_index])
+            placed = True
+            for entry_key, entry_data, entry_hash in entries:
+                if not self._try_place(entry_key, entry_data, entry_hash):
+                    placed = False
+                    break
+
+    def __str__(self) -> str:
+        """
+        Returns all they key/value pairs in our hash table (no particular
+        order).
+        :complexity: O(N * (str(key) + str(value))) where N is the table size
+        """
+        result = ""
+        keys, values = self.keys(), self.values()
+        for i in range(self.count):
+            result += "(" + str(keys[i]) + "," + str(values[i]) + ")\n"
+        return result
@@ -0,0 +1,179 @@
+"""
+    Hash table-based implementation of Set ADT.
+"""
+
+from __future__ import annotations
+from typing import Iterable, Iterator
+
+from data_structures.compact_hash_table import CompactLinearProbeTable
+from data_structures.set_adt import *
+
+
+class ElementTable(CompactLinearProbeTable[T, None]):
+    """
+    A CompactLinearProbeTable whose keys may be any hashable element, not only strings.
+
+    Strings keep the table's own polynomial hash. Other elements use Python's hash, which for
+    integers is the integer itself, so placement does not change from one run to the next.
+    """
+
+    def hash(self, key: T) -> int:
+        """
+        :complexity: O(len(key)) for strings, O(hash(key)) otherwise
+        """
+        if isinstance(key, str):
+            return CompactLinearProbeTable.hash(self, key)
+        return hash(key) & self.HASH_MASK
+
+
+class HashSet(Set[T]):
+    """Hash table-based implementation of the set ADT.
+
+    The elements are the keys of a linear probing table, so membership, add and
+    remove take expected O(1) and the set algebra is linear in the sizes of the sets.
+    Elements must be hashable. The set is not ordered.
+
+    Attributes:
+         size (int): number of elements in the set
+         table (ElementTable[T]): table whose keys are the elements
+    """
+
+    def __init__(self, capacity: int = 1) -> None:
+        """ Initialization. The table starts large enough to hold capacity elements without rehashing.
+        :complexity: O(N) where N is the starting table size
+        """
+        Set.__init__(self)
+        self.table: ElementTable[T] = ElementTable()
+        sizes = self.table.TABLE_SIZES
+        size_index = 0
+        while size_index + 1 < len(sizes) and capacity > sizes[size_index] / 2:
+            size_index += 1
+        if size_index > 0:
+            self.table.size_index = size_index
+            self.table._allocate(sizes[size_index])
+
+    @classmethod
+    def from_iterable(cls, items: Iterable[T]) -> HashSet[T]:
+        """ Creates a set holding the given items.
+        :complexity: O(n) expected, where n is the number of items
+        """
+        items = list(items)
+        res = cls(len(items))
+        for item in items:
+            res.table[item] = None
+        res.size = len(res.table)
+        return res
+
+    def __len__(self) -> int:
+        """ Returns the number of elements in the set. """
+        return self.size
+
+    def is_empty(self) -> bool:
+        """ True if the set is empty. """
+        return len(self) == 0
+
+    def clear(self) -> None:
+        """ Makes the set empty. """
+        self.table = ElementTable()
+        self.size = 0
+
+    def __contains__(self, item: T) -> bool:
+        """ True if the set contains the item.
+        :complexity: O(hash(item)) plus linear probe
+        """
+        return item in self.table
+
+    def add(self, item: T) -> None:
+        """ Adds an element to the set. Note that an element already
+        present in the set should not be added.
+        :complexity: O(hash(item)) plus linear probe
+        """
+        self.table[item] = None
+        self.size = len(self.table)
+
+    def remove(self, item: T) -> None:
+        """ Removes an element from the set.
+        :pre: the element should be present in the set
+        :complexity: O(hash(item)) plus linear probe, see CompactLinearProbeTable.__delitem__
+        :raises KeyError: if no such element is found.
+        """
+        del self.table[item]
+        self.size -= 1
+
+    def __iter__(self) -> Iterator[T]:
+        """ Iterates over the elements, in table order.
+        :complexity: O(N) where N is the table size
+        """
+        keys = self.table.key_array
+        for i in range(self.table.table_size):
+            if keys[i] is not None:
+                yield keys[i]
+
+    def _add_hashed(self, item: T, item_hash: int) -> None:
+        """ Adds an element known not to be in the set, reusing its hash from another table. """
+        self.table._place(item, None, item_hash)
+        self.table.count += 1
+        self.size += 1
+        if len(self.table) > self.table.table_size / 2:
+            self.table._rehash()
+
+    def _walk(self) -> Iterator[tuple[T, int]]:
+        """ Iterates over (element, cached hash) pairs. """
+        keys, hashes = self.table.key_array, self.table.hash_array
+        for i in range(self.table.table_size):
+            if keys[i] is not None:
+                yield keys[i], hashes[i]
+
+    def union(self, other: HashSet[T]) -> HashSet[T]:
+        """ Creates a new set equal to the union with another one,
+        i.e. the result set should contains the elements of self and other.
+        :complexity: O(n + m) expected, where n and m are the sizes of the sets
+        """
+        res = HashSet(len(self) + len(other))
+        for item, item_hash in self._walk():
+            res._add_hashed(item, item_hash)
+        for item, item_hash in other._walk():
+            if item not in self:
+                res._add_hashed(item, item_hash)
+        return res
+
+    def intersection(self, other: HashSet[T]) -> HashSet[T]:
+        """ Creates a new set equal to the intersection with another one,
+        i.e. the result set should contain the elements that are both in
+        self *and* other.
+        :complexity: O(min(n, m)) expected, walking the smaller set and probing the larger
+        """
+        small, large = (self, other) if len(self) <= len(other) else (other, self)
+        res = HashSet(len(small))
+        for item, item_hash in small._walk():
+            if item in large:
+                res._add_hashed(item, item_hash)
+        return res
+
+    def difference(self, other: HashSet[T]) -> HashSet[T]:
+        """ Creates a new set equal to the difference with another one,
+        i.e. the result set should contain the elements of self that
+        *are not* in other.
+        :complexity: O(n) expected, where n is the size of self
+        """
+        res = HashSet(len(self))
+        for item, item_hash in self._walk():
+            if item not in other:
+                res._add_hashed(item, item_hash)
+        return res
+
+    def __and__(self, other: HashSet[T]) -> HashSet[T]:
+        return self.intersection(other)
+
+    def __or__(self, other: HashSet[T]) -> HashSet[T]:
+        return self.union(other)
+
+    def __sub__(self, other: HashSet[T]) -> HashSet[T]:
+        return self.difference(other)
+
+    def __str__(self):
+        """ Magic method constructing a string representation of the list object. """
+        elems = []
+        for item in self:
+            elems.append(str(item) if type(item) != str else "'{0}'".format(item))
+        return '{' + ', '.join(elems) + '}'
@@ -7,7 +7,8 @@ __author__ = 'Jackson Goerner'
 __since__ = '07/02/2023'
 
 
-from typing import TypeVar, Generic
+from typing import Iterable, TypeVar, Generic, Union
+from data_structures.bloom_filter import BloomFilter
 from data_structures.referential_array import ArrayR
 
 K = TypeVar('K')
@@ -27,6 +28,11 @@ class LinearProbeTable(Generic[K, V]):
                 Otherwise `hash` should be overwritten.
         - V:    Value Type.
 
+    Attributes:
+        array (ArrayR[tuple[K, V]]): the (key, value) pairs, None marks an empty slot
+        bloom_filter (Union[BloomFilter, None]): when enabled, every key in the table, and some deleted ones
+        bloom_stale (int): number of deleted keys still recorded in bloom_filter
+
     Unless stated otherwise, all methods have O(1) complexity.
     """
 
@@ -35,15 +41,59 @@ class LinearProbeTable(Generic[K, V]):
 
     HASH_BASE = 31
 
-    def __init__(self, sizes=None) -> None:
+    def __init__(self, sizes=None, bloom_filter: bool = False) -> None:
         """
         Initialise the Hash Table.
+        With bloom_filter, lookups of absent keys are mostly turned away by a BloomFilter before probing.
         """
         if sizes is not None:
             self.TABLE_SIZES = sizes
         self.size_index = 0
         self.array:ArrayR[tuple[K, V]] = ArrayR(self.TABLE_SIZES[self.size_index])
         self.count = 0
+        self.bloom_filter: Union[BloomFilter, None] = BloomFilter(self.table_size // 2 + 1) if bloom_filter else None
+        self.bloom_stale = 0
+
+    @classmethod
+    def from_items(cls, items: Iterable[tuple[K, V]], expected_size: Union[int, None] = None,
+                   sizes=None, bloom_filter: bool = False) -> LinearProbeTable[K, V]:
+        """
+        Creates a table holding the given (key, value) pairs, see update_many.
+
+        :complexity: See update_many.
+        """
+        table = cls(sizes, bloom_filter)
+        table.update_many(items, expected_size)
+        return table
+
+    def update_many(self, items: Iterable[tuple[K, V]], expected_size: Union[int, None] = None) -> None:
+        """
+        Set every (key, value) pair of items, later pairs overwriting earlier ones with the same key.
+        The table first grows, at most once, to the smallest size that holds len(self) + expected_size
+        keys, so the pairs go in without a rehash. expected_size defaults to the number of items.
+
+        :complexity best: O(T + N*hash(K)) No probing.
+        :complexity worst: O(T + N*hash(K) + N^2*comp(K)) Lots of probing.
+        Where T is the table size picked and N is len(self) + the number of items
+        """
+        if expected_size is None:
+            items = list(items)
+            expected_size = len(items)
+        self._reserve(len(self) + expected_size)
+        for key, value in items:
+            self[key] = value
+
+    def _reserve(self, total: int) -> None:
+        """
+        Grow to the smallest table size that holds total keys without a rehash.
+
+        :complexity: See _resize, O(1) when the table is already large enough.
+        """
+        size_index = self.size_index
+        while size_index + 1 < len(self.TABLE_SIZES) and total > self.TABLE_SIZES[size_index] / 2:
+            size_index += 1
+        if size_index > self.size_index:
+            self._resize(size_index)
 
     def hash(self, key: K) -> int:
         """
@@ -99,6 +149,63 @@ class LinearProbeTable(Generic[K, V]):
         else:
             raise KeyError(key)
 
+    def probe_index(self, key: K) -> int:
+        """
+        Returns the position of the key in the table, or -1 if it is not there. Never raises.
+
+        :complexity best: O(len(key)) the Bloom filter rejects the key
+        :complexity worst: O(hash(key) + N*comp(K)) where N is the table size
+        """
+        if self.bloom_filter is not None and key not in self.bloom_filter:
+            return -1
+        position = self.hash(key)
+        for _ in range(self.table_size):
+            item = self.array[position]
+            if item is None:
+                return -1
+            elif item[0] == key:
+                return position
+            position = (position + 1) % self.table_size
+        return -1
+
+    def get(self, key: K, default: Union[V, None] = None) -> Union[V, None]:
+        """
+        Returns the value of the key, or default if it is not in the table.
+
+        :complexity: See probe_index.
+        """
+        position = self.probe_index(key)
+        if position < 0:
+            return default
+        return self.array[position][1]
+
+    def _rebuild_bloom_filter(self) -> None:
+        """
+        Replace the Bloom filter with one sized for the current table holding only the live keys.
+
+        :complexity: O(N + len(self)*len(key)) where N is the table size
+        """
+        self.bloom_filter = BloomFilter(self.table_size // 2 + 1)
+        self.bloom_stale = 0
+        for item in self.array:
+            if item is not None:
+                self.bloom_filter.add(item[0])
+
+    def probe_length(self, key: K) -> int:
+        """
+        Returns the number of slots a lookup of key inspects, whether or not it is in the table.
+
+        :complexity: See linear probe.
+        """
+        position = self.hash(key)
+        probes = 1
+        while probes <= self.table_size and self.array[position] is not None:
+            if self.array[position][0] == key:
+                return probes
+            position = (position + 1) % self.table_size
+            probes += 1
+        return min(probes, self.table_size)
+
     def keys(self) -> ArrayR[K]:
         """
         Returns all keys in the hash table.
@@ -131,23 +238,20 @@ class LinearProbeTable(Generic[K, V]):
         """
         Checks to see if the given key is in the Hash Table
 
-        :complexity: See linear probe.
+        :complexity: See probe_index.
         """
-        try:
-            _ = self[key]
-        except KeyError:
-            return False
-        else:
-            return True
+        return self.probe_index(key) >= 0
 
     def __getitem__(self, key: K) -> V:
         """
         Get the value at a certain key
 
-        :complexity: See linear probe.
+        :complexity: See probe_index.
         :raises KeyError: when the key doesn't exist.
         """
-        position = self._linear_probe(key, False)
+        position = self.probe_index(key)
+        if position < 0:
+            raise KeyError(key)
         return self.array[position][1]
 
     def __setitem__(self, key: K, data: V) -> None:
@@ -162,6 +266,8 @@ class LinearProbeTable(Generic[K, V]):
 
         if self.array[position] is None:
             self.count += 1
+            if self.bloom_filter is not None:
+                self.bloom_filter.add(key)
 
         self.array[position] = (key, data)
 
@@ -171,25 +277,37 @@ class LinearProbeTable(Generic[K, V]):
     def __delitem__(self, key: K) -> None:
         """
         Deletes a (key, value) pair in our hash table.
+        Backward-shift deletion: each later entry of the cluster moves back into the hole
+        if the hole lies between its home position and its slot. The home is hash(key) at
+        the current table size, recomputed for each entry passed over: the table does not
+        cache homes, as they change with the table size and a cache could not be reused
+        when resizing. No key is compared or re-probed.
 
         :complexity best: O(hash(key)) deleting item is not probed and in correct spot.
-        :complexity worst: O(N*hash(key)+N^2*comp(K)) deleting item is midway through large chain.
+        :complexity worst: O(hash(key) + N*(hash(K) + comp(K))) deleting item is midway through large chain.
         :raises KeyError: when the key doesn't exist.
         """
-        position = self._linear_probe(key, False)
+        hole = self._linear_probe(key, False)
         # Remove the element
-        self.array[position] = None
+        self.array[hole] = None
         self.count -= 1
         # Start moving over the cluster
-        position = (position + 1) % self.table_size
+        position = (hole + 1) % self.table_size
         while self.array[position] is not None:
-            key2, value = self.array[position]
-            self.array[position] = None
-            # Reinsert.
-            newpos = self._linear_probe(key2, True)
-            self.array[newpos] = (key2, value)
+            home = self.hash(self.array[position][0])
+            # The entry may fill the hole only if it would still be reached probing from home
+            if (position - home) % self.table_size >= (position - hole) % self.table_size:
+                self.array[hole] = self.array[position]
+                self.array[position] = None
+                hole = position
             position = (position + 1) % self.table_size
 
+        if self.bloom_filter is not None:
+            # The filter cannot forget the key, so it is rebuilt once stale keys outnumber live ones
+            self.bloom_stale += 1
+            if self.bloom_stale > self.count:
+                self._rebuild_bloom_filter()
+
     def is_empty(self) -> bool:
         return self.count == 0
 
@@ -199,18 +317,31 @@ class LinearProbeTable(Generic[K, V]):
     def _rehash(self) -> None:
         """
         Need to resize table and reinsert all values
+        The Bloom filter, if any, is replaced by one sized for the new table.
 
         :complexity best: O(N*hash(K)) No probing.
         :complexity worst: O(N*hash(K) + N^2*comp(K)) Lots of probing.
         Where N is len(self)
         """
-        old_array = self.array
-        self.size_index += 1
-        if self.size_index == len(self.TABLE_SIZES):
+        if self.size_index + 1 == len(self.TABLE_SIZES):
             # Cannot be resized further.
             return
+        self._resize(self.size_index + 1)
+
+    def _resize(self, size_index: int) -> None:
+        """
+        Move to table size TABLE_SIZES[size_index], reinserting every entry.
+
+        :complexity: See _rehash.
+        """
+        old_array = self.array
+        self.size_index = size_index
         self.array = ArrayR(self.TABLE_SIZES[self.size_index])
         self.count = 0
+        if self.bloom_filter is not None:
+            # Refilled by the reinsertion below, sized for the new table
+            self.bloom_filter = BloomFilter(self.table_size // 2 + 1)
+            self.bloom_stale = 0
         for item in old_array:
             if item is not None:
                 key, value = item
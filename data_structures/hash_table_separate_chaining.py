@@ -10,35 +10,97 @@ __since__ = '31/03/2023'
 
 from data_structures.referential_array import ArrayR
 from data_structures.linked_list import LinkedList
-from typing import TypeVar, Generic
+from data_structures.node import Node
+from typing import Iterable, TypeVar, Generic, Union
 
 T = TypeVar('T')
 
 
+def next_prime(n: int) -> int:
+    """
+    Returns the smallest prime greater than or equal to n
+    :complexity: O(G * sqrt(n)) where G is the gap to the next prime
+    """
+    candidate = max(2, n)
+    while True:
+        divisor = 2
+        while divisor * divisor <= candidate:
+            if candidate % divisor == 0:
+                break
+            divisor += 1
+        else:
+            return candidate
+        candidate += 1
+
+
 class HashTableSeparateChaining(Generic[T]):
     """
     Separate Chaining Hash Table
 
+    Each entry is stored as a (key, data, full hash) tuple in the chain of bucket full hash % table size.
+    When the load factor (count / table size) passes max_load_factor the table grows to the next
+    prime at least twice its size, and entries are moved by their stored hash without hashing a key again.
+
     constants:
         MIN_CAPACITY: smallest valid table size
         DEFAULT_TABLE_SIZE: default table size used in the __init__
         DEFAULT_HASH_TABLE: default hash base used for the hash function
+        DEFAULT_MAX_LOAD_FACTOR: default load factor above which the table grows
+        HASH_MASK: full hashes are kept to 64 bits
 
     attributes:
         count: number of elements in the hash table
-        array: used to represent our internal array
+        table: used to represent our internal array, one chain (or None) per bucket
+        max_load_factor: load factor above which the table grows
     """
     MIN_CAPACITY = 1
 
     DEFAULT_TABLE_SIZE = 17
     DEFAULT_HASH_BASE = 31
+    DEFAULT_MAX_LOAD_FACTOR = 1.0
+    HASH_MASK = (1 << 64) - 1
 
-    def __init__(self, table_size: int = DEFAULT_TABLE_SIZE) -> None:
+    def __init__(self, table_size: int = DEFAULT_TABLE_SIZE,
+                 max_load_factor: float = DEFAULT_MAX_LOAD_FACTOR) -> None:
         """
         :complexity: O(A) where A is complexity of ArrayR.__init__()
         """
         self.count = 0
-        self.table = ArrayR(max(self.MIN_CAPACITY, table_size))
+        self.table: ArrayR[Union[LinkedList[tuple[str, T, int]], None]] = ArrayR(max(self.MIN_CAPACITY, table_size))
+        self.max_load_factor = max_load_factor
+
+    @classmethod
+    def from_items(cls, items: Iterable[tuple[str, T]], expected_size: Union[int, None] = None,
+                   max_load_factor: float = DEFAULT_MAX_LOAD_FACTOR) -> 'HashTableSeparateChaining[T]':
+        """
+        Creates a table holding the given (key, data) pairs, see update_many
+        :complexity: See update_many
+        """
+        table = cls(cls.MIN_CAPACITY, max_load_factor)
+        table.update_many(items, expected_size)
+        return table
+
+    def update_many(self, items: Iterable[tuple[str, T]], expected_size: Union[int, None] = None) -> None:
+        """
+        Set every (key, data) pair of items, later pairs overwriting earlier ones with the same key.
+        The table first grows, at most once, to the smallest prime that holds len(self) + expected_size
+        items within max_load_factor, so the pairs go in without a rehash.
+        expected_size defaults to the number of items.
+        :complexity: O(T + N*(K + C)) where T is the table size picked, N is len(self) + the number of items,
+            K the size of a key and C the length of its chain
+        """
+        if expected_size is None:
+            items = list(items)
+            expected_size = len(items)
+        total = len(self) + expected_size
+        if total > self.max_load_factor * len(self.table):
+            self._resize(next_prime(int(total / self.max_load_factor) + 1))
+        for key, data in items:
+            self[key] = data
+
+    @property
+    def table_size(self) -> int:
+        return len(self.table)
 
     def __len__(self) -> int:
         """
@@ -47,60 +109,125 @@ class HashTableSeparateChaining(Generic[T]):
         """
         return self.count
 
+    def _find_node(self, chain: Union[LinkedList, None], key: str, key_hash: int) -> Union[Node, None]:
+        """
+        Returns the node holding key in the chain, or None.
+        Stored hashes are compared before keys, so most chain neighbours are skipped without a key comparison.
+        :complexity: O(C * comp(K)) where C is the length of the chain
+        """
+        if chain is None:
+            return None
+        node = chain.head
+        while node is not None:
+            item = node.item
+            if item[2] == key_hash and item[0] == key:
+                return node
+            node = node.link
+        return None
+
     def __delitem__(self, key: str) -> None:
         """
         Deletes an item from our hash table
+        :complexity: O(K + C) where K is the size of the key and C the length of its chain
         :raises KeyError: when the key doesn't exist
         """
-        position = self.hash(key)
-        if self.table[position] is None:
+        key_hash = self.full_hash(key)
+        position = key_hash % len(self.table)
+        chain = self.table[position]
+        if chain is None:
             raise KeyError(key)
 
-        for index, item in enumerate(self.table[position]):
-            if item[0] == key:
-                if len(self.table[position]) <= 1:
-                    self.table[position] = None
+        previous = None
+        node = chain.head
+        while node is not None:
+            item = node.item
+            if item[2] == key_hash and item[0] == key:
+                # Unlinked here rather than through delete_at_index, which would walk the chain again
+                if previous is None:
+                    chain.head = node.link
                 else:
-                    self.table[position].delete_at_index(index)
+                    previous.link = node.link
+                if chain.rear is node:
+                    chain.rear = previous
+                chain.length -= 1
+                if chain.length == 0:
+                    self.table[position] = None
 
                 self.count -= 1
                 return
+            previous = node
+            node = node.link
 
         raise KeyError(key)
 
     def __setitem__(self, key: str, data: T) -> None:
         """
         Set a (key, data) pair in our hash table
+        An existing key is updated in the node found by the scan.
+        :complexity: O(K + C) where K is the size of the key and C the length of its chain,
+            plus O(N) when the table grows, where N is the number of items
         """
-        position = self.hash(key)
-        if self.table[position] is None:
-            self.table[position] = LinkedList()
-
-        # Attempt to find the key in our linked list
-        if len(self.table[position]) > 0:
-            for index, item in enumerate(self.table[position]):
-                if item[0] == key:
-                    # If found update the data
-                    self.table[position][index] = (key, data)
-                    return
-                
-        # self.table[position].insert(0, (key, data)) # To insert at the beginning 
-        self.table[position].append((key, data))
+        key_hash = self.full_hash(key)
+        position = key_hash % len(self.table)
+        chain = self.table[position]
+        node = self._find_node(chain, key, key_hash)
+        if node is not None:
+            node.item = (key, data, key_hash)
+            return
+
+        if chain is None:
+            chain = LinkedList()
+            self.table[position] = chain
+        chain.append((key, data, key_hash))
         self.count += 1
 
+        if self.count > self.max_load_factor * len(self.table):
+            self._rehash()
+
     def __getitem__(self, key: str) -> T:
         """
         Get the data associated with a key
+        :complexity: O(K + C) where K is the size of the key and C the length of its chain
         :raises KeyError: when the key doesn't exist
         """
-        position = self.hash(key)
-        if self.table[position] is None:
+        key_hash = self.full_hash(key)
+        node = self._find_node(self.table[key_hash % len(self.table)], key, key_hash)
+        if node is None:
             raise KeyError(key)
-        for item in self.table[position]:
-            if item[0] == key:
-                return item[1]
+        return node.item[1]
 
-        raise KeyError(key)
+    def __contains__(self, key: str) -> bool:
+        """
+        Checks to see if the given key is in the hash table
+        :complexity: See __getitem__
+        """
+        key_hash = self.full_hash(key)
+        return self._find_node(self.table[key_hash % len(self.table)], key, key_hash) is not None
+
+    def _rehash(self) -> None:
+        """
+        Grows the table to the next prime at least twice its size and moves every entry
+        to the chain of its stored hash.
+        :complexity: O(N + T) where N is the number of items and T the new table size
+        """
+        self._resize(next_prime(2 * len(self.table) + 1))
+
+    def _resize(self, table_size: int) -> None:
+        """
+        Moves every entry to the chain of its stored hash in a new table of the given size
+        :complexity: O(N + T) where N is the number of items and T the new table size
+        """
+        old_table = self.table
+        self.table = ArrayR(table_size)
+        for chain in old_table:
+            if chain is not None:
+                node = chain.head
+                while node is not None:
+                    position = node.item[2] % len(self.table)
+                    if self.table[position] is None:
+                        self.table[position] = LinkedList()
+                    self.table[position].append(node.item)
+                    node = node.link
 
     def is_empty(self):
         """
@@ -109,19 +236,55 @@ class HashTableSeparateChaining(Generic[T]):
         """
         return self.count == 0
 
-    def hash(self, key: str) -> int:
+    def full_hash(self, key: str) -> int:
         """
-        Universal Hash function
-        :post: returns a valid position (0 <= value < table_size)
+        Polynomial hash of the key, independent of the table size, stored with each entry
         :complexity: O(K) where K is the size of the key
         """
         value = 0
-        a = 31415
         for char in key:
-            value = (ord(char) + a * value) % len(self.table)
-            a = a * HashTableSeparateChaining.DEFAULT_HASH_BASE % (len(self.table) - 1)
+            value = (value * HashTableSeparateChaining.DEFAULT_HASH_BASE + ord(char)) & self.HASH_MASK
         return value
 
+    def hash(self, key: str) -> int:
+        """
+        Position of the key's chain
+        :post: returns a valid position (0 <= value < table_size)
+        :complexity: O(K) where K is the size of the key
+        """
+        return self.full_hash(key) % len(self.table)
+
+    def load_factor(self) -> float:
+        """
+        Returns the average number of items per bucket
+        :complexity: O(1)
+        """
+        return self.count / len(self.table)
+
+    def max_chain_length(self) -> int:
+        """
+        Returns the length of the longest chain, the worst case cost of a lookup
+        :complexity: O(T) where T is the table size
+        """
+        longest = 0
+        for chain in self.table:
+            if chain is not None and len(chain) > longest:
+                longest = len(chain)
+        return longest
+
+    def average_chain_length(self) -> float:
+        """
+        Returns the average length of the non-empty chains, the expected cost of a successful lookup
+        :complexity: O(T) where T is the table size
+        """
+        used = 0
+        for chain in self.table:
+            if chain is not None:
+                used += 1
+        if used == 0:
+            return 0.0
+        return self.count / used
+
     def insert(self, key: str, data: T) -> None:
         """
         Utility method to call our setitem method
@@ -179,7 +342,7 @@ class HashTableSeparateChaining(Generic[T]):
                 for item in list:
                     if not first:
                         result += ' -> '
-                    (key, value) = item
+                    key, value = item[0], item[1]
                     result += "(" + str(key) + "," + str(value) + ")"
                     first = False
                 result += '\n'
@@ -0,0 +1,20 @@
+""" Hash mixing
+
+Bit mixing shared by the hash tables that turn a polynomial string hash into a 64 bit hash.
+"""
+from __future__ import annotations
+
+HASH_MASK = (1 << 64) - 1
+
+
+def mix64(value: int, seed: int = 0) -> int:
+    """
+    Mix a 64 bit integer, xored with seed, so that every bit of the result depends on every bit of value.
+    This is the 64 bit finaliser of MurmurHash3. Different seeds give unrelated hashes of the same value.
+
+    :complexity: O(1)
+    """
+    value = (value ^ seed) & HASH_MASK
+    value = ((value ^ (value >> 33)) * 0xFF51AFD7ED558CCD) & HASH_MASK
+    value = ((value ^ (value >> 33)) * 0xC4CEB9FE1A85EC53) & HASH_MASK
+    return value ^ (value >> 33)
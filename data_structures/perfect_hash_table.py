@@ -0,0 +1,393 @@
+""" Hash Table ADT
+
+Defines a Hash Table over a fixed set of keys, known when it is built, using a minimal perfect
+hash function generated by hash-and-displace, so there is no conflict to resolve.
+"""
+from __future__ import annotations
+
+from array import array
+from enum import Enum
+from typing import Generic, Iterable, TypeVar, Union
+
+from data_structures.hashing import mix64
+from data_structures.referential_array import ArrayR
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+
+class MinimalPerfectHash:
+    """
+    Minimal perfect hash function for a fixed set of string keys.
+
+    Each of the N keys gets its own slot in 0..N-1. The 64 bit hash of a key picks a bucket, and
+    the key's slot is (mix64(hash, displacement) + offset) % N for the displacement and offset of its
+    bucket, found when the function is built. Buckets of several keys are placed first, largest
+    first while most slots are still free, each with the first displacement that sends its keys to
+    free slots. A bucket of one key then takes any free slot directly through its offset, so the
+    last few free slots never have to be hit by chance. A lookup is the key's hash, two reads and
+    one mix, with no probing. Every key is checked against its slot once the build succeeds, and
+    the parameters are cached, so each key set is only searched for once per run.
+
+    The key hash is the polynomial string hash of the other tables, mixed by mix64. Unlike Python's
+    string hash it does not change from one run to the next, so a key set gets the same parameters,
+    and each key the same slot, in every run.
+
+    Usage:
+    ```
+    positions = MinimalPerfectHash.build(PlayerPosition)
+    positions.index("Striker")      # a slot in 0..3
+    positions.index("Referee")      # -1
+    ```
+
+    Attributes:
+        keys (ArrayR[str]): keys[slot] is the key that hashes to slot
+        displacements (array[int]): the displacement of each bucket
+        offsets (array[int]): the offset of each bucket
+        bucket_count (int): number of buckets
+    """
+
+    HASH_BASE = 31
+    HASH_MASK = (1 << 64) - 1
+
+    # Average number of keys per bucket to start with. Fewer buckets is a smaller function but a longer build.
+    BUCKET_SIZE = 2
+
+    # Displacements tried for a bucket before the build starts over with more buckets.
+    MAX_DISPLACEMENT = 1 << 12
+
+    # Builds started, each with twice the buckets of the last, before the key set is given up on.
+    MAX_ATTEMPTS = 8
+
+    # Sorted key tuple -> (bucket_count, displacements, offsets), so each key set is only built once.
+    _parameters: dict[tuple[str, ...], tuple[int, array, array]] = {}
+
+    def __init__(self, keys: ArrayR[str], bucket_count: int, displacements: array, offsets: array) -> None:
+        """
+        Wraps parameters found by build. Use build rather than calling this directly.
+        """
+        self.keys = keys
+        self.bucket_count = bucket_count
+        self.displacements = displacements
+        self.offsets = offsets
+
+    @classmethod
+    def build(cls, keys: Union[type[Enum], Iterable[str]]) -> MinimalPerfectHash:
+        """
+        Returns the minimal perfect hash function of a set of strings, or of an Enum's member values.
+
+        Complexity:
+            Best Case Complexity: O(N*hash) where N is the number of keys, when the key set was built before
+            Worst Case Complexity: O(N*(hash + D)) where D is MAX_DISPLACEMENT, when it is built
+        Raises:
+            ValueError: If there are no keys, a key is repeated, two keys share a 64 bit hash,
+                or no parameters are found within MAX_ATTEMPTS builds.
+        """
+        if isinstance(keys, type) and issubclass(keys, Enum):
+            keys = [member.value for member in keys]
+        keys = list(keys)
+        if len(keys) == 0:
+            raise ValueError("A perfect hash needs at least one key")
+        if len(set(keys)) != len(keys):
+            raise ValueError("Keys should be distinct")
+
+        signature = tuple(sorted(keys))
+        parameters = cls._parameters.get(signature)
+        if parameters is None:
+            parameters = cls._search(keys)
+            cls._parameters[signature] = parameters
+        function = cls(ArrayR(len(keys)), *parameters)
+        for key in keys:
+            slot = function.slot(key)
+            if function.keys[slot] is not None:
+                raise ValueError(f"{key} and {function.keys[slot]} share slot {slot}")
+            function.keys[slot] = key
+        return function
+
+    @classmethod
+    def _search(cls, keys: list[str]) -> tuple[int, array, array]:
+        """
+        Finds a bucket count, and the displacement and offset of each bucket, that give every key its own slot.
+
+        Complexity:
+            Best Case Complexity: O(N*hash) where N is the number of keys, every bucket fits undisplaced
+            Worst Case Complexity: O(A*N*(hash + D)) where D is MAX_DISPLACEMENT and A is MAX_ATTEMPTS
+        Raises:
+            ValueError: If two keys share a 64 bit hash, so no displacement can separate them,
+                or no build of MAX_ATTEMPTS places every bucket.
+        """
+        size = len(keys)
+        hashes = [cls.hash(key) for key in keys]
+        if len(set(hashes)) != size:
+            raise ValueError("Two keys share a 64 bit hash")
+
+        bucket_count = max(1, -(-size // cls.BUCKET_SIZE))
+        for _ in range(cls.MAX_ATTEMPTS):
+            buckets: list[list[int]] = [[] for _ in range(bucket_count)]
+            for key_hash in hashes:
+                buckets[key_hash % bucket_count].append(key_hash)
+            displacements = array('Q', bytes(8 * bucket_count))
+            offsets = array('Q', bytes(8 * bucket_count))
+            taken = [False] * size
+            placed = True
+            order = sorted(range(bucket_count), key=lambda b: -len(buckets[b]))
+            for bucket in order:
+                if len(buckets[bucket]) < 2:
+                    break
+                displacement = cls._displace(buckets[bucket], taken)
+                if displacement < 0:
+                    placed = False
+                    break
+                displacements[bucket] = displacement
+            if placed:
+                # Each bucket of one key takes the next free slot, with displacement 0
+                free = 0
+                for bucket in order:
+                    if len(buckets[bucket]) == 1:
+                        while taken[free]:
+                            free += 1
+                        taken[free] = True
+                        offsets[bucket] = (free - mix64(buckets[bucket][0])) % size
+                return bucket_count, displacements, offsets
+            bucket_count = min(size, 2 * bucket_count)
+        raise ValueError(f"No perfect hash found for {size} keys in {cls.MAX_ATTEMPTS} attempts")
+
+    @classmethod
+    def _displace(cls, bucket: list[int], taken: list[bool]) -> int:
+        """
+        Returns the first displacement that sends every hash of the bucket to a free slot, and takes
+        those slots, or -1 if none below MAX_DISPLACEMENT does.
+
+        Complexity:
+            Best Case Complexity: O(B) where B is len(bucket), the first displacement fits
+            Worst Case Complexity: O(B*D) where D is MAX_DISPLACEMENT
+        """
+        size = len(taken)
+        for displacement in range(cls.MAX_DISPLACEMENT):
+            slots = {mix64(key_hash, displacement) % size for key_hash in bucket}
+            if len(slots) == len(bucket) and not any(taken[slot] for slot in slots):
+                for slot in slots:
+                    taken[slot] = True
+                return displacement
+        return -1
+
+    @classmethod
+    def hash(cls, key: str) -> int:
+        """
+        Hash a key into a 64 bit integer, the same in every run.
+
+        Complexity:
+            Best/Worst Case Complexity: O(len(key))
+        """
+        value = 0
+        for char in key:
+            value = (value * cls.HASH_BASE + ord(char)) & cls.HASH_MASK
+        return mix64(value)
+
+    def __len__(self) -> int:
+        """ Returns the number of keys. """
+        return len(self.keys)
+
+    def slot(self, key: str) -> int:
+        """
+        Returns the slot of a key. A key outside the set gets an arbitrary slot, see index.
+
+        Complexity: See hash.
+        """
+        key_hash = self.hash(key)
+        bucket = key_hash % self.bucket_count
+        return (mix64(key_hash, self.displacements[bucket]) + self.offsets[bucket]) % len(self.keys)
+
+    def index(self, key: str) -> int:
+        """
+        Returns the slot of a key, or -1 if it is not one of the keys.
+
+        Complexity:
+            Best Case Complexity: O(hash)
+            Worst Case Complexity: O(hash + comp(K))
+        """
+        slot = self.slot(key)
+        if self.keys[slot] != key:
+            return -1
+        return slot
+
+
+class PerfectHashTable(Generic[K, V]):
+    """
+    Perfect Hash Table.
+
+    Has the same public API as HashyPerfectionTable, for a key set given when the table is created:
+    an Enum, whose member values are the keys, or any collection of distinct strings. The table
+    has exactly one slot per key, found by a MinimalPerfectHash, so every operation is one hash
+    and one slot. Setting a key outside the set raises a KeyError instead of growing the table.
+
+    Type Arguments:
+        - K:    Key Type. Must be string.
+        - V:    Value Type.
+
+    Attributes:
+        perfect_hash (MinimalPerfectHash): the key -> slot function, shared by tables with the same keys
+        array (ArrayR[tuple[K, V]]): the (key, value) pair in each slot, None while the key is not set
+        count (int): number of keys set
+
+    Unless stated otherwise, all methods have O(1) complexity.
+    """
+
+    def __init__(self, keys: Union[type[Enum], Iterable[K], MinimalPerfectHash]) -> None:
+        """
+        Initialise the Hash Table with none of its keys set.
+        A MinimalPerfectHash is used as it is, so tables over the same keys can share one built once.
+
+        Complexity:
+            Best Case Complexity: O(N) where N is the number of keys, given a MinimalPerfectHash
+            Worst Case Complexity: O(N*(hash + D)) when the key set is new, see MinimalPerfectHash.build
+        Raises:
+            ValueError: See MinimalPerfectHash.build.
+        """
+        if isinstance(keys, MinimalPerfectHash):
+            self.perfect_hash = keys
+        else:
+            self.perfect_hash = MinimalPerfectHash.build(keys)
+        self.array: ArrayR[Union[tuple[K, V], None]] = ArrayR(len(self.perfect_hash))
+        self.count = 0
+
+    def hash(self, key: K) -> int:
+        """
+        Hash a key for insert/retrieve/update into the hashtable.
+
+        Complexity:
+            Best/Worst Case Complexity: O(MinimalPerfectHash.hash)
+        """
+        return self.perfect_hash.slot(key)
+
+    @property
+    def table_size(self) -> int:
+        return len(self.array)
+
+    def __len__(self) -> int:
+        """
+        Returns number of elements in the hash table
+        """
+        return self.count
+
+    def probe_index(self, key: K) -> int:
+        """
+        Returns the position of the key in the table, or -1 if it is not set or not one of the table's keys.
+        Never raises.
+
+        Complexity:
+            Best Case Complexity: O(MinimalPerfectHash.hash)
+            Worst Case Complexity: O(MinimalPerfectHash.hash + comp(K))
+        """
+        position = self.perfect_hash.index(key)
+        if position < 0 or self.array[position] is None:
+            return -1
+        return position
+
+    def get(self, key: K, default: Union[V, None] = None) -> Union[V, None]:
+        """
+        Returns the value of the key, or default if it is not in the table.
+
+        Complexity: See probe_index.
+        """
+        position = self.probe_index(key)
+        if position < 0:
+            return default
+        return self.array[position][1]
+
+    def keys(self) -> ArrayR[K]:
+        """
+        Returns all keys in the hash table.
+        :complexity: O(N) where N is self.table_size.
+        """
+        res = ArrayR(self.table_size)
+        i = 0
+        for x in range(self.table_size):
+            if self.array[x] is not None:
+                res[i] = self.array[x][0]
+                i += 1
+        return res
+
+    def values(self) -> ArrayR[V]:
+        """
+        Returns all values in the hash table.
+        :complexity: O(N) where N is self.table_size.
+        """
+        res = ArrayR(self.table_size)
+        i = 0
+        for x in range(self.table_size):
+            if self.array[x] is not None:
+                res[i] = self.array[x][1]
+                i += 1
+        return res
+
+    def __contains__(self, key: K) -> bool:
+        """
+        Checks to see if the given key is in the Hash Table
+
+        Complexity: See probe_index.
+        """
+        return self.probe_index(key) >= 0
+
+    def __getitem__(self, key: K) -> V:
+        """
+        Get the value at a certain key
+
+        Complexity: See probe_index.
+        Raises:
+            KeyError: When the key doesn't exist.
+        """
+        position = self.probe_index(key)
+        if position < 0:
+            raise KeyError(f"{key} not found")
+        return self.array[position][1]
+
+    def __setitem__(self, key: K, data: V) -> None:
+        """
+        Set an (key, value) pair in our hash table.
+
+        Complexity:
+            Best Case Complexity: O(MinimalPerfectHash.hash)
+            Worst Case Complexity: O(MinimalPerfectHash.hash + comp(K))
+        Raises:
+            KeyError: When the key is not one of the table's keys.
+        """
+        position = self.perfect_hash.index(key)
+        if position < 0:
+            raise KeyError(f"{key} is not one of the table's keys")
+        if self.array[position] is None:
+            self.count += 1
+        self.array[position] = (key, data)
+
+    def __delitem__(self, key: K) -> None:
+        """
+        Deletes a (key, value) pair in our hash table.
+
+        Complexity: See probe_index.
+        Raises:
+            KeyError: When the key doesn't exist.
+        """
+        position = self.probe_index(key)
+        if position < 0:
+            raise KeyError(f"{key} not found")
+        self.array[position] = None
+        self.count -= 1
+
+    def is_empty(self) -> bool:
+        return self.count == 0
+
+    def is_full(self) -> bool:
+        return self.count == self.table_size
+
+    def __str__(self) -> str:
+        """
+        Returns all they key/value pairs in our hash table (no particular
+        order).
+        :complexity: O(N * (str(key) + str(value))) where N is the table size
+        """
+        result = ""
+        for item in self.array:
+            if item is not None:
+                (key, value) = item
+                result += "(" + str(key) + "," + str(value) + ")\n"
+        return result
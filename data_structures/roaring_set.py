@@ -0,0 +1,467 @@
+"""
+    Compressed bitmap implementation of Set ADT, in the style of Roaring bitmaps.
+"""
+
+from __future__ import annotations
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Iterator, Union
+
+from data_structures.set_adt import Set
+
+
+# Values per chunk: the low 16 bits of an element index its chunk.
+CHUNK_BITS = 16
+CHUNK_MASK = (1 << CHUNK_BITS) - 1
+
+# Largest number of values an array container holds before it becomes a bitmap.
+# At 4096 values both containers take 8KB.
+ARRAY_LIMIT = 4096
+
+# A bitmap only becomes an array again once it holds fewer than this many values, so a
+# chunk whose size hovers around ARRAY_LIMIT does not convert back and forth on every update.
+BITMAP_LIMIT = ARRAY_LIMIT // 2
+
+# 64 bit words in a chunk's bitmap.
+WORDS = (CHUNK_MASK + 1) // 64
+
+
+def words_from_values(values: Iterable[int]) -> array:
+    """ Packs chunk values into a bitmap of 64 bit words.
+    :complexity: O(n + 2^16/64) where n is the number of values
+    """
+    words = array('Q', bytes(8 * WORDS))
+    for value in values:
+        words[value >> 6] |= 1 << (value & 63)
+    return words
+
+
+def words_from_bits(bits: int) -> array:
+    """ Splits a bitmap integer into 64 bit words, lowest word first.
+    :complexity: O(2^16/64)
+    """
+    words = array('Q')
+    words.frombytes(bits.to_bytes(8 * WORDS, 'little'))
+    if sys.byteorder == 'big':
+        words.byteswap()
+    return words
+
+
+def bits_from_words(words: array) -> int:
+    """ Joins 64 bit words back into one bitmap integer, so whole bitmaps can be combined in one operation.
+    :complexity: O(2^16/64)
+    """
+    if sys.byteorder == 'big':
+        words = array('Q', words)
+        words.byteswap()
+    return int.from_bytes(words.tobytes(), 'little')
+
+
+def bits_from_values(values: Iterable[int]) -> int:
+    """ Packs chunk values into a bitmap integer.
+    :complexity: O(n + 2^16/8) where n is the number of values
+    """
+    buffer = bytearray((CHUNK_MASK + 1) // 8)
+    for value in values:
+        buffer[value >> 3] |= 1 << (value & 7)
+    return int.from_bytes(buffer, 'little')
+
+
+def values_from_words(words: array) -> Iterator[int]:
+    """ Yields the set bits of a bitmap in increasing order.
+    :complexity: O(2^16/64 + n) where n is the number of set bits
+    """
+    for index, word in enumerate(words):
+        base = index * 64
+        while word:
+            lowest = word & -word
+            yield base + lowest.bit_length() - 1
+            word ^= lowest
+
+
+class ArrayContainer:
+    """ A sparse chunk, its values kept in a sorted array('H').
+
+        Attributes:
+        values (array[int]): the chunk values in increasing order
+    """
+
+    def __init__(self, values: Union[array, None] = None) -> None:
+        self.values = values if values is not None else array('H')
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.values)
+
+    def __contains__(self, value: int) -> bool:
+        """ :complexity: O(log n) where n is the number of values """
+        index = bisect_left(self.values, value)
+        return index < len(self.values) and self.values[index] == value
+
+    def add(self, value: int) -> Union[ArrayContainer, BitmapContainer]:
+        """ Adds a value, returning the container that now holds the chunk.
+        :complexity: O(n) to shift the array, or O(2^16/64) when it becomes a bitmap
+        """
+        index = bisect_left(self.values, value)
+        if index < len(self.values) and self.values[index] == value:
+            return self
+        if len(self.values) == ARRAY_LIMIT:
+            bitmap = BitmapContainer(words_from_values(self.values), len(self.values))
+            return bitmap.add(value)
+        self.values.insert(index, value)
+        return self
+
+    def remove(self, value: int) -> Union[ArrayContainer, None]:
+        """ Removes a value, returning None if the chunk is now empty.
+        :complexity: O(n) where n is the number of values
+        :raises KeyError: if the value is not in the container.
+        """
+        index = bisect_left(self.values, value)
+        if index == len(self.values) or self.values[index] != value:
+            raise KeyError(value)
+        del self.values[index]
+        return self if len(self.values) else None
+
+    def to_bits(self) -> int:
+        return bits_from_values(self.values)
+
+
+class BitmapContainer:
+    """ A dense chunk, its values kept as the set bits of an array of 2^16/64 words.
+
+        Attributes:
+        words (array[int]): bit v & 63 of word v >> 6 is set if and only if v is in the chunk
+        count (int): number of set bits
+    """
+
+    def __init__(self, words: array, count: Union[int, None] = None) -> None:
+        self.words = words
+        self.count = sum(word.bit_count() for word in words) if count is None else count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[int]:
+        return values_from_words(self.words)
+
+    def __contains__(self, value: int) -> bool:
+        """ :complexity: O(1) """
+        return (self.words[value >> 6] >> (value & 63)) & 1 == 1
+
+    def add(self, value: int) -> BitmapContainer:
+        """ :complexity: O(1), only the word holding the value is rewritten """
+        word = self.words[value >> 6]
+        bit = 1 << (value & 63)
+        if not word & bit:
+            self.words[value >> 6] = word | bit
+            self.count += 1
+        return self
+
+    def remove(self, value: int) -> Union[ArrayContainer, BitmapContainer, None]:
+        """ Removes a value, returning an array container once the chunk holds fewer than BITMAP_LIMIT values,
+        or None if it is empty.
+        :complexity: O(1), or O(2^16/64) when it becomes an array
+        :raises KeyError: if the value is not in the container.
+        """
+        word = self.words[value >> 6]
+        bit = 1 << (value & 63)
+        if not word & bit:
+            raise KeyError(value)
+        self.words[value >> 6] = word ^ bit
+        self.count -= 1
+        if self.count == 0:
+            return None
+        if self.count < BITMAP_LIMIT:
+            return ArrayContainer(array('H', values_from_words(self.words)))
+        return self
+
+    def to_bits(self) -> int:
+        return bits_from_words(self.words)
+
+
+def container_from_bits(bits: int) -> Union[ArrayContainer, BitmapContainer, None]:
+    """ The smallest container for the given bits, or None if no bit is set.
+    :complexity: O(2^16/64)
+    """
+    count = bits.bit_count()
+    if count == 0:
+        return None
+    if count <= ARRAY_LIMIT:
+        return ArrayContainer(array('H', values_from_words(words_from_bits(bits))))
+    return BitmapContainer(words_from_bits(bits), count)
+
+
+def container_from_sorted(values: array) -> Union[ArrayContainer, BitmapContainer, None]:
+    """ The smallest container for the given sorted, distinct values, or None if there are none.
+    :complexity: O(n), or O(n + 2^16/64) for a bitmap
+    """
+    if len(values) == 0:
+        return None
+    if len(values) <= ARRAY_LIMIT:
+        return ArrayContainer(values)
+    return BitmapContainer(words_from_values(values), len(values))
+
+
+def union_containers(first, second) -> Union[ArrayContainer, BitmapContainer]:
+    """ :complexity: O((n + m) log(n + m)) for two small arrays, O(2^16/w) otherwise """
+    if isinstance(first, ArrayContainer) and isinstance(second, ArrayContainer):
+        if len(first) + len(second) <= ARRAY_LIMIT:
+            return ArrayContainer(array('H', sorted(set(first.values).union(second.values))))
+    return container_from_bits(first.to_bits() | second.to_bits())
+
+
+def members(container: Union[ArrayContainer, BitmapContainer]) -> Union[set, BitmapContainer]:
+    """ A view of the container for repeated membership tests with `in`, each O(1).
+    :complexity: O(n) for an array, O(1) for a bitmap as it is its own view
+    """
+    if isinstance(container, ArrayContainer):
+        return set(container.values)
+    return container
+
+
+def intersect_containers(first, second) -> Union[ArrayContainer, BitmapContainer, None]:
+    """ :complexity: O(n + m) with an array, O(2^16/w) for two bitmaps """
+    if isinstance(first, BitmapContainer) and isinstance(second, BitmapContainer):
+        return container_from_bits(first.to_bits() & second.to_bits())
+    if len(second) < len(first):
+        first, second = second, first
+    # The smaller side is probed against the other, and stays in order
+    view = members(second)
+    return container_from_sorted(array('H', [value for value in first if value in view]))
+
+
+def subtract_containers(first, second) -> Union[ArrayContainer, BitmapContainer, None]:
+    """ :complexity: O(n + m) for an array minus a container, O(2^16/w) otherwise """
+    if isinstance(first, ArrayContainer):
+        view = members(second)
+        return container_from_sorted(array('H', [value for value in first if value not in view]))
+    return container_from_bits(first.to_bits() & ~second.to_bits())
+
+
+class RoaringSet(Set[int]):
+    """ A compressed bitmap implementation of the set ADT for positive integers.
+
+        Element x is stored in chunk (x - 1) >> 16 as the value (x - 1) & 0xFFFF.
+        Each non-empty chunk has one container: a sorted array('H') while it holds
+        at most 4096 values, a bitmap of 64 bit words once it holds more, until it drops
+        below 2048 again. A sparse set over a huge range therefore costs memory in
+        proportion to its size, and the set algebra only visits chunks that are present,
+        container by container.
+
+        Attributes:
+        keys (list[int]): the chunk numbers with at least one element, increasing
+        containers (list): the container of each chunk in keys
+        size (int): number of elements
+    """
+
+    def __init__(self, dummy_capacity: int = 1) -> None:
+        """ Initialization. """
+        Set.__init__(self)
+        self.keys: list[int] = []
+        self.containers: list[Union[ArrayContainer, BitmapContainer]] = []
+
+    @classmethod
+    def from_iterable(cls, items: Iterable[int]) -> RoaringSet:
+        """ Creates a set holding the given items, sorting them once and filling each chunk in one go.
+        :complexity: O(n log n) where n is the number of items
+        :raises TypeError: if an item is not integer or if not positive.
+        """
+        res = cls()
+        ordered = sorted(set(items))
+        if ordered and (not all(isinstance(item, int) for item in ordered) or ordered[0] <= 0):
+            raise TypeError('Set elements should be integers')
+        start = 0
+        while start < len(ordered):
+            key = (ordered[start] - 1) >> CHUNK_BITS
+            stop = start
+            values = array('H')
+            while stop < len(ordered) and (ordered[stop] - 1) >> CHUNK_BITS == key:
+                values.append((ordered[stop] - 1) & CHUNK_MASK)
+                stop += 1
+            res.keys.append(key)
+            res.containers.append(container_from_sorted(values))
+            start = stop
+        res.size = len(ordered)
+        return res
+
+    @classmethod
+    def _from_chunks(cls, keys: list[int], containers: list) -> RoaringSet:
+        res = cls()
+        res.keys = keys
+        res.containers = containers
+        res.size = sum(len(container) for container in containers)
+        return res
+
+    def __len__(self) -> int:
+        """ Returns the number of elements in the set. """
+        return self.size
+
+    def is_empty(self) -> bool:
+        """ True if the set is empty. """
+        return self.size == 0
+
+    def clear(self) -> None:
+        """ Makes the set empty. """
+        self.keys = []
+        self.containers = []
+        self.size = 0
+
+    @staticmethod
+    def _split(item: int) -> tuple[int, int]:
+        """ :raises TypeError: if the item is not integer or if not positive. """
+        if not isinstance(item, int) or item <= 0:
+            raise TypeError('Set elements should be integers')
+        return (item - 1) >> CHUNK_BITS, (item - 1) & CHUNK_MASK
+
+    def _find(self, key: int) -> int:
+        """ Index of chunk key in self.keys, or -1.
+        :complexity: O(log C) where C is the number of chunks
+        """
+        index = bisect_left(self.keys, key)
+        if index < len(self.keys) and self.keys[index] == key:
+            return index
+        return -1
+
+    def __contains__(self, item: int) -> bool:
+        """ True if the set contains the item.
+        :complexity: O(log C + log n) where C is the number of chunks and n the size of the chunk
+        :raises TypeError: if the item is not integer or if not positive.
+        """
+        key, value = self._split(item)
+        index = self._find(key)
+        return index >= 0 and value in self.containers[index]
+
+    def add(self, item: int) -> None:
+        """ Adds an element to the set.
+        :complexity: O(C + n), shifting the chunk list and the array container
+        :raises TypeError: if the item is not integer or if not positive.
+        """
+        key, value = self._split(item)
+        index = bisect_left(self.keys, key)
+        if index < len(self.keys) and self.keys[index] == key:
+            container = self.containers[index]
+            before = len(container)
+            container = container.add(value)
+            self.containers[index] = container
+            self.size += len(container) - before
+        else:
+            self.keys.insert(index, key)
+            self.containers.insert(index, ArrayContainer(array('H', [value])))
+            self.size += 1
+
+    def remove(self, item: int) -> None:
+        """ Removes an element from the set.
+        :complexity: O(C + n), see add
+        :raises TypeError: if the item is not integer or if not positive.
+        :raises KeyError: if the item is not in the set.
+        """
+        key, value = self._split(item)
+        index = self._find(key)
+        if index < 0:
+            raise KeyError(item)
+        try:
+            container = self.containers[index].remove(value)
+        except KeyError:
+            raise KeyError(item)
+        self.size -= 1
+        if container is None:
+            del self.keys[index]
+            del self.containers[index]
+        else:
+            self.containers[index] = container
+
+    def __iter__(self) -> Iterator[int]:
+        """ Iterates over the elements in increasing order.
+        :complexity: O(n + B*2^16/64) where n is the number of elements and B the number of bitmap chunks
+        """
+        for key, container in zip(self.keys, self.containers):
+            base = (key << CHUNK_BITS) + 1
+            for value in container:
+                yield base + value
+
+    def union(self, other: RoaringSet) -> RoaringSet:
+        """ Creates a new set equal to the union with another one.
+        :complexity: O(C1 + C2) chunk steps, each linear in the containers' sizes
+        """
+        keys, containers = [], []
+        i = j = 0
+        while i < len(self.keys) or j < len(other.keys):
+            if j == len(other.keys) or (i < len(self.keys) and self.keys[i] < other.keys[j]):
+                keys.append(self.keys[i])
+                containers.append(self._copy(self.containers[i]))
+                i += 1
+            elif i == len(self.keys) or other.keys[j] < self.keys[i]:
+                keys.append(other.keys[j])
+                containers.append(self._copy(other.containers[j]))
+                j += 1
+            else:
+                keys.append(self.keys[i])
+                containers.append(union_containers(self.containers[i], other.containers[j]))
+                i += 1
+                j += 1
+        return RoaringSet._from_chunks(keys, containers)
+
+    def intersection(self, other: RoaringSet) -> RoaringSet:
+        """ Creates a new set equal to the intersection with another one.
+        Only chunks present in both sets are visited.
+        :complexity: O(C1 + C2) chunk steps, each linear in the smaller container
+        """
+        keys, containers = [], []
+        i = j = 0
+        while i < len(self.keys) and j < len(other.keys):
+            if self.keys[i] < other.keys[j]:
+                i += 1
+            elif other.keys[j] < self.keys[i]:
+                j += 1
+            else:
+                container = intersect_containers(self.containers[i], other.containers[j])
+                if container is not None:
+                    keys.append(self.keys[i])
+                    containers.append(container)
+                i += 1
+                j += 1
+        return RoaringSet._from_chunks(keys, containers)
+
+    def difference(self, other: RoaringSet) -> RoaringSet:
+        """ Creates a new set equal to the difference with another one,
+        i.e. the elements of self that are not in other.
+        :complexity: O(C1 + C2) chunk steps, each linear in the containers' sizes
+        """
+        keys, containers = [], []
+        j = 0
+        for i in range(len(self.keys)):
+            while j < len(other.keys) and other.keys[j] < self.keys[i]:
+                j += 1
+            if j < len(other.keys) and other.keys[j] == self.keys[i]:
+                container = subtract_containers(self.containers[i], other.containers[j])
+            else:
+                container = self._copy(self.containers[i])
+            if container is not None:
+                keys.append(self.keys[i])
+                containers.append(container)
+        return RoaringSet._from_chunks(keys, containers)
+
+    @staticmethod
+    def _copy(container: Union[ArrayContainer, BitmapContainer]) -> Union[ArrayContainer, BitmapContainer]:
+        """ A container the result set can modify without touching its operand.
+        :complexity: O(n) for an array, O(2^16/64) for a bitmap
+        """
+        if isinstance(container, ArrayContainer):
+            return ArrayContainer(array('H', container.values))
+        return BitmapContainer(array('Q', container.words), container.count)
+
+    def __and__(self, other: RoaringSet):
+        return self.intersection(other)
+
+    def __or__(self, other: RoaringSet):
+        return self.union(other)
+
+    def __sub__(self, other: RoaringSet):
+        return self.difference(other)
+
+    def __str__(self):
+        """ Construct a nice string representation. """
+        return '{' + ', '.join(str(item) for item in self) + '}'
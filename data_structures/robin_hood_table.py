@@ -0,0 +1,179 @@
+""" Hash Table ADT
+
+Defines a Hash Table using Robin Hood hashing, a linear probing variant, for conflict resolution.
+"""
+from __future__ import annotations
+
+from array import array
+from typing import TypeVar
+
+from data_structures.compact_hash_table import CompactLinearProbeTable
+from data_structures.hash_table import FullError
+from data_structures.hashing import mix64
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+
+class RobinHoodTable(CompactLinearProbeTable[K, V]):
+    """
+    Robin Hood Table.
+
+    Has the same public API as LinearProbeTable. Each slot also stores the probe distance of its
+    entry, how far it sits from its home position. An insert that meets an entry closer to home
+    than itself takes that slot and carries the displaced entry on, so probe distances stay short
+    and even. Lookups rely on that: a miss stops as soon as it reaches an entry closer to home
+    than the probe, instead of scanning to the end of the cluster. Deletion shifts the rest of
+    the cluster back. This keeps probes short up to a load factor of about 0.85, where the table grows.
+
+    Type Arguments:
+        - K:    Key Type. In most cases should be string.
+                Otherwise `hash` should be overwritten.
+        - V:    Value Type.
+
+    Attributes:
+        key_array (ArrayR[K]): the keys, None marks an empty slot
+        value_array (ArrayR[V]): the value stored with the key in the same slot
+        hash_array (array[int]): the cached hash of the key in the same slot
+        distance_array (array[int]): probe distance of the key in the same slot
+        max_load_factor (float): load factor above which the table grows
+
+    Unless stated otherwise, all methods have O(1) complexity.
+    """
+
+    DEFAULT_MAX_LOAD_FACTOR = 0.85
+
+    def __init__(self, sizes=None, max_load_factor: float = DEFAULT_MAX_LOAD_FACTOR) -> None:
+        """
+        Initialise the Hash Table.
+        """
+        self.max_load_factor = max_load_factor
+        CompactLinearProbeTable.__init__(self, sizes)
+
+    def hash(self, key: K) -> int:
+        """
+        Hash a key into a 64 bit integer: the polynomial hash of CompactLinearProbeTable, mixed so that
+        similar keys get unrelated home positions instead of neighbouring ones.
+
+        :complexity: O(len(key))
+        """
+        return mix64(CompactLinearProbeTable.hash(self, key))
+
+    def _allocate(self, size: int) -> None:
+        """
+        Replace the storage with empty arrays of the given size.
+
+        :complexity: O(size)
+        """
+        CompactLinearProbeTable._allocate(self, size)
+        self.distance_array = array('l', bytes(array('l').itemsize * size))
+
+    def _linear_probe(self, key: K, key_hash: int, is_insert: bool = False) -> int:
+        """
+        Find the position of this key in the hash table.
+        The probe stops at an empty slot or at an entry closer to its home than the probe is to the key's home,
+        as an insert would have taken that slot.
+
+        :complexity best: O(1) first position is empty
+        :complexity worst: O(D*comp(K)) where D is the largest probe distance in the table
+        :raises KeyError: When the key is not in the table.
+        """
+        size = self.table_size
+        position = key_hash % size
+        distance = 0
+        while self.key_array[position] is not None and self.distance_array[position] >= distance:
+            if self.hash_array[position] == key_hash and self.key_array[position] == key:
+                return position
+            position = (position + 1) % size
+            distance += 1
+        raise KeyError(key)
+
+    def _place(self, key: K, data: V, key_hash: int) -> None:
+        """
+        Store a key that is known not to be in the table, taking the slot of the first entry
+        closer to its home than the key and carrying that entry on.
+
+        :complexity best: O(1) home position is empty
+        :complexity worst: O(N) where N is the table size
+        :raises FullError: When the table has no empty slot.
+        """
+        size = self.table_size
+        position = key_hash % size
+        distance = 0
+        for _ in range(size):
+            if self.key_array[position] is None:
+                self.key_array[position] = key
+                self.value_array[position] = data
+                self.hash_array[position] = key_hash
+                self.distance_array[position] = distance
+                return
+            if self.distance_array[position] < distance:
+                # Rob the richer entry: swap it out and carry it on
+                key, self.key_array[position] = self.key_array[position], key
+                data, self.value_array[position] = self.value_array[position], data
+                key_hash, self.hash_array[position] = self.hash_array[position], key_hash
+                distance, self.distance_array[position] = self.distance_array[position], distance
+            position = (position + 1) % size
+            distance += 1
+        raise FullError("Table is full!")
+
+    def __setitem__(self, key: K, data: V) -> None:
+        """
+        Set an (key, value) pair in our hash table.
+        Updating an existing key only overwrites its value slot.
+
+        :complexity: O(hash(key)) plus probe.
+        :raises FullError: when the table is full and cannot be resized further.
+        """
+        key_hash = self.hash(key)
+        try:
+            position = self._linear_probe(key, key_hash)
+        except KeyError:
+            if self.count == self.table_size:
+                raise FullError("Table is full!")
+            self._place(key, data, key_hash)
+            self.count += 1
+            if len(self) > self.table_size * self.max_load_factor:
+                self._rehash()
+        else:
+            self.value_array[position] = data
+
+    def __delitem__(self, key: K) -> None:
+        """
+        Deletes a (key, value) pair in our hash table.
+        Every following entry of the cluster that is not at home moves back one slot.
+
+        :complexity best: O(hash(key)) deleting item is not probed and the next slot is empty.
+        :complexity worst: O(hash(key) + N) deleting item is midway through large cluster.
+        :raises KeyError: when the key doesn't exist.
+        """
+        size = self.table_size
+        hole = self._linear_probe(key, self.hash(key))
+        position = (hole + 1) % size
+        while self.key_array[position] is not None and self.distance_array[position] > 0:
+            self.key_array[hole] = self.key_array[position]
+            self.value_array[hole] = self.value_array[position]
+            self.hash_array[hole] = self.hash_array[position]
+            self.distance_array[hole] = self.distance_array[position] - 1
+            hole = position
+            position = (position + 1) % size
+        self.key_array[hole] = None
+        self.value_array[hole] = None
+        self.count -= 1
+
+    def probe_length(self, key: K) -> int:
+        """
+        Returns the number of slots a lookup of key inspects, whether or not it is in the table.
+
+        :complexity: See _linear_probe.
+        """
+        key_hash = self.hash(key)
+        size = self.table_size
+        position = key_hash % size
+        probes = 1
+        while self.key_array[position] is not None and self.distance_array[position] >= probes - 1:
+            if self.hash_array[position] == key_hash and self.key_array[position] == key:
+                return probes
+            position = (position + 1) % size
+            probes += 1
+        return probes
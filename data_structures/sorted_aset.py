@@ -0,0 +1,248 @@
+"""
+    Sorted array-based implementation of Set ADT.
+"""
+
+from __future__ import annotations
+from typing import Iterable, Iterator
+
+from algorithms.mergesort import mergesort
+from data_structures.set_adt import *
+from data_structures.referential_array import ArrayR
+
+
+def gallop(array: ArrayR[T], item: T, lo: int, hi: int) -> int:
+    """ Returns the first index in array[lo:hi] whose element is not less than item, or hi if there is none.
+    Probes lo + 1, lo + 2, lo + 4, ... until it passes item, then binary searches the last gap,
+    so an answer d places after lo costs O(log d) comparisons rather than O(log(hi - lo)).
+    :pre: array[lo:hi] is sorted
+    :complexity: O(log d * comp(T)) where d is the distance from lo to the answer
+    """
+    if lo >= hi or not array[lo] < item:
+        return lo
+    last = lo
+    offset = 1
+    while lo + offset < hi and array[lo + offset] < item:
+        last = lo + offset
+        offset *= 2
+    low = last + 1
+    high = min(lo + offset, hi)
+    while low < high:
+        mid = (low + high) // 2
+        if array[mid] < item:
+            low = mid + 1
+        else:
+            high = mid
+    return low
+
+
+class SortedASet(Set[T]):
+    """Sorted array-based implementation of the set ADT.
+
+    The elements are kept in increasing order, so membership is a binary search and
+    the set algebra is a merge of the two arrays, which gallops over runs that only
+    one of the sets has. Elements must be comparable with < and ==.
+
+    Attributes:
+         size (int): number of elements in the set
+         array (ArrayR[T]): array storing the elements of the set, array[:size] is sorted
+
+    ArrayR cannot create empty arrays. So default capacity value 1
+    is used to avoid this. The array doubles when it is full.
+    """
+
+    MIN_CAPACITY = 1
+
+    def __init__(self, capacity: int = 1) -> None:
+        """ Initialization. """
+        Set.__init__(self)
+        self.array = ArrayR(max(self.MIN_CAPACITY, capacity))
+
+    @classmethod
+    def from_iterable(cls, items: Iterable[T]) -> SortedASet[T]:
+        """ Creates a set holding the given items, sorting them once instead of inserting them one by one.
+        :complexity: O(n log n * comp(T)) where n is the number of items
+        """
+        ordered = mergesort(list(items))
+        res = cls(len(ordered))
+        for item in ordered:
+            if res.size == 0 or res.array[res.size - 1] != item:
+                res.array[res.size] = item
+                res.size += 1
+        return res
+
+    def __len__(self) -> int:
+        """ Returns the number of elements in the set. """
+        return self.size
+
+    def is_empty(self) -> bool:
+        """ True if the set is empty. """
+        return len(self) == 0
+
+    def clear(self) -> None:
+        """ Makes the set empty. """
+        self.size = 0
+
+    def is_full(self) -> bool:
+        """ True if the array is full, the next add resizes it. """
+        return len(self) == len(self.array)
+
+    def _index_to_add(self, item: T) -> int:
+        """ Find the position of the item, or where it should be placed.
+        :complexity best: O(comp(T)) item is the middle element
+        :complexity worst: O(log n * comp(T)) where n is the size of the set
+        """
+        low = 0
+        high = self.size - 1
+        while low <= high:
+            mid = (low + high) // 2
+            if self.array[mid] == item:
+                return mid
+            elif self.array[mid] < item:
+                low = mid + 1
+            else:
+                high = mid - 1
+        return low
+
+    def __contains__(self, item: T) -> bool:
+        """ True if the set contains the item.
+        :complexity: O(log n * comp(T)) where n is the size of the set
+        """
+        index = self._index_to_add(item)
+        return index < self.size and self.array[index] == item
+
+    def _resize(self) -> None:
+        """ Doubles the capacity of the array.
+        :complexity: O(n) where n is the size of the set
+        """
+        new_array = ArrayR(2 * len(self.array))
+        for i in range(self.size):
+            new_array[i] = self.array[i]
+        self.array = new_array
+
+    def add(self, item: T) -> None:
+        """ Adds an element to the set. Note that an element already
+        present in the set should not be added.
+        :complexity: O(log n * comp(T) + n) where n is the size of the set, to shift the larger elements
+        """
+        index = self._index_to_add(item)
+        if index < self.size and self.array[index] == item:
+            return
+        if self.is_full():
+            self._resize()
+        for i in range(self.size, index, -1):
+            self.array[i] = self.array[i - 1]
+        self.array[index] = item
+        self.size += 1
+
+    def remove(self, item: T) -> None:
+        """ Removes an element from the set.
+        :pre: the element should be present in the set
+        :complexity: O(log n * comp(T) + n) where n is the size of the set
+        :raises KeyError: if no such element is found.
+        """
+        index = self._index_to_add(item)
+        if index == self.size or self.array[index] != item:
+            raise KeyError(item)
+        for i in range(index, self.size - 1):
+            self.array[i] = self.array[i + 1]
+        self.size -= 1
+        self.array[self.size] = None
+
+    def _append_run(self, source: ArrayR[T], start: int, stop: int) -> None:
+        """ Appends source[start:stop], all larger than the current elements, to a set with room for them. """
+        for i in range(start, stop):
+            self.array[self.size] = source[i]
+            self.size += 1
+
+    def union(self, other: SortedASet[T]) -> SortedASet[T]:
+        """ Creates a new set equal to the union with another one,
+        i.e. the result set should contains the elements of self and other.
+        :complexity: O((n + m) * comp(T)) where n and m are the sizes of the sets
+        """
+        res = SortedASet(len(self) + len(other))
+        i = j = 0
+        while i < self.size and j < other.size:
+            mine, theirs = self.array[i], other.array[j]
+            if mine == theirs:
+                res.array[res.size] = mine
+                res.size += 1
+                i += 1
+                j += 1
+            elif mine < theirs:
+                stop = gallop(self.array, theirs, i, self.size)
+                res._append_run(self.array, i, stop)
+                i = stop
+            else:
+                stop = gallop(other.array, mine, j, other.size)
+                res._append_run(other.array, j, stop)
+                j = stop
+        res._append_run(self.array, i, self.size)
+        res._append_run(other.array, j, other.size)
+        return res
+
+    def intersection(self, other: SortedASet[T]) -> SortedASet[T]:
+        """ Creates a new set equal to the intersection with another one,
+        i.e. the result set should contain the elements that are both in
+        self *and* other.
+        Each element of the smaller set gallops forward through the larger one.
+        :complexity: O(m log(n/m) * comp(T)) where m is the size of the smaller set and n of the larger
+        """
+        small, large = (self, other) if len(self) <= len(other) else (other, self)
+        res = SortedASet(len(small))
+        j = 0
+        for i in range(small.size):
+            item = small.array[i]
+            j = gallop(large.array, item, j, large.size)
+            if j == large.size:
+                break
+            if large.array[j] == item:
+                res.array[res.size] = item
+                res.size += 1
+                j += 1
+        return res
+
+    def difference(self, other: SortedASet[T]) -> SortedASet[T]:
+        """ Creates a new set equal to the difference with another one,
+        i.e. the result set should contain the elements of self that
+        *are not* in other.
+        :complexity: O((n + m) * comp(T)) where n and m are the sizes of the sets,
+            less when long runs of one set fall between two elements of the other
+        """
+        res = SortedASet(len(self))
+        i = j = 0
+        while i < self.size and j < other.size:
+            item = self.array[i]
+            j = gallop(other.array, item, j, other.size)
+            if j == other.size:
+                break
+            if other.array[j] == item:
+                i += 1
+                j += 1
+            else:
+                # Everything of self below other.array[j] is not in other
+                stop = gallop(self.array, other.array[j], i, self.size)
+                res._append_run(self.array, i, stop)
+                i = stop
+        res._append_run(self.array, i, self.size)
+        return res
+
+    def __iter__(self) -> Iterator[T]:
+        """ Iterates over the elements in increasing order. """
+        for i in range(self.size):
+            yield self.array[i]
+
+    def __and__(self, other: SortedASet[T]) -> SortedASet[T]:
+        return self.intersection(other)
+
+    def __or__(self, other: SortedASet[T]) -> SortedASet[T]:
+        return self.union(other)
+
+    def __sub__(self, other: SortedASet[T]) -> SortedASet[T]:
+        return self.difference(other)
+
+    def __str__(self):
+        """ Magic method constructing a string representation of the list object. """
+        elems = []
+        for i in range(len(self)):
+            elems.append(str(self.array[i]) if type(self.array[i]) != str else "'{0}'".format(self.array[i]))
+        return '{' + ', '.join(elems) + '}'
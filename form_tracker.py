@@ -0,0 +1,142 @@
+"""
+Fixed-capacity record of a team's most recent results.
+
+The last K results live in a circular `array('b')` of GameResult values, with a running
+points total, so recording a game never allocates and "points from the last K games" is
+a single read.
+"""
+from __future__ import annotations
+from array import array
+from typing import Iterator, Union
+
+from constants import GameResult
+from data_structures.referential_array import ArrayR
+
+
+class FormTracker:
+    """
+    Ring buffer of the last `capacity` GameResults, oldest first.
+
+    Usage:
+    ```
+    form = FormTracker(5)
+    form.push(GameResult.WIN)
+    form.points()                   # 3
+    [result for result in form]     # [GameResult.WIN]
+    ```
+
+    Attributes:
+        results (array[int]): GameResult values, results[(start + i) % capacity] is the i-th oldest
+        start (int): slot of the oldest result
+        count (int): number of results held, at most capacity
+        total (int): sum of the points of the results held
+    """
+
+    DEFAULT_CAPACITY = 5
+
+    # GameResult value -> GameResult, so reading a slot does not go through the Enum constructor.
+    BY_VALUE = (GameResult.LOSS, GameResult.DRAW, None, GameResult.WIN)
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        """
+        Raises:
+            ValueError: If capacity is not positive.
+
+        Complexity:
+            Best/Worst Case Complexity: O(K) where K is capacity
+        """
+        if capacity <= 0:
+            raise ValueError("A form tracker needs room for at least one result")
+        self.results = array('b', bytes(capacity))
+        self.start = 0
+        self.count = 0
+        self.total = 0
+
+    @property
+    def capacity(self) -> int:
+        return len(self.results)
+
+    def __len__(self) -> int:
+        """ Returns the number of results held. """
+        return self.count
+
+    def is_full(self) -> bool:
+        return self.count == len(self.results)
+
+    def push(self, result: GameResult) -> None:
+        """
+        Records the newest result, dropping the oldest one when full.
+
+        Complexity:
+            Best/Worst Case Complexity: O(1)
+        """
+        capacity = len(self.results)
+        if self.count == capacity:
+            self.total -= self.results[self.start]
+            self.results[self.start] = result
+            self.start = (self.start + 1) % capacity
+        else:
+            self.results[(self.start + self.count) % capacity] = result
+            self.count += 1
+        self.total += result
+
+    def points(self) -> int:
+        """
+        Returns the points earned over the results held.
+
+        Complexity:
+            Best/Worst Case Complexity: O(1)
+        """
+        return self.total
+
+    def __getitem__(self, index: int) -> GameResult:
+        """
+        Returns the index-th oldest result.
+
+        Raises:
+            IndexError: If index is not in 0..len(self)-1.
+
+        Complexity:
+            Best/Worst Case Complexity: O(1)
+        """
+        if index < 0 or index >= self.count:
+            raise IndexError("Form index out of range")
+        return FormTracker.BY_VALUE[self.results[(self.start + index) % len(self.results)]]
+
+    def __iter__(self) -> Iterator[GameResult]:
+        """
+        Iterates over the results, oldest first, without copying them.
+
+        Complexity:
+            Best/Worst Case Complexity: O(1) per result
+        """
+        results = self.results
+        capacity = len(results)
+        for i in range(self.count):
+            yield FormTracker.BY_VALUE[results[(self.start + i) % capacity]]
+
+    def to_array(self) -> Union[ArrayR[GameResult], None]:
+        """
+        Returns the results as an ArrayR, oldest first, or None if there are none.
+
+        Complexity:
+            Best/Worst Case Complexity: O(K) where K is len(self)
+        """
+        if self.count == 0:
+            return None
+        output = ArrayR(self.count)
+        for index, result in enumerate(self):
+            output[index] = result
+        return output
+
+    def clear(self) -> None:
+        """ Forget every result. """
+        self.start = 0
+        self.count = 0
+        self.total = 0
+
+    def __str__(self) -> str:
+        return "Form [" + ", ".join(result.name for result in self) + "]"
+
+    def __repr__(self) -> str:
+        return str(self)
@@ -50,7 +50,7 @@ class HashyPerfectionTable(Generic[K, V]):
         """
         res = ArrayR(len(self.array))
         i = 0
-        for x in range(len(self)):
+        for x in range(len(self.array)):
             if self.array[x] is not None:
                 res[i] = self.array[x][0]
                 i += 1
@@ -63,37 +63,58 @@ class HashyPerfectionTable(Generic[K, V]):
         """
         res = ArrayR(len(self.array))
         i = 0
-        for x in range(len(self)):
+        for x in range(len(self.array)):
             if self.array[x] is not None:
                 res[i] = self.array[x][1]
                 i += 1
         return res
 
+    def probe_index(self, key: K) -> int:
+        """
+        Returns the position of the key in the table, or -1 if it is not there. Never raises.
+        A slot holding a different key, which the hash also sends here, does not count as a match.
+        Complexity:
+        Best Case Complexity: O(hash)
+        Worst Case Complexity: O(hash + comp(K))
+        """
+        position: int = self.hash(key)
+        item = self.array[position]
+        if item is None or item[0] != key:
+            return -1
+        return position
+
+    def get(self, key: K, default: Union[V, None] = None) -> Union[V, None]:
+        """
+        Returns the value of the key, or default if it is not in the table.
+        Complexity:
+        Best Case Complexity: O(probe_index)
+        Worst Case Complexity: O(probe_index)
+        """
+        position = self.probe_index(key)
+        if position < 0:
+            return default
+        return self.array[position][1]
+
     def __contains__(self, key: K) -> bool:
         """
         Checks to see if the given key is in the Hash Table
         Complexity:
-        Best Case Complexity: O(self[key])
-        Worst Case Complexity: O(self[key])
+        Best Case Complexity: O(probe_index)
+        Worst Case Complexity: O(probe_index)
         """
-        try:
-            _ = self[key]
-        except KeyError:
-            return False
-        else:
-            return True
+        return self.probe_index(key) >= 0
 
     def __getitem__(self, key: K) -> V:
         """
         Get the value at a certain key
         Complexity:
-        Best Case Complexity: O(hash)
-        Worst Case Complexity: O(hash)
+        Best Case Complexity: O(probe_index)
+        Worst Case Complexity: O(probe_index)
         Raises:
         KeyError: When the key doesn't exist.
         """
-        position: int = self.hash(key)
-        if self.array[position] is None:
+        position = self.probe_index(key)
+        if position < 0:
             raise KeyError(f"{key} not found")
         return self.array[position][1]
 
@@ -122,7 +143,9 @@ class HashyPerfectionTable(Generic[K, V]):
         Raises:
         KeyError: When the key doesn't exist.
         """
-        position: int = self.hash(key)
+        position = self.probe_index(key)
+        if position < 0:
+            raise KeyError(f"{key} not found")
         self.array[position] = None
         self.count -= 1
 
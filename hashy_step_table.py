@@ -5,8 +5,9 @@ from __future__ import annotations
 __author__ = 'Jackson Goerner'
 __since__ = '07/02/2023'
 
+from data_structures.bloom_filter import BloomFilter
 from data_structures.referential_array import ArrayR
-from typing import Generic, TypeVar, Union
+from typing import Generic, Iterable, TypeVar, Union
 
 K = TypeVar('K')
 V = TypeVar('V')
@@ -31,9 +32,16 @@ class HashyStepTable(Generic[K, V]):
 
     HASH_BASE = 31
 
-    def __init__(self, sizes=None) -> None:
+    # Marks a slot whose entry was deleted. Compared by identity, so no real key can clash with it.
+    TOMBSTONE = ('$', None)
+
+    # Fraction of the table that may hold tombstones before it is compacted in place.
+    DEFAULT_TOMBSTONE_RATIO = 0.25
+
+    def __init__(self, sizes=None, tombstone_ratio: float = DEFAULT_TOMBSTONE_RATIO, bloom_filter: bool = False) -> None:
         """
         Initialise the Hash Table.
+        With bloom_filter, lookups of absent keys are mostly turned away by a BloomFilter before probing.
         Complexity:
         Best Case Complexity: O(max(N, M)) where N is the length of TABLE_SIZES and M is the length of sizes.
         Worst Case Complexity: O(max(N, M)) where N is the length of TABLE_SIZES and M is the length of sizes.
@@ -44,6 +52,55 @@ class HashyStepTable(Generic[K, V]):
         self.array: ArrayR[Union[tuple[K, V], None]] = ArrayR(self.TABLE_SIZES[self.size_index])
         self.count = 0
         self.dels = 0
+        self.tombstone_ratio = tombstone_ratio
+        self.bloom_filter: Union[BloomFilter, None] = None
+        self.bloom_stale = 0
+        if bloom_filter:
+            self._rebuild_bloom_filter()
+        self.reset_probe_stats()
+
+    @classmethod
+    def from_items(cls, items: Iterable[tuple[K, V]], expected_size: Union[int, None] = None, sizes=None,
+                   tombstone_ratio: float = DEFAULT_TOMBSTONE_RATIO, bloom_filter: bool = False) -> HashyStepTable[K, V]:
+        """
+        Creates a table holding the given (key, value) pairs, see update_many.
+        Complexity:
+        Best Case Complexity: O(update_many)
+        Worst Case Complexity: O(update_many)
+        """
+        table = cls(sizes, tombstone_ratio, bloom_filter)
+        table.update_many(items, expected_size)
+        return table
+
+    def update_many(self, items: Iterable[tuple[K, V]], expected_size: Union[int, None] = None) -> None:
+        """
+        Set every (key, value) pair of items, later pairs overwriting earlier ones with the same key.
+        The table first grows, at most once, to the smallest size that holds len(self) + expected_size
+        keys, so the pairs go in without a rehash. expected_size defaults to the number of items.
+        Complexity:
+        Best Case Complexity: O(T + N*hash(K)) where T is the table size picked and N is len(self) + the number of items, no probing
+        Worst Case Complexity: O(T + N*(hash(K) + T*comp(K))) lots of probing
+        """
+        if expected_size is None:
+            items = list(items)
+            expected_size = len(items)
+        self._reserve(len(self) + expected_size)
+        for key, value in items:
+            self[key] = value
+
+    def _reserve(self, total: int) -> None:
+        """
+        Grow to the smallest table size that holds total keys without a rehash.
+        Complexity:
+        Best Case Complexity: O(1) when the table is already large enough
+        Worst Case Complexity: O(_reinsert)
+        """
+        size_index = self.size_index
+        while size_index + 1 < len(self.TABLE_SIZES) and total > self.TABLE_SIZES[size_index] * 2 / 3:
+            size_index += 1
+        if size_index > self.size_index:
+            self.size_index = size_index
+            self._reinsert(ArrayR(self.TABLE_SIZES[self.size_index]))
 
     def hash(self, key: K) -> int:
         """
@@ -86,15 +143,18 @@ class HashyStepTable(Generic[K, V]):
         """
         return self.count
 
-    def _hashy_probe(self, key: K, is_insert: bool) -> int:
+    def _hashy_probe(self, key: K, is_insert: bool, record: bool = True) -> int:
         """
         Find the correct position for this key in the hash table using hashy probing.
+        Tombstones are stepped over while searching. When inserting a new key, the first
+        tombstone on its probe sequence is reused. The probe is only added to the probe
+        statistics if record is True, so internal reinserts do not skew them.
         Raises:
         KeyError: When the key is not in the table, but is_insert is False.
         FullError: When a table is full and cannot be inserted.
         Complexity:
-        Best Case Complexity: O(1) when table is full
-        Worst Case Complexity: O(N) where N is the number of collisions that occur until the correct index to insert is found/returned
+        Best Case Complexity: O(hash(key)) when the first position is empty or holds the key
+        Worst Case Complexity: O(hash(key) + N*comp(K)) where N is the table size, when every slot is probed
         """
         # Initial position
         position = self.hash(key)
@@ -102,21 +162,110 @@ class HashyStepTable(Generic[K, V]):
         # Step size
         step = self.hash2(key)
 
-        if is_insert and self.is_full():
-            raise FullError("table is full")
-        
-        while True:
-            if self.array[position] is None: #no element at position
+        first_tombstone = None
+        for probes in range(1, self.table_size + 1):
+            item = self.array[position]
+            if item is None: #no element at position
+                if record:
+                    self._record_probe(probes)
                 if is_insert:
-                    return position
+                    return position if first_tombstone is None else first_tombstone
                 else:
                     raise KeyError(key) # check finds no element with that key
-            
-            elif self.array[position][0] == key: #item associated with key is being updated
+
+            elif item is self.TOMBSTONE: #deleted element, the key may still be further along
+                if is_insert and first_tombstone is None:
+                    first_tombstone = position
+
+            elif item[0] == key: #item associated with key is being updated
+                if record:
+                    self._record_probe(probes)
+                return position
+
+            #collision handling
+            position = (position + step) % self.table_size #takes a step forward based upon the value of the key to avoid clustering.
+
+        if record:
+            self._record_probe(self.table_size)
+        if is_insert and first_tombstone is not None:
+            return first_tombstone
+        if is_insert:
+            raise FullError("table is full")
+        raise KeyError(key)
+
+    def probe_index(self, key: K) -> int:
+        """
+        Returns the position of the key in the table, or -1 if it is not there. Never raises.
+        Complexity:
+        Best Case Complexity: O(len(key)) when the Bloom filter rejects the key
+        Worst Case Complexity: O(hash(key) + N*comp(K)) where N is the table size, when every slot is probed
+        """
+        if self.bloom_filter is not None and key not in self.bloom_filter:
+            return -1
+
+        position = self.hash(key)
+        step = self.hash2(key)
+        for probes in range(1, self.table_size + 1):
+            item = self.array[position]
+            if item is None:
+                self._record_probe(probes)
+                return -1
+            elif item is not self.TOMBSTONE and item[0] == key:
+                self._record_probe(probes)
                 return position
-            
-            else: #collision handling
-                position = (position + step) % self.table_size #takes a step forward based upon the value of the key to avoid clustering.
+            position = (position + step) % self.table_size
+
+        self._record_probe(self.table_size)
+        return -1
+
+    def get(self, key: K, default: Union[V, None] = None) -> Union[V, None]:
+        """
+        Returns the value of the key, or default if it is not in the table.
+        :complexity: See probe_index.
+        """
+        position = self.probe_index(key)
+        if position < 0:
+            return default
+        return self.array[position][1]
+
+    def _rebuild_bloom_filter(self) -> None:
+        """
+        Replace the Bloom filter with one sized for the most live entries the table can hold
+        before it grows, and add the live keys to it.
+        Complexity:
+        Best Case Complexity: O(N + len(self)*len(key)) where N is the table size
+        Worst Case Complexity: O(N + len(self)*len(key)) where N is the table size
+        """
+        self.bloom_filter = BloomFilter(self.table_size * 2 // 3 + 1)
+        self.bloom_stale = 0
+        for item in self.array:
+            if item is not None and item is not self.TOMBSTONE:
+                self.bloom_filter.add(item[0])
+
+    def _record_probe(self, probes: int) -> None:
+        """
+        Add one probe sequence of the given length to the probe statistics.
+        """
+        self.probe_operations += 1
+        self.probe_total += probes
+        if probes > self.probe_max:
+            self.probe_max = probes
+
+    def reset_probe_stats(self) -> None:
+        """
+        Reset the probe statistics.
+        """
+        self.probe_operations = 0
+        self.probe_total = 0
+        self.probe_max = 0
+
+    def average_probe_length(self) -> float:
+        """
+        Returns the average number of slots inspected per probe since the statistics were last reset.
+        """
+        if self.probe_operations == 0:
+            return 0.0
+        return self.probe_total / self.probe_operations
 
     def keys(self) -> list[K]:
         """
@@ -125,7 +274,7 @@ class HashyStepTable(Generic[K, V]):
         """
         res = []
         for x in range(self.table_size):
-            if self.array[x] is not None:
+            if self.array[x] is not None and self.array[x] is not self.TOMBSTONE:
                 res.append(self.array[x][0])
         return res
 
@@ -136,90 +285,131 @@ class HashyStepTable(Generic[K, V]):
         """
         res = []
         for x in range(self.table_size):
-            if self.array[x] is not None:
+            if self.array[x] is not None and self.array[x] is not self.TOMBSTONE:
                 res.append(self.array[x][1])
         return res
 
     def __contains__(self, key: K) -> bool:
         """
         Checks to see if the given key is in the Hash Table
-        :complexity: See hashy probe.
+        :complexity: See probe_index.
         """
-        try:
-            _ = self[key]
-        except KeyError:
-            return False
-        else:
-            return True
+        return self.probe_index(key) >= 0
 
     def __getitem__(self, key: K) -> V:
         """
         Get the value at a certain key
-        :complexity: See hashy probe.
+        :complexity: See probe_index.
         :raises KeyError: when the key doesn't exist.
         """
-        position = self._hashy_probe(key, False)
+        position = self.probe_index(key)
+        if position < 0:
+            raise KeyError(key)
         return self.array[position][1]
 
     def __setitem__(self, key: K, data: V) -> None:
         """
         Set an (key, value) pair in our hash table.
+        The table grows once more than 2/3 of it holds live entries, and is compacted
+        in place once live entries and tombstones together pass 2/3.
         :complexity: See hashy probe.
         :raises FullError: when the table cannot be resized further.
         """
     
         position = self._hashy_probe(key, True)
 
-        if self.array[position] == None:
+        if self.array[position] is None or self.array[position] is self.TOMBSTONE:
+            if self.array[position] is self.TOMBSTONE:
+                self.dels -= 1
             self.count += 1
-            
+            if self.bloom_filter is not None:
+                self.bloom_filter.add(key)
+
         self.array[position] = (key, data)
 
         if len(self) > self.table_size * 2 / 3:
-            
             self._rehash()
+        elif len(self) + self.dels > self.table_size * 2 / 3:
+            self._compact()
 
     def __delitem__(self, key: K) -> None:
         """
-        Deletes a (key, value) using lazy deletion
+        Deletes a (key, value) using lazy deletion.
+        The table is compacted in place once tombstones fill more than tombstone_ratio of it.
         Complexity:
-        Best Case Complexity:
-        Worst Case Complexity:
+        Best Case Complexity: O(hash probe) when no compaction is needed
+        Worst Case Complexity: O(hash probe + N*hash probe) where N is the table size, when the table is compacted
         """
 
         position = self._hashy_probe(key, False)
-        self.array[position] = ('$', None)
+        self.array[position] = self.TOMBSTONE
         self.count -= 1
         self.dels += 1
 
+        if self.dels > self.table_size * self.tombstone_ratio:
+            self._compact()
+        elif self.bloom_filter is not None:
+            # The filter cannot forget the key, so it is rebuilt once stale keys outnumber live ones
+            self.bloom_stale += 1
+            if self.bloom_stale > self.count:
+                self._rebuild_bloom_filter()
+
     def is_empty(self) -> bool:
         return self.count == 0
 
     def is_full(self) -> bool:
         return self.count == self.table_size
 
+    def tombstone_load(self) -> float:
+        """
+        Returns the fraction of the table taken up by tombstones.
+        """
+        return self.dels / self.table_size
+
     def _rehash(self) -> None:
         """
-        Need to resize table and reinsert all values
+        Need to resize table and reinsert all values.
+        If the table cannot grow any further it is compacted instead.
         Complexity:
-        Best Case Complexity:
-        Worst Case Complexity:
+        Best Case Complexity: O(N*hash(K)) where N is len(self), no probing
+        Worst Case Complexity: O(N*(hash(K) + M*comp(K))) where M is the new table size, lots of probing
         """
-        if self.size_index == len(self.TABLE_SIZES): #max table size
+        if self.size_index == len(self.TABLE_SIZES) - 1: #max table size
+            self._compact()
             return
-        
-        old_array = self.array
+
         self.size_index += 1
-        self.array = ArrayR(self.TABLE_SIZES[self.size_index])
+        self._reinsert(ArrayR(self.TABLE_SIZES[self.size_index]))
+
+    def _compact(self) -> None:
+        """
+        Clear every tombstone by reinserting the live entries into a fresh array of the same size.
+        Complexity:
+        Best Case Complexity: O(N*hash(K)) where N is the table size, no probing
+        Worst Case Complexity: O(N*(hash(K) + N*comp(K))) lots of probing
+        """
+        if self.dels == 0:
+            return
+        self._reinsert(ArrayR(self.table_size))
+
+    def _reinsert(self, new_array: ArrayR) -> None:
+        """
+        Move every live entry into new_array, dropping the tombstones.
+        The reinserts are not counted in the probe statistics.
+        The Bloom filter, if any, is rebuilt for the new array.
+        """
+        old_array = self.array
+        self.array = new_array
         self.count = 0
+        self.dels = 0
 
         for pair in old_array:
-            if pair is not None:
-                key, value = pair
-                if key != '$': #check if sentinel delete has been performed
-                    self[key] = value
-        
+            if pair is not None and pair is not self.TOMBSTONE: #check if sentinel delete has been performed
+                self.array[self._hashy_probe(pair[0], True, record=False)] = pair
+                self.count += 1
 
+        if self.bloom_filter is not None:
+            self._rebuild_bloom_filter()
 
     def __str__(self) -> str:
         """
@@ -229,7 +419,7 @@ class HashyStepTable(Generic[K, V]):
         """
         result = ""
         for item in self.array:
-            if item is not None:
+            if item is not None and item is not self.TOMBSTONE:
                 (key, value) = item
                 result += "(" + str(key) + "," + str(value) + ")\n"
         return result
\ No newline at end of file
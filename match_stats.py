@@ -0,0 +1,128 @@
+"""
+Per-player event counts for simulated games.
+
+Turns the name arrays of one or more GameSimulator result tables into a
+player name -> counts table in a single pass, so applying a game to the players
+no longer scans every event array once per player.
+"""
+from __future__ import annotations
+from array import array
+from typing import Iterable, Union
+
+from constants import PlayerStats, ResultStats
+from data_structures.compact_hash_table import CompactLinearProbeTable
+from data_structures.hash_table import LinearProbeTable
+from player import Player
+
+
+class MatchStatsAccumulator:
+    """
+    Counts goals, assists, tackles and interceptions per player name.
+
+    Results can be added from any number of games, so the same accumulator can
+    collect a single match (for Season.simulate_season) or a whole season (for awards
+    or exports).
+
+    Usage:
+    ```
+    accumulator = MatchStatsAccumulator()
+    accumulator.add_result(GameSimulator.simulate(home_team, away_team))
+    accumulator.apply(home_team.get_players())
+    accumulator.get_count("Lisa Roberto", PlayerStats.GOALS)
+    ```
+    """
+
+    # Result table key -> the player stat it counts towards. The position is the slot in each counts array.
+    EVENTS = (
+        (ResultStats.GOAL_SCORERS, PlayerStats.GOALS),
+        (ResultStats.GOAL_ASSISTS, PlayerStats.ASSISTS),
+        (ResultStats.TACKLES, PlayerStats.TACKLES),
+        (ResultStats.INTERCEPTIONS, PlayerStats.INTERCEPTIONS),
+    )
+
+    def __init__(self) -> None:
+        """
+        Complexity:
+            Best/Worst Case Complexity: O(1)
+        """
+        self.counts: CompactLinearProbeTable[str, array] = CompactLinearProbeTable()
+        self.games = 0
+
+    def __len__(self) -> int:
+        """ Returns the number of players with at least one event. """
+        return len(self.counts)
+
+    def clear(self) -> None:
+        """ Forget every counted event. """
+        self.counts = CompactLinearProbeTable()
+        self.games = 0
+
+    def add_result(self, result_table: Union[CompactLinearProbeTable, LinearProbeTable]) -> None:
+        """
+        Counts every event of a GameSimulator result table.
+
+        Args:
+            result_table (Union[CompactLinearProbeTable, LinearProbeTable]): A table returned by GameSimulator.simulate.
+
+        Complexity:
+            Best Case Complexity: O(1) when the game had no events
+            Worst Case Complexity: O(E * hash(name)) where E is the number of events in the game,
+                plus the probing cost of the counts table
+        """
+        for slot, (result_stat, _) in enumerate(self.EVENTS):
+            names = result_table[result_stat.value]
+            if names is None:
+                continue
+            for name in names:
+                if name is None:
+                    continue
+                if name in self.counts:
+                    counts = self.counts[name]
+                else:
+                    counts = array('q', bytes(8 * len(self.EVENTS)))
+                    self.counts[name] = counts
+                counts[slot] += 1
+        self.games += 1
+
+    def get_count(self, name: str, statistic: PlayerStats) -> int:
+        """
+        Returns how many times a player was recorded for a statistic.
+
+        Raises:
+            KeyError: If the statistic is not counted by the accumulator.
+
+        Complexity:
+            Best/Worst Case Complexity: O(hash(name)) plus the probing cost of the counts table
+        """
+        for slot, (_, player_stat) in enumerate(self.EVENTS):
+            if player_stat == statistic:
+                if name not in self.counts:
+                    return 0
+                return self.counts[name][slot]
+        raise KeyError(statistic)
+
+    def apply(self, players: Union[Iterable[Player], None], games_played: Union[int, None] = None) -> None:
+        """
+        Adds the counted events, and the number of games, to each player.
+
+        Args:
+            players (Iterable[Player]): The players to update; None is treated as no players.
+            games_played (Union[int, None]): Games to add to each player, defaults to the number of results added.
+
+        Complexity:
+            Best/Worst Case Complexity: O(P * hash(name)) where P is the number of players,
+                plus the probing cost of the counts table
+        """
+        if players is None:
+            return
+        if games_played is None:
+            games_played = self.games
+
+        for player in players:
+            player[PlayerStats.GAMES_PLAYED] += games_played
+            if player.get_name() not in self.counts:
+                continue
+            counts = self.counts[player.get_name()]
+            for slot, (_, player_stat) in enumerate(self.EVENTS):
+                if counts[slot]:
+                    player[player_stat] += counts[slot]
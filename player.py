@@ -1,12 +1,21 @@
 from __future__ import annotations
 from constants import PlayerPosition, PlayerStats
 from data_structures.hash_table import LinearProbeTable
-from data_structures.referential_array import ArrayR
-from hashy_perfection_table import HashyPerfectionTable
+from stat_vector import StatVector
 
 
 class Player:
 
+    # Stats that weight the GameSimulator draws. Changing one invalidates every CumulativeWeights index.
+    WEIGHTING_STATS = (PlayerStats.STAR_SKILL.value, PlayerStats.WEAK_FOOT_ABILITY.value,
+                       PlayerStats.WEIGHT.value, PlayerStats.HEIGHT.value)
+
+    # StatVector slots of WEIGHTING_STATS.
+    WEIGHTING_SLOTS = frozenset(map(StatVector.layout_of(PlayerStats).__getitem__, WEIGHTING_STATS))
+
+    # Bumped whenever any player's weighting stat changes.
+    weights_version = 0
+
     def __init__(self, name: str, position: PlayerPosition, age: int) -> None:
         """
         Constructor for the Player class
@@ -34,13 +43,8 @@ class Player:
         self.name = name
         self.position = position
         self.age = age
-        self.statistics = HashyPerfectionTable() #still needs to be swapped with one of the custom hash tables
-            
-        for stat in PlayerStats:
-            if stat.value == "Last Five Results":
-                self.statistics[stat.value] = ArrayR(5)
-            else:
-                self.statistics[stat.value] = 0
+        #one slot per PlayerStats member, all starting at 0
+        self.statistics = StatVector(PlayerStats)
             
 
     def reset_stats(self) -> None:
@@ -54,11 +58,9 @@ class Player:
             Best Case Complexity: O(N) where N is the number of stats in PlayerStats class. ie len(PlayerStats)
             Worst Case Complexity: O(N) where N is the number of stats in PlayerStats class. ie len(PlayerStats)
         """       
-        for stat in PlayerStats:
-            if stat.value == "Last Five Results":
-                self.statistics[stat.value] = ArrayR(5)
-            else:
-                self.statistics[stat.value] = 0
+        self.statistics.reset()
+        #the weighting stats may have changed
+        Player.weights_version += 1
 
     def get_name(self) -> str:
         """
@@ -107,20 +109,23 @@ class Player:
         updates the value of the statistic passed as  statistic.
 
         Args:
-            statistic (PlayerStat): The key of the stat
+            statistic (PlayerStat): The key of the stat, or its value
             value (int): The value of the stat
 
         Returns:
             None
 
         Complexity:
-            Best Case Complexity: O(1) Setting an key value pair in a Hash table has constant complexity
-            Worst Case Complexity: O(1) Setting an key value pair in a Hash table has constant complexity
+            Best Case Complexity: O(1) the stat is written straight to its StatVector slot
+            Worst Case Complexity: O(1) ^ same as best case
         """
-        if type(statistic) == PlayerStats:
-            statistic = statistic.value
-            
-        self.statistics[statistic] = value
+        slot = self.statistics.slot(statistic)
+        values = self.statistics.values
+
+        if slot in Player.WEIGHTING_SLOTS and values[slot] != value:
+            Player.weights_version += 1
+
+        values[slot] = value
 
     def __getitem__(self, statistic: PlayerStats) -> int:
         """
@@ -128,16 +133,16 @@ class Player:
         returns the value of the statistic passed as  key. 
 
         Args:
-            statistic (PlayerStat): The key of the stat
+            statistic (PlayerStat): The key of the stat, or its value
 
         Returns:
             int: The value of the stat
 
         Complexity:
-            Best Case Complexity: Returning a value from a Hash table has a constant time complexity
-            Worst Case Complexity: Returning a value from a Hash table has a constant time complexity
+            Best Case Complexity: O(1) the stat is read straight from its StatVector slot
+            Worst Case Complexity: O(1) ^ same as best case
         """
-        return self.statistics[statistic.value]
+        return self.statistics[statistic]
 
     def __str__(self) -> str:
         """
@@ -1,9 +1,11 @@
 """
 Random number generator class. Uses LCG method with some reasonable initialisation.
 """
+from __future__ import annotations
 __author__ = "Jackson Goerner"
 
 import time
+from array import array
 
 
 class RandomGen:
@@ -18,6 +20,8 @@ class RandomGen:
     RandomGen.random()           # Random number from 0 to 2^32-1
     RandomGen.randint(1, 10)     # Random number from 1 to 10
     RandomGen.random_chance(0.33) # True 33% of the time, False 67% of the time.
+    RandomGen.random_block(1000)  # The next 1000 random() values as an array('Q')
+    RandomGen.skip(10**9)         # Jump over the next billion random() values in O(log) time
     ```
     """
 
@@ -39,6 +43,25 @@ class RandomGen:
         cls.seed = (cls.A * cls.seed + cls.C) % cls.MOD
         return cls.seed >> 16
 
+    @classmethod
+    def random_block(cls, n: int) -> array:
+        """
+        Returns the next `n` draws as an array('Q'), identical to `n` successive calls to `random`.
+        :complexity: O(n)
+        """
+        block, cls.seed = _lcg_block(cls.seed, n, cls.A, cls.C, cls.MOD)
+        return block
+
+    @classmethod
+    def skip(cls, k: int) -> None:
+        """
+        Advances the generator as if `random` had been called `k` times.
+        :complexity: O(log(k))
+        """
+        if k < 0:
+            raise ValueError("Cannot skip backwards.")
+        cls.seed = _lcg_jump(cls.seed, k, cls.A, cls.C, cls.MOD)
+
     @classmethod
     def random_float(cls) -> float:
         """Returns a random floating point integer in the range 0 to 1."""
@@ -65,8 +88,93 @@ class RandomGen:
         Randomly shuffles a collection that supports __getitem__, __setitem__ and __len__
         :complexity: O(len(collection))
         """
-        positions = [(RandomGen.random(), i) for i in range(len(collection))]
+        positions = [(cls.random(), i) for i in range(len(collection))]
         positions.sort() # I can use inbuilt list sorting here - YOU CANNOT ANYWHERE ELSE! >:D
         tmp = [collection[p[1]] for p in positions]
         for x in range(len(collection)):
             collection[x] = tmp[x]
+
+
+def _lcg_jump(seed: int, steps: int, a: int, c: int, mod: int) -> int:
+    """
+    Returns the LCG state after `steps` steps of `seed -> (a * seed + c) % mod`.
+    Composes the affine step with itself by repeated squaring.
+    :complexity: O(log(steps))
+    """
+    if steps == 0:
+        return seed
+    # (mul, add) is the affine map applied so far, (step_mul, step_add) the current power of the step.
+    mul, add = 1, 0
+    step_mul, step_add = a % mod, c % mod
+    while steps:
+        if steps & 1:
+            mul, add = (mul * step_mul) % mod, (add * step_mul + step_add) % mod
+        step_mul, step_add = (step_mul * step_mul) % mod, (step_add * step_mul + step_add) % mod
+        steps >>= 1
+    return (mul * seed + add) % mod
+
+
+def _lcg_block(seed: int, n: int, a: int, c: int, mod: int) -> tuple[array, int]:
+    """
+    Returns the next `n` outputs (state >> 16) of the LCG starting at `seed`, and the final state.
+    Everything the loop touches is a local, and the modulus is a power of two so it is applied as a mask.
+    :complexity: O(n)
+    """
+    if n < 0:
+        raise ValueError("Block size cannot be negative.")
+    block = array('Q', bytes(8 * n))
+    mask = mod - 1
+    if mod & mask:
+        for i in range(n):
+            seed = (a * seed + c) % mod
+            block[i] = seed >> 16
+    else:
+        for i in range(n):
+            seed = (a * seed + c) & mask
+            block[i] = seed >> 16
+    return block, seed
+
+
+class RandomStream:
+    """
+    Instance-based counterpart of RandomGen. Each stream owns its own LCG state, so several
+    streams can be used side by side without affecting each other or the shared RandomGen.
+    A stream started from the same seed produces exactly the same numbers as RandomGen.
+
+    The draws are RandomGen's own methods, run against the stream's seed instead of the class's,
+    so the two can never drift apart. All methods are O(1) best/worst case time complexity unless
+    stated otherwise.
+
+    Usage:
+    ```
+    stream = RandomStream(123)
+    stream.randint(1, 10)        # Same as RandomGen.randint(1, 10) after RandomGen.set_seed(123)
+    stream.jumped(1000)          # A copy that starts 1000 draws further along
+    ```
+    """
+
+    MOD: int = RandomGen.MOD
+    A: int = RandomGen.A
+    C: int = RandomGen.C
+
+    random = RandomGen.random.__func__
+    random_block = RandomGen.random_block.__func__
+    random_float = RandomGen.random_float.__func__
+    randint = RandomGen.randint.__func__
+    random_chance = RandomGen.random_chance.__func__
+    random_choice = RandomGen.random_choice.__func__
+    random_shuffle = RandomGen.random_shuffle.__func__
+    # Advances the stream as if `random` had been called `steps` times, in O(log(steps))
+    jump = RandomGen.skip.__func__
+
+    def __init__(self, seed: int = None) -> None:
+        self.seed = time.time_ns() if seed is None else seed
+
+    def jumped(self, steps: int) -> RandomStream:
+        """
+        Returns a new stream starting `steps` draws after this one. This stream is unchanged.
+        :complexity: O(log(steps))
+        """
+        stream = RandomStream(self.seed)
+        stream.jump(steps)
+        return stream
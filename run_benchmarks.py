@@ -0,0 +1,50 @@
+import argparse
+import sys
+
+from benchmarks.harness import (DEFAULT_SIZES, SUITES, find_regressions, format_result, load_results,
+                                write_results)
+
+
+if __name__ == "__main__":
+
+    p = argparse.ArgumentParser()
+    p.add_argument(
+        "suite",
+        help=(
+            "The benchmark suite you'd like to run. "
+            "Leave blank for all suites.\n\n"
+            "Example: run_benchmarks.py adt"
+        ),
+        default="",
+        nargs="?",
+        choices=[""] + sorted(SUITES),
+    )
+    p.add_argument("--max-size", type=int, default=DEFAULT_SIZES[-1],
+                   help="Largest size to measure (sizes are 10, 100, ... up to this).")
+    p.add_argument("--repeat", type=int, default=3, help="Runs per measurement, the best one is kept.")
+    p.add_argument("--output", default="", help="Write the results to this .json or .csv file.")
+    p.add_argument("--baseline", default="", help="Compare against results written by an earlier run.")
+    p.add_argument("--threshold", type=float, default=0.2,
+                   help="Relative slowdown (or growth in memory) reported as a regression, 0.2 is 20%%.")
+    args = p.parse_args()
+
+    sizes = [size for size in DEFAULT_SIZES if size <= args.max_size]
+    names = [args.suite] if args.suite else sorted(SUITES)
+
+    results = []
+    for name in names:
+        for result in SUITES[name](sizes, args.repeat):
+            print(format_result(result), flush=True)
+            results.append(result)
+
+    if args.output:
+        write_results(results, args.output)
+
+    if args.baseline:
+        regressions = find_regressions(results, load_results(args.baseline), args.threshold)
+        for result, old, change in regressions:
+            print(f"REGRESSION {result.suite} {result.name} {result.operation} {result.size}: "
+                  f"{old.value:.3g} -> {result.value:.3g} {result.unit} (+{change:.0%})")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions beyond {args.threshold:.0%}")
@@ -19,17 +19,30 @@ if __name__ == "__main__":
     )
     args = p.parse_args()
 
+    suite = unittest.defaultTestLoader.discover('.')
+
+    # Task numbers are read from the @number decorators, so new test files are picked up
+    tasks = set()
+    for s in suite:
+        for t in s:
+            if "FailedTest" in str(type(t)):
+                continue
+            for t2 in t:
+                func = getattr(t2, t2._testMethodName)
+                number = getattr(func, "__number__", "")
+                if number:
+                    tasks.add(int(number.split(".")[0]))
+
     while args.task == '':
         try:
-            task = input("Enter task [1 - 5], leave blank to run all tests: ")
+            task = input(f"Enter task {sorted(tasks)}, leave blank to run all tests: ")
             if task == '':
                 break
-            if 1 <= int(task) <= 5:
+            if int(task) in tasks:
                 args.task = int(task)
         except ValueError:
             pass
 
-    suite = unittest.defaultTestLoader.discover('.')
     for s in suite:
         for t in s:
             if "FailedTest" in str(type(t)):
@@ -4,12 +4,15 @@ from data_structures.referential_array import ArrayR
 from data_structures.array_sorted_list import ArraySortedList
 from data_structures.linked_queue import LinkedQueue
 from hashy_step_table import HashyStepTable
+from data_structures.compact_hash_table import CompactLinearProbeTable
 from data_structures.linked_list import LinkedList
 from game_simulator import GameSimulator
+from match_stats import MatchStatsAccumulator
 from dataclasses import dataclass
 from team import Team
+from team_registry import TeamRegistry
 from typing import Generator, Union
-from constants import TeamStats, PlayerStats, PlayerPosition, ResultStats
+from constants import TeamStats, ResultStats
 
 
 @dataclass
@@ -97,7 +100,12 @@ class WeekOfGames:
 
 class Season:
 
-    def __init__(self, teams: ArrayR[Team]) -> None:
+    # Schedule generators accepted by Season(teams, scheduler=...).
+    GREEDY_SCHEDULER = "greedy"
+    CIRCLE_SCHEDULER = "circle"
+
+    def __init__(self, teams: ArrayR[Team], scheduler: str = GREEDY_SCHEDULER,
+                 team_ids: Union[TeamRegistry, None] = None) -> None:
         """
         Initializes the season with the following attributes:
 
@@ -110,6 +118,13 @@ class Season:
         
         Args:
             teams (ArrayR[Team]): The teams played in this season.
+            scheduler (str): "greedy" (the default, used by the existing fixtures) or "circle"
+                for the round-robin schedule from _generate_circle_schedule.
+            team_ids (Union[TeamRegistry, None]): Registry to number the teams with, e.g. one shared by a league.
+                By default the season numbers its own teams 1..N.
+
+        Raises:
+            ValueError: If the scheduler is not one of the above.
 
         Complexity:
             Best Case Complexity: O(N) where N is max(len(schedule), teams)
@@ -118,10 +133,25 @@ class Season:
         self.leaderboard = ArraySortedList(10)
         for team in teams: #adds team at the correct index
             self.leaderboard.add(team)
+
+        #team name -> index of the team in self.leaderboard, kept up to date as results come in
+        self.rank_index = CompactLinearProbeTable()
+        self._index_leaderboard(0, len(self.leaderboard))
         
         self.teams = teams
+
+        #dense IDs for the scheduling sets, independent of how many teams the process has created
+        self.team_ids = team_ids if team_ids is not None else TeamRegistry()
+        for team in teams:
+            self.team_ids.register(team)
         
-        schedule_array = self._generate_schedule() #generate schedule
+        #generate schedule
+        if scheduler == Season.GREEDY_SCHEDULER:
+            schedule_array = self._generate_schedule()
+        elif scheduler == Season.CIRCLE_SCHEDULER:
+            schedule_array = self._generate_circle_schedule()
+        else:
+            raise ValueError(f"Unknown scheduler {scheduler!r}")
         self.schedule = LinkedList()
 
         for week_ind in range(0, len(schedule_array)):
@@ -160,10 +190,13 @@ class Season:
 
             week_game_no: int = 0
             for game in games[:]:  # Iterate over a copy of the list
-                if game.home_team.get_number() not in used_teams and game.away_team.get_number() not in used_teams:
+                # Registry IDs keep used_teams as narrow as the number of teams in the season
+                home_id: int = self.team_ids.id_of(game.home_team)
+                away_id: int = self.team_ids.id_of(game.away_team)
+                if home_id not in used_teams and away_id not in used_teams:
                     current_week.append(game)
-                    used_teams.add(game.home_team.get_number())
-                    used_teams.add(game.away_team.get_number())
+                    used_teams.add(home_id)
+                    used_teams.add(away_id)
 
                     flipped_week.append(Game(game.away_team, game.home_team))
                     games.remove(game)
@@ -175,6 +208,70 @@ class Season:
 
         return ArrayR.from_list(weekly_games + flipped_weeks)
 
+    def _generate_circle_schedule(self) -> ArrayR[ArrayR[Game]]:
+        """
+        Generates a double round-robin schedule with the circle method (Berger tables).
+
+        The last team stays fixed while the others rotate around a circle. In round r it plays
+        team r, and teams r+k and r-k (mod N-1) play each other. Each of the N-1 rounds fills one
+        week directly, and the same week with home and away swapped is written N-1 weeks later.
+        With an odd number of teams a bye takes the fixed place, so each team sits out one week
+        per half of the season.
+
+        Return:
+            ArrayR[ArrayR[Game]]: The schedule of the season, 2(N-1) weeks for an even N and 2N
+                weeks for an odd N. Same layout as _generate_schedule.
+
+        Raises:
+            ValueError: If there are fewer than two teams.
+
+        Complexity:
+            Best Case Complexity: O(N^2) where N is the number of teams in the season, one step per game.
+            Worst Case Complexity: O(N^2) ^ same as best case
+        """
+        num_teams: int = len(self.teams)
+        if num_teams < 2:
+            raise ValueError("A season needs at least two teams")
+
+        #an odd number of teams gets a bye as the fixed team
+        has_bye: bool = num_teams % 2 == 1
+        slots: int = num_teams + 1 if has_bye else num_teams
+        rounds: int = slots - 1
+        games_per_week: int = slots // 2 - 1 if has_bye else slots // 2
+        fixed: int = slots - 1
+
+        schedule: ArrayR[ArrayR[Game]] = ArrayR(2 * rounds)
+        for round_no in range(rounds):
+            week: ArrayR[Game] = ArrayR(games_per_week)
+            flipped_week: ArrayR[Game] = ArrayR(games_per_week)
+            game_no: int = 0
+
+            if not has_bye:
+                #alternate the fixed team between home and away
+                if round_no % 2 == 0:
+                    home, away = round_no, fixed
+                else:
+                    home, away = fixed, round_no
+                week[game_no] = Game(self.teams[home], self.teams[away])
+                flipped_week[game_no] = Game(self.teams[away], self.teams[home])
+                game_no += 1
+
+            for k in range(1, slots // 2):
+                first = (round_no + k) % rounds
+                second = (round_no - k) % rounds
+                if k % 2 == 0:
+                    home, away = first, second
+                else:
+                    home, away = second, first
+                week[game_no] = Game(self.teams[home], self.teams[away])
+                flipped_week[game_no] = Game(self.teams[away], self.teams[home])
+                game_no += 1
+
+            schedule[round_no] = week
+            schedule[round_no + rounds] = flipped_week
+
+        return schedule
+
     def simulate_season(self) -> None:
         """
         Simulates the season.
@@ -183,85 +280,148 @@ class Season:
             Assume simulate_game is O(1)
             Remember to define your variables and their complexity.
 
-            Best Case Complexity: O(N*M*P) where N is the number of games in the schedule, M is the number of playerpositions and P is the number of players on the home + away teams
-            Worst Case Complexity: O(N*M*P) ^ same as best case
+            Best Case Complexity: O(N*(M*P + E)) where N is the number of games in the schedule, M is the number of playerpositions, P is the number of players on the home + away teams and E is the number of events (goals, assists, tackles, interceptions) in a game
+            Worst Case Complexity: O(N*(M*P + E)) ^ same as best case
         """              
-        #check how many games are actually in the schedule:
-     
-
-        results_list = LinkedList()
-        game_iterator = self.get_next_game()
-        game_index = 0
-        #simulate the games
-        for game in game_iterator:
+        #each result is applied as soon as the game is played, nothing is kept
+        for _ in self.iter_results():
+            pass
+
+    def iter_results(self) -> Generator[CompactLinearProbeTable, None, None]:
+        """
+        Simulates the season one game at a time, in schedule order.
+        Each game's result is applied to the teams, players and leaderboard before it is
+        yielded, so the standings seen by the caller always include the yielded game.
+        Only the current game's result is held, so memory does not grow with the season length.
+
+        Yields:
+            CompactLinearProbeTable: The result table from GameSimulator.simulate, with the
+            extra keys "home team" and "away team".
+
+        Complexity:
+            Best Case Complexity: O(M*P + E) per game, see simulate_season
+            Worst Case Complexity: O(M*P + E) per game, see simulate_season
+        """
+        for game in self.get_next_game():
             result = GameSimulator.simulate(game.home_team, game.away_team)
             result["home team"] = game.home_team
             result["away team"] = game.away_team
-            results_list.append(result)
-            game_index += 1
-        
-        #update the leaderboard object
-        for i in range(game_index):
-            #method to find home team's index in the leaderboard
-            for m in range(len(self.leaderboard)):
-                if self.leaderboard[m].name == results_list[i]["home team"].name:
-                    home_index = m
-            #method to find the away team's index in the leaderboard
-            for m in range(len(self.leaderboard)):
-                if self.leaderboard[m].name == results_list[i]["away team"].name:
-                    away_index = m
-
-            home_goals = results_list[i][ResultStats.HOME_GOALS.value]
-            away_goals = results_list[i][ResultStats.AWAY_GOALS.value]
-            
-            
-            #Handling wins/losses/draws and subsequently last 5 games and points
-            if home_goals > away_goals:
-                self.leaderboard[home_index][TeamStats.WINS] += 1
-                self.leaderboard[away_index][TeamStats.LOSSES] += 1
-            elif away_goals > home_goals:
-                self.leaderboard[away_index][TeamStats.WINS] += 1
-                self.leaderboard[home_index][TeamStats.LOSSES] += 1
-            else:
-                self.leaderboard[away_index][TeamStats.DRAWS] += 1
-                self.leaderboard[home_index][TeamStats.DRAWS] += 1
-            
-            #handling goals for and against and subsequently goals difference
-            self.leaderboard[home_index][TeamStats.GOALS_FOR] += home_goals
-            self.leaderboard[home_index][TeamStats.GOALS_AGAINST] += away_goals
-
-            self.leaderboard[away_index][TeamStats.GOALS_FOR] += away_goals
-            self.leaderboard[away_index][TeamStats.GOALS_AGAINST] += home_goals
-
-
-            goal_scorers = results_list[i]["Goal Scorers"] or ArrayR(1)
-            goal_assists = results_list[i]["Goal Assists"] or ArrayR(1)
-            interceptions = results_list[i]["Interceptions"] or ArrayR(1)
-            tackles = results_list[i]["Tackles"] or ArrayR(1)
-            
-            for pos in PlayerPosition:
-                for player in self.leaderboard[home_index].players[pos.value]:
-                    player[PlayerStats.GAMES_PLAYED] += 1
-                    player[PlayerStats.GOALS] += self.count_in_array(goal_scorers, player.name)
-                    
-                    player[PlayerStats.ASSISTS] += self.count_in_array(goal_assists, player.name)
-                    player[PlayerStats.INTERCEPTIONS] += self.count_in_array(interceptions, player.name)
-                    player[PlayerStats.TACKLES] += self.count_in_array(tackles, player.name)
-                
-                for player in self.leaderboard[away_index].players[pos.value]:
-                    player[PlayerStats.GAMES_PLAYED] += 1
-                    player[PlayerStats.GOALS] += self.count_in_array(goal_scorers, player.name)
-                    player[PlayerStats.ASSISTS] += self.count_in_array(goal_assists, player.name)
-                    player[PlayerStats.INTERCEPTIONS] += self.count_in_array(interceptions, player.name)
-                    player[PlayerStats.TACKLES] += self.count_in_array(tackles, player.name)
-    
-    def count_in_array(self, array: ArrayR[str], name: str) -> int: 
-        count = 0
-        for i in range(len(array)):
-            if array[i] == name:
-                count += 1
-        return count
+            self._apply_result(result)
+            yield result
+
+    def _apply_result(self, result: CompactLinearProbeTable) -> None:
+        """
+        Applies one game's result to both teams, the leaderboard and the players.
+
+        Complexity:
+            Best Case Complexity: O(M*P + E) where M is the number of playerpositions, P is the number of players on the home + away teams, E is the number of events in the game and T is the number of teams, when neither team moves
+            Worst Case Complexity: O(M*P + E + T) when a team moves across the whole leaderboard
+        """
+        home_team = result["home team"]
+        away_team = result["away team"]
+        home_goals = result[ResultStats.HOME_GOALS.value]
+        away_goals = result[ResultStats.AWAY_GOALS.value]
+
+        #Handling wins/losses/draws and subsequently last 5 games and points
+        if home_goals > away_goals:
+            home_team[TeamStats.WINS] += 1
+            away_team[TeamStats.LOSSES] += 1
+        elif away_goals > home_goals:
+            away_team[TeamStats.WINS] += 1
+            home_team[TeamStats.LOSSES] += 1
+        else:
+            away_team[TeamStats.DRAWS] += 1
+            home_team[TeamStats.DRAWS] += 1
+
+        #handling goals for and against and subsequently goals difference
+        home_team[TeamStats.GOALS_FOR] += home_goals
+        home_team[TeamStats.GOALS_AGAINST] += away_goals
+
+        away_team[TeamStats.GOALS_FOR] += away_goals
+        away_team[TeamStats.GOALS_AGAINST] += home_goals
+
+        #only the two teams that played can have moved
+        self._update_standings(home_team, away_team)
+
+        #count every event once, then hand the counts to the players of both teams
+        match_stats = MatchStatsAccumulator()
+        match_stats.add_result(result)
+        match_stats.apply(home_team.get_roster())
+        match_stats.apply(away_team.get_roster())
+
+    def _index_leaderboard(self, start: int, stop: int) -> None:
+        """
+        Records the leaderboard index of the teams at positions start..stop-1.
 
+        Complexity:
+            Best Case Complexity: O(N*hash(name)) where N is stop - start
+            Worst Case Complexity: O(N*(hash(name) + T)) where T is the number of teams, when every insert probes the whole table
+        """
+        for index in range(start, stop):
+            self.rank_index[self.leaderboard[index].name] = index
+
+    def _update_standings(self, home_team: Team, away_team: Team) -> None:
+        """
+        Moves the two teams of a finished game to their new places in the leaderboard.
+        Every other team keeps its relative order, so each team is swapped one place at a
+        time past only the neighbours it overtakes (or falls behind), and only the swapped
+        teams have their index re-recorded. The two teams are moved in turn until neither
+        moves, as one can be blocked by the other before that one has moved.
+
+        Complexity:
+            Best Case Complexity: O(comp + hash(name)) when neither team moves
+            Worst Case Complexity: O(N*(comp + hash(name))) where N is the number of teams, when a team moves from one end of the leaderboard to the other
+        """
+        moved = True
+        while moved:
+            moved = self._move_team(home_team)
+            moved = self._move_team(away_team) or moved
+
+    def _move_team(self, team: Team) -> bool:
+        """
+        Swaps a team with its neighbours in the leaderboard until it is ordered against both.
+
+        Returns:
+            bool: True if the team moved.
+
+        Complexity:
+            Best Case Complexity: O(comp + hash(name)) when the team is already in place
+            Worst Case Complexity: O(N*(comp + hash(name))) where N is the number of teams, when the team moves across the whole leaderboard
+        """
+        leaderboard = self.leaderboard
+        start = index = self.rank_index[team.name]
+        while index + 1 < len(leaderboard) and leaderboard[index + 1] < team:
+            self._swap_places(index, index + 1)
+            index += 1
+        while index > 0 and team < leaderboard[index - 1]:
+            self._swap_places(index - 1, index)
+            index -= 1
+        return index != start
+
+    def _swap_places(self, index: int, other_index: int) -> None:
+        """
+        Swaps two teams in the leaderboard and records their new indices.
+
+        Complexity:
+            Best/Worst Case Complexity: O(hash(name))
+        """
+        array = self.leaderboard.array
+        array[index], array[other_index] = array[other_index], array[index]
+        self.rank_index[array[index].name] = index
+        self.rank_index[array[other_index].name] = other_index
+
+    def get_rank(self, team: Team) -> int:
+        """
+        Returns the current position of a team in the standings (1 is top of the table).
+
+        Raises:
+            KeyError: If the team is not in this season.
+
+        Complexity:
+            Best Case Complexity: O(hash(name)) as the rank index is maintained after every game
+            Worst Case Complexity: O(hash(name) + T*comp) where T is the number of teams, when the table is fully probed
+        """
+        return len(self.leaderboard) - self.rank_index[team.name]
 
     def delay_week_of_games(self, orig_week: int, new_week: Union[int, None] = None) -> None:
         """
@@ -323,16 +483,12 @@ class Season:
                     - Previous Five Results (ArrayR(str)) where result should be WIN LOSS OR DRAW
 
         Complexity:
-            Best Case Complexity: O(N) where N is the number of teams in self.leaderboards, and the leaderboard is already sorted
-            Worst Case Complexity: O(N*M) where N is the number of teams in self.leaderboards, and M is the number of shuffles that need to be made in self.leaderboard
+            Best Case Complexity: O(N) where N is the number of teams in self.leaderboard
+            Worst Case Complexity: O(N) same as best case ^
         """
-        #resort the leaderboard as it is only sorted when being inserted
-        old_leaderboard = self.leaderboard
-        self.leaderboard = ArraySortedList(len(old_leaderboard))
-        for team in old_leaderboard:
-            self.leaderboard.add(team)
-        
-        
+        #the leaderboard is kept sorted as results come in
+        assert self._leaderboard_is_sorted(), "Leaderboard should be sorted after every result"
+
         leaderboard_data = ArrayR[ArrayR[Union[int, str]]](len(self.leaderboard))
 
         for index, team in enumerate(reversed(self.leaderboard)):
@@ -352,6 +508,19 @@ class Season:
             leaderboard_data[index] = data_row
         return leaderboard_data
         
+    def _leaderboard_is_sorted(self) -> bool:
+        """
+        Checks that every team in the leaderboard is ordered before the next one.
+
+        Complexity:
+            Best Case Complexity: O(comp) when the first pair is out of order
+            Worst Case Complexity: O(N*comp) where N is the number of teams
+        """
+        for index in range(1, len(self.leaderboard)):
+            if self.leaderboard[index] < self.leaderboard[index - 1]:
+                return False
+        return True
+
     def get_teams(self) -> ArrayR[Team]:
         """
         Returns:
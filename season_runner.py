@@ -0,0 +1,114 @@
+"""
+Runs many independent seasons across processes.
+
+Every season gets its own jump-ahead stream of the master seed: season `i` starts
+`i * STREAM_STRIDE` draws after the master seed. A season's result therefore only
+depends on the master seed and its index, never on how many workers ran the batch.
+The generator repeats after RandomGen.MOD draws, so at most MAX_SEASONS streams fit
+without overlapping, and asking for more is an error rather than a silent replay.
+"""
+from __future__ import annotations
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Union
+
+from constants import GameResult
+from random_gen import RandomGen, RandomStream
+from season import Season
+
+
+def simulate_seeded_season(build_season: Callable[[], Season], seed: int) -> list[list[Union[str, int, list[GameResult]]]]:
+    """
+    Seeds RandomGen, builds a season with `build_season`, simulates it and returns its leaderboard.
+
+    The leaderboard is converted to plain lists (the last five results becoming a list of GameResult)
+    so it can be sent back from a worker process.
+
+    Complexity:
+        Best/Worst Case Complexity: O(B + S + L) where B is the cost of build_season,
+        S the cost of simulate_season and L the cost of get_leaderboard.
+    """
+    RandomGen.set_seed(seed)
+    season = build_season()
+    season.simulate_season()
+
+    rows = []
+    for row in season.get_leaderboard():
+        cells = row.to_list()
+        cells[9] = cells[9].to_list() if cells[9] is not None else []
+        rows.append(cells)
+    return rows
+
+
+class ParallelSeasonRunner:
+    """
+    Fans independent season simulations out over a ProcessPoolExecutor.
+
+    `build_season` is called inside the worker after seeding, so team and player generation are part
+    of each season's stream. It must be picklable, i.e. a module level function.
+
+    Usage:
+    ```
+    runner = ParallelSeasonRunner(build_season, master_seed=123)
+    leaderboards = runner.run(10_000)    # leaderboards[i] is the final table of season i
+    ```
+    """
+
+    # Draws reserved for each season's stream. A 20 team season takes around 10^4 draws.
+    STREAM_STRIDE = 1 << 28
+
+    # Streams that fit in one period of the generator, 2^20.
+    MAX_SEASONS = RandomGen.MOD // STREAM_STRIDE
+
+    def __init__(self, build_season: Callable[[], Season], master_seed: int, max_workers: Union[int, None] = None) -> None:
+        """
+        Args:
+            build_season (Callable[[], Season]): Builds the season to simulate, using RandomGen for any randomness.
+            master_seed (int): Seed every season stream is derived from.
+            max_workers (Union[int, None]): Worker processes, None for one per core, 0 to run in this process.
+        """
+        self.build_season = build_season
+        self.master_seed = master_seed
+        self.max_workers = max_workers
+
+    def seed_for(self, index: int) -> int:
+        """
+        Returns the starting LCG state of season `index`.
+
+        Raises:
+            ValueError: If index is not in 0..MAX_SEASONS-1, where its stream would overlap another's.
+
+        Complexity:
+            Best/Worst Case Complexity: O(log(index * STREAM_STRIDE))
+        """
+        if not 0 <= index < self.MAX_SEASONS:
+            raise ValueError(f"Season index should be between 0 and {self.MAX_SEASONS - 1}")
+        return RandomStream(self.master_seed).jumped(index * self.STREAM_STRIDE).seed
+
+    def run(self, num_seasons: int) -> list[list[list[Union[str, int, list[GameResult]]]]]:
+        """
+        Simulates `num_seasons` seasons and returns their leaderboards in season order.
+
+        Raises:
+            ValueError: If num_seasons is more than MAX_SEASONS.
+
+        Complexity:
+            Best/Worst Case Complexity: O(N * (S + log(N * STREAM_STRIDE)) / W) where N is num_seasons,
+            S the cost of one simulate_seeded_season call and W the number of workers.
+        """
+        if num_seasons > self.MAX_SEASONS:
+            raise ValueError(f"At most {self.MAX_SEASONS} seasons have non-overlapping streams")
+        seeds = [self.seed_for(index) for index in range(num_seasons)]
+        builders = [self.build_season] * num_seasons
+
+        if self.max_workers == 0:
+            saved_seed = RandomGen.seed
+            try:
+                return [simulate_seeded_season(self.build_season, seed) for seed in seeds]
+            finally:
+                RandomGen.seed = saved_seed
+
+        workers = self.max_workers or os.cpu_count() or 1
+        chunksize = max(1, num_seasons // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(simulate_seeded_season, builders, seeds, chunksize=chunksize))
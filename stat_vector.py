@@ -0,0 +1,124 @@
+"""
+Fixed-slot storage for enum keyed statistics.
+
+Each member of a stats Enum owns one slot of an `array('q')`, in definition order.
+A read or update is one lookup of the member's slot plus one array access, where a
+string keyed hash table hashes the member's value on every access.
+"""
+from __future__ import annotations
+from array import array
+from enum import Enum
+from typing import Generic, Iterator, TypeVar, Union
+
+E = TypeVar('E', bound=Enum)
+
+
+class StatVector(Generic[E]):
+    """
+    One 64 bit integer per member of a stats Enum.
+
+    Stats can be read and written by member (`vector[PlayerStats.GOALS]`) or by the member's
+    value (`vector["Goals"]`), so it can replace a table keyed by `stat.value`.
+
+    Usage:
+    ```
+    stats = StatVector(TeamStats)
+    stats[TeamStats.WINS] += 1
+    stats.slot(TeamStats.WINS)      # 2, the position of WINS in TeamStats
+    ```
+
+    Attributes:
+        stats (type[E]): the Enum whose members are stored
+        layout (dict): member, and member value, -> slot. Shared by every vector of the same Enum
+        values (array[int]): the stat values, values[slot]
+    """
+
+    __slots__ = ("stats", "layout", "values")
+
+    # Enum class -> layout, so each Enum's layout is built once.
+    _layouts: dict[type, dict[Union[Enum, str], int]] = {}
+
+    def __init__(self, stats: type[E]) -> None:
+        """
+        Creates a vector with every stat set to 0.
+
+        Complexity:
+            Best Case Complexity: O(S) where S is len(stats), when the layout is already built
+            Worst Case Complexity: O(S) when the layout is built
+        """
+        self.stats = stats
+        self.layout = StatVector.layout_of(stats)
+        self.values = array('q', bytes(8 * len(stats)))
+
+    @staticmethod
+    def layout_of(stats: type[E]) -> dict[Union[E, str], int]:
+        """
+        Returns the member (and member value) -> slot mapping of an Enum.
+
+        Complexity:
+            Best Case Complexity: O(1) when it was built before
+            Worst Case Complexity: O(S) where S is len(stats)
+        """
+        layout = StatVector._layouts.get(stats)
+        if layout is None:
+            layout = {}
+            for slot, stat in enumerate(stats):
+                layout[stat] = slot
+                layout[stat.value] = slot
+            StatVector._layouts[stats] = layout
+        return layout
+
+    def slot(self, stat: Union[E, str]) -> int:
+        """
+        Returns the array slot of a stat.
+
+        Raises:
+            KeyError: If the stat is not a member (or member value) of the vector's Enum.
+        """
+        return self.layout[stat]
+
+    def __getitem__(self, stat: Union[E, str]) -> int:
+        """
+        Complexity:
+            Best/Worst Case Complexity: O(1)
+        Raises:
+            KeyError: If the stat is not a member (or member value) of the vector's Enum.
+        """
+        return self.values[self.layout[stat]]
+
+    def __setitem__(self, stat: Union[E, str], value: int) -> None:
+        """
+        Complexity:
+            Best/Worst Case Complexity: O(1)
+        Raises:
+            KeyError: If the stat is not a member (or member value) of the vector's Enum.
+            TypeError: If the value is not an integer.
+        """
+        self.values[self.layout[stat]] = value
+
+    def __contains__(self, stat: Union[E, str]) -> bool:
+        return stat in self.layout
+
+    def __len__(self) -> int:
+        """ Returns the number of stats. """
+        return len(self.values)
+
+    def __iter__(self) -> Iterator[E]:
+        """ Iterates over the stats, in slot order. """
+        return iter(self.stats)
+
+    def reset(self) -> None:
+        """
+        Sets every stat back to 0.
+
+        Complexity:
+            Best/Worst Case Complexity: O(S) where S is the number of stats
+        """
+        for slot in range(len(self.values)):
+            self.values[slot] = 0
+
+    def __str__(self) -> str:
+        return ", ".join(f"{stat.value}: {self.values[slot]}" for slot, stat in enumerate(self.stats))
+
+    def __repr__(self) -> str:
+        return f"StatVector({self.stats.__name__}: {self})"
@@ -4,17 +4,29 @@ from constants import GameResult, PlayerPosition, PlayerStats, TeamStats
 from player import Player
 from typing import Collection, Union, TypeVar
 from data_structures.hash_table import LinearProbeTable
+from data_structures.compact_hash_table import CompactLinearProbeTable
 from hashy_perfection_table import HashyPerfectionTable
-from hashy_step_table import HashyStepTable
+from data_structures.perfect_hash_table import MinimalPerfectHash, PerfectHashTable
 from data_structures.linked_list import LinkedList
-from data_structures.linked_queue import LinkedQueue
+from form_tracker import FormTracker
+from stat_vector import StatVector
+from weighted_index import CumulativeWeights
 
 T = TypeVar("T")
 
 
 class Team:
     team_num = 1
-    def __init__(self, team_name: str, players: ArrayR[Player]) -> None:
+
+    # StatVector slots compared by __lt__.
+    POINTS_SLOT = StatVector.layout_of(TeamStats)[TeamStats.POINTS]
+    GOALS_DIFFERENCE_SLOT = StatVector.layout_of(TeamStats)[TeamStats.GOALS_DIFFERENCE]
+    GOALS_FOR_SLOT = StatVector.layout_of(TeamStats)[TeamStats.GOALS_FOR]
+
+    # Position -> slot, built once and shared by every team's position tables.
+    POSITION_HASH = MinimalPerfectHash.build(PlayerPosition)
+
+    def __init__(self, team_name: str, players: ArrayR[Player], form_length: int = FormTracker.DEFAULT_CAPACITY) -> None:
         """
         Constructor for the Team class
         number - A unique number for this team. The first team number should be 1 (then 2, and so on).
@@ -32,6 +44,7 @@ class Team:
         Args:
             team_name (str): The name of the team
             players (ArrayR[Player]): The players of the team
+            form_length (int): How many recent results are kept for LAST_FIVE_RESULTS
 
         Returns:
             None
@@ -43,16 +56,22 @@ class Team:
         self.name = team_name
         self.number = Team.team_num
         Team.team_num += 1
-        self.statistics = HashyStepTable()
+        self.statistics = StatVector(TeamStats)
         self.num_players = 0
+        self.roster_version = 0
+        self.weighted_players = CompactLinearProbeTable()
+
+        #ArrayR snapshots of the roster, rebuilt lazily when roster_version moves on
+        self.snapshot_version = -1
+        self.all_players_snapshot: Union[ArrayR[Player], None] = None
+        self.outfield_snapshot: Union[ArrayR[Player], None] = None
+        self.position_snapshots = PerfectHashTable(Team.POSITION_HASH)
         
-        for stat in TeamStats: 
-            if stat.value == "Last Five Results":
-                self.statistics[stat.value] = LinkedQueue()
-            else:
-               self.statistics[stat.value] = 0
+        #every int stat starts at 0 in its StatVector slot, the last five results are kept in a ring buffer
+        self.form = FormTracker(form_length)
         
-        self.players = HashyStepTable()
+        #one slot per position, found by a perfect hash built once for PlayerPosition
+        self.players = PerfectHashTable(Team.POSITION_HASH)
         
         for position in PlayerPosition: #create the player position arrays
             self.players[position.value] = LinkedList()
@@ -69,11 +88,8 @@ class Team:
             Best Case Complexity: O(N) where N is len(TeamStats) and len(players) <= len(TeamStats)
             Worst Case Complexity: O(N) where N is when len(players) > len(TeamStats)
         """
-        for stat in TeamStats:
-            if stat.value == "Last Five Results":
-                self.statistics[stat.value] = LinkedQueue()
-            else:
-               self.statistics[stat.value] = 0
+        self.statistics.reset()
+        self.form.clear()
 
     def add_player(self, player: Player) -> None:
         """
@@ -91,6 +107,7 @@ class Team:
         """
         self.players[player.position.value].append(player)
         self.num_players += 1
+        self.roster_version += 1
 
     def remove_player(self, player: Player) -> None:
         """
@@ -108,6 +125,7 @@ class Team:
         """
         self.players[player.position.value].delete_at_index(self.players[player.position.value].index(player))
         self.num_players -= 1
+        self.roster_version += 1
         
 
     def get_number(self) -> int:
@@ -164,6 +182,93 @@ class Team:
         else:
             return return_players
 
+    def _refresh_snapshots(self) -> None:
+        """
+        Rebuilds the roster snapshots if a player was added or removed since they were taken.
+
+        Complexity:
+            Best Case Complexity: O(1) when the snapshots are up to date
+            Worst Case Complexity: O(M + N) where M is the number of positions and N is the number of players
+        """
+        if self.snapshot_version == self.roster_version:
+            return
+
+        all_players: list[Player] = []
+        outfield: list[Player] = []
+        #every position's slot is overwritten, so the snapshot table itself is reused
+        for position in PlayerPosition:
+            players = [player for player in self.players[position.value]]
+            self.position_snapshots[position.value] = ArrayR.from_list(players)
+            all_players.extend(players)
+            if position != PlayerPosition.GOALKEEPER:
+                outfield.extend(players)
+
+        self.all_players_snapshot = ArrayR.from_list(all_players)
+        self.outfield_snapshot = ArrayR.from_list(outfield)
+        self.snapshot_version = self.roster_version
+
+    def get_roster(self, position: Union[PlayerPosition, None] = None) -> Union[ArrayR[Player], None]:
+        """
+        Returns the same players, in the same order, as get_players, but as a cached ArrayR snapshot.
+        The snapshot is shared between calls and only rebuilt after add_player or remove_player,
+        so callers must not modify it.
+
+        Args:
+            position (Union[PlayerPosition, None]): The position of the players to return, None for all players
+
+        Returns:
+            ArrayR[Player]: The players, or None when there are none
+
+        Complexity:
+            Best Case Complexity: O(1) when the snapshots are up to date
+            Worst Case Complexity: O(M + N) when they are rebuilt, see _refresh_snapshots
+        """
+        self._refresh_snapshots()
+        if position is None:
+            return self.all_players_snapshot
+        return self.position_snapshots[position.value]
+
+    def get_outfield_roster(self) -> Union[ArrayR[Player], None]:
+        """
+        Returns a cached ArrayR snapshot of every player except the goalkeepers, in get_players order.
+        Like get_roster, it must not be modified.
+
+        Returns:
+            ArrayR[Player]: The outfield players, or None when there are none
+
+        Complexity:
+            Best Case Complexity: O(1) when the snapshots are up to date
+            Worst Case Complexity: O(M + N) when they are rebuilt, see _refresh_snapshots
+        """
+        self._refresh_snapshots()
+        return self.outfield_snapshot
+
+    def get_weighted_players(self, attributes: tuple[PlayerStats, ...], outfield_only: bool = False) -> CumulativeWeights[Player]:
+        """
+        Returns a cumulative weight index over the team's players (in get_players order),
+        weighting each player by the sum of `attributes`.
+        The index is cached and only rebuilt after the roster or a player's weighting stat changes.
+
+        Args:
+            attributes (tuple[PlayerStats, ...]): The stats to weight the players by
+            outfield_only (bool): Leave out the goalkeepers
+
+        Complexity:
+            Best Case Complexity: O(len(attributes)) when the cached index is still valid
+            Worst Case Complexity: O(N*A) where N is the number of players and A is len(attributes), when the index is rebuilt
+        """
+        key = ("Outfield:" if outfield_only else "All:") + ",".join(attr.value for attr in attributes)
+        version = (self.roster_version, Player.weights_version)
+        if key in self.weighted_players:
+            index = self.weighted_players[key]
+            if index.version == version:
+                return index
+
+        players = (self.get_outfield_roster() if outfield_only else self.get_roster()) or []
+        index = CumulativeWeights.from_players(players, attributes, version)
+        self.weighted_players[key] = index
+        return index
+
     def get_statistics(self):
         """
         Get the statistics of the team
@@ -198,14 +303,25 @@ class Team:
             or
             None if the team has not played any games.
 
+        The results are copied out of the team's FormTracker, so the array is not
+        affected by later games. If the team was created with a form_length other than 5,
+        that many results are returned.
+
         Complexity:
             Best Case Complexity: O(1) when there TeamStats.LAST_FIVE_RESULTS is empty and nothing is returned
-            Worst Case Complexity: O(1) when the last five results array is returned
+            Worst Case Complexity: O(K) where K is the form length, when the results are copied
         """
-        if len(self.statistics["Last Five Results"]) < 1:
-            return None
-        else:
-            return self.statistics["Last Five Results"]
+        return self.form.to_array()
+
+    def get_form_points(self) -> int:
+        """
+        Returns the points earned over the last five (or form_length) results.
+
+        Complexity:
+            Best Case Complexity: O(1) the FormTracker keeps a running total
+            Worst Case Complexity: O(1) ^ same as best case
+        """
+        return self.form.points()
 
     def get_top_x_players(self, player_stat: PlayerStats, num_players: int) -> list[tuple[int, str, Player]]:
         """
@@ -249,63 +365,53 @@ class Team:
             value (int): The new value of the statistic
 
         Complexity:
-            Best Case Complexity: O(1) updating/setting a key value pair in a hash table has a constant complexity
+            Best Case Complexity: O(1) each update writes a fixed StatVector slot
             Worst Case Complexity: O(1) ^
         """
 
-        if statistic.value == "Games Played":
+        stats = self.statistics
+
+        if statistic is TeamStats.GAMES_PLAYED:
             # Your code for handling Games Played
-            self.statistics[statistic.value] = value
+            stats[TeamStats.GAMES_PLAYED] = value
 
-        elif statistic.value == "Points":
+        elif statistic is TeamStats.POINTS:
             # Your code for handling Points
-            self.statistics[statistic.value] = value
+            stats[TeamStats.POINTS] = value
 
-        elif statistic.value == "Wins":
+        elif statistic is TeamStats.WINS:
             # Your code for handling Wins
-            temp_list = self.statistics["Last Five Results"]
-            if len(temp_list) > 4:
-                temp_list.serve()
-            
-            temp_list.append(GameResult(3))
-            self.statistics["Games Played"] += 1
-            self.statistics["Points"] += 3
-            self.statistics[statistic.value] = value
-
-        elif statistic.value == "Draws":
+            self.form.push(GameResult.WIN)
+            stats[TeamStats.GAMES_PLAYED] += 1
+            stats[TeamStats.POINTS] += 3
+            stats[TeamStats.WINS] = value
+
+        elif statistic is TeamStats.DRAWS:
             # Your code for handling Draws
-            temp_list = self.statistics["Last Five Results"]
-            if len(temp_list) > 4:
-                temp_list.serve()
-            
-            temp_list.append(GameResult(1))
-            self.statistics["Games Played"] += 1
-            self.statistics["Points"] += 1
-            self.statistics[statistic.value] = value
-
-        elif statistic.value == "Losses":
+            self.form.push(GameResult.DRAW)
+            stats[TeamStats.GAMES_PLAYED] += 1
+            stats[TeamStats.POINTS] += 1
+            stats[TeamStats.DRAWS] = value
+
+        elif statistic is TeamStats.LOSSES:
             # Your code for handling Losses
-            temp_list = self.statistics["Last Five Results"]
-            if len(temp_list) > 4:
-                temp_list.serve()
-            self.statistics["Games Played"] += 1
-            temp_list.append(GameResult(0))
-            
-            self.statistics[statistic.value] = value
-
-        elif statistic.value == "Goals For":
+            self.form.push(GameResult.LOSS)
+            stats[TeamStats.GAMES_PLAYED] += 1
+            stats[TeamStats.LOSSES] = value
+
+        elif statistic is TeamStats.GOALS_FOR:
             # Your code for handling Goals For
-            self.statistics[statistic.value] = value
-            self.statistics["Goals Difference"] = self.statistics["Goals For"] - self.statistics["Goals Against"]
+            stats[TeamStats.GOALS_FOR] = value
+            stats[TeamStats.GOALS_DIFFERENCE] = value - stats[TeamStats.GOALS_AGAINST]
 
-        elif statistic.value == "Goals Against":
+        elif statistic is TeamStats.GOALS_AGAINST:
             # Your code for handling Goals Against
-            self.statistics[statistic.value] = value
-            self.statistics["Goals Difference"] = self.statistics["Goals For"] - self.statistics["Goals Against"]
+            stats[TeamStats.GOALS_AGAINST] = value
+            stats[TeamStats.GOALS_DIFFERENCE] = stats[TeamStats.GOALS_FOR] - value
 
-        elif statistic.value == "Goals Difference": 
+        elif statistic is TeamStats.GOALS_DIFFERENCE: 
             # Your code for handling Goals Difference
-            self.statistics[statistic.value] = value
+            stats[TeamStats.GOALS_DIFFERENCE] = value
 
     def __getitem__(self, statistic: TeamStats) -> int:
         """
@@ -316,15 +422,18 @@ class Team:
 
         Returns:
             int: The value of the specified statistic
+            (for LAST_FIVE_RESULTS, the ArrayR from get_last_five_results, or None)
 
         Raises:
-            ValueError: If the statistic is invalid
+            KeyError: If the statistic is invalid
 
         Complexity:
-            Best Case Complexity: O(1) returning a value from a hash table has constant complexity
+            Best Case Complexity: O(1) reading a fixed StatVector slot
             Worst Case Complexity: O(1) ^
         """
-        return self.statistics[statistic.value]
+        if statistic is TeamStats.LAST_FIVE_RESULTS:
+            return self.get_last_five_results()
+        return self.statistics[statistic]
 
     def __len__(self) -> int:
         """
@@ -363,13 +472,15 @@ class Team:
     def __lt__(self, other_team: Team) -> bool:
         """
         Complexity:
-            Best Case Complexity: O(1) retriving items from a hash table has constant time complexity
-            Worst Case Complexity: O(1) retriving items from a hash table has constant time complexity
+            Best Case Complexity: O(1) comparing fixed StatVector slots, when the points differ
+            Worst Case Complexity: O(comp(name)) when only the names differ
         """
-        if self.statistics["Points"] == other_team.statistics["Points"]:
-            if self.statistics["Goals Difference"] == other_team.statistics["Goals Difference"]:
-                if self.statistics["Goals For"] == other_team.statistics["Goals For"]:
+        mine = self.statistics.values
+        theirs = other_team.statistics.values
+        if mine[Team.POINTS_SLOT] == theirs[Team.POINTS_SLOT]:
+            if mine[Team.GOALS_DIFFERENCE_SLOT] == theirs[Team.GOALS_DIFFERENCE_SLOT]:
+                if mine[Team.GOALS_FOR_SLOT] == theirs[Team.GOALS_FOR_SLOT]:
                     return self.name < other_team.name
-                return self.statistics["Goals For"] < other_team.statistics["Goals For"]
-            return self.statistics["Goals Difference"] < other_team.statistics["Goals Difference"]
-        return self.statistics["Points"] < other_team.statistics["Points"]
\ No newline at end of file
+                return mine[Team.GOALS_FOR_SLOT] < theirs[Team.GOALS_FOR_SLOT]
+            return mine[Team.GOALS_DIFFERENCE_SLOT] < theirs[Team.GOALS_DIFFERENCE_SLOT]
+        return mine[Team.POINTS_SLOT] < theirs[Team.POINTS_SLOT]
@@ -0,0 +1,100 @@
+"""
+Dense, reusable IDs for the teams of a season or league.
+
+`Team.number` comes from a process-wide counter, so after thousands of teams have been created
+the numbers of a 20 team season are still thousands of bits apart, and every BSet holding them
+is that wide. A TeamRegistry numbers only the teams registered with it, 1..N, and hands released
+IDs back out, smallest first, so sets of registry IDs stay O(N) bits.
+"""
+from __future__ import annotations
+
+from data_structures.bset import BSet
+from data_structures.compact_hash_table import CompactLinearProbeTable
+from team import Team
+
+
+class TeamRegistry:
+    """
+    Maps teams (by name) to IDs 1..N, reusing IDs of released teams.
+
+    Usage:
+    ```
+    registry = TeamRegistry()
+    registry.register(team)     # 1
+    registry.id_of(team)        # 1
+    registry.release(team)      # 1 is free again
+    ```
+
+    Attributes:
+        ids (CompactLinearProbeTable[str, int]): team name -> ID
+        free_ids (BSet): released IDs below next_id
+        next_id (int): smallest ID never handed out
+    """
+
+    def __init__(self) -> None:
+        """
+        Complexity:
+            Best/Worst Case Complexity: O(1)
+        """
+        self.ids: CompactLinearProbeTable[str, int] = CompactLinearProbeTable()
+        self.free_ids = BSet()
+        self.next_id = 1
+
+    def __len__(self) -> int:
+        """ Returns the number of registered teams. """
+        return len(self.ids)
+
+    def __contains__(self, team: Team) -> bool:
+        return team.get_name() in self.ids
+
+    def register(self, team: Team) -> int:
+        """
+        Returns the team's ID, giving it the smallest free one if it is not registered yet.
+
+        Complexity:
+            Best Case Complexity: O(hash(name)) when the team is already registered or no ID is free
+            Worst Case Complexity: O(hash(name) + N/w) where N is the largest ID handed out and w the machine
+                word size, to find the lowest free ID
+        """
+        name = team.get_name()
+        if name in self.ids:
+            return self.ids[name]
+
+        if self.free_ids.is_empty():
+            team_id = self.next_id
+            self.next_id += 1
+        else:
+            #lowest set bit of the free set is the smallest free ID
+            elems = self.free_ids.elems
+            team_id = (elems & -elems).bit_length()
+            self.free_ids.remove(team_id)
+
+        self.ids[name] = team_id
+        return team_id
+
+    def id_of(self, team: Team) -> int:
+        """
+        Returns the ID of a registered team.
+
+        Raises:
+            KeyError: If the team is not registered.
+
+        Complexity:
+            Best/Worst Case Complexity: O(hash(name)) plus the probing cost of the ID table
+        """
+        return self.ids[team.get_name()]
+
+    def release(self, team: Team) -> None:
+        """
+        Unregisters a team, its ID will be handed to the next team registered.
+
+        Raises:
+            KeyError: If the team is not registered.
+
+        Complexity:
+            Best/Worst Case Complexity: O(hash(name) + N/w), see register
+        """
+        name = team.get_name()
+        team_id = self.ids[name]
+        del self.ids[name]
+        self.free_ids.add(team_id)
@@ -14,17 +14,19 @@ from data_structures.aset import ASet
 from data_structures.bset import BSet
 from data_structures.array_sorted_list import ArraySortedList
 from data_structures.hash_table import LinearProbeTable
+from data_structures.hash_set import HashSet
 from data_structures.hash_table_separate_chaining import HashTableSeparateChaining
 from data_structures.linked_list import LinkedList
 from data_structures.linked_queue import LinkedQueue
 from data_structures.linked_stack import LinkedStack
 from data_structures.referential_array import ArrayR
+from data_structures.sorted_aset import SortedASet
 from hashy_perfection_table import HashyPerfectionTable
 from hashy_step_table import HashyStepTable
 
 T = TypeVar('T')
-POSSIBLE_ADT_TYPES = Union[ArrayR, ASet, BSet, HashTableSeparateChaining, HashyPerfectionTable, HashyStepTable,
-                           LinearProbeTable, LinkedList, LinkedQueue, LinkedStack]
+POSSIBLE_ADT_TYPES = Union[ArrayR, ASet, BSet, HashSet, HashTableSeparateChaining, HashyPerfectionTable, HashyStepTable,
+                           LinearProbeTable, LinkedList, LinkedQueue, LinkedStack, SortedASet]
 
 
 def take_out_from_adt(adt: POSSIBLE_ADT_TYPES) -> Union[ArrayR[T], None]:
@@ -65,12 +67,9 @@ def take_out_from_adt(adt: POSSIBLE_ADT_TYPES) -> Union[ArrayR[T], None]:
         for index in range(len(adt)):
             output[index] = adt.array[index]
 
-    elif adt_type == BSet:
-        i: int = 0
-        for item in range(1, int.bit_length(adt.elems) + 1):
-            if item in adt:
-                output[i] = item
-                i += 1
+    elif adt_type in [BSet, HashSet, SortedASet]:
+        for i, item in enumerate(adt):
+            output[i] = item
 
     else:
         raise ValueError("Invalid ADT type")
@@ -0,0 +1,78 @@
+from unittest import TestCase
+
+from batch_simulator import BatchResults, BatchSeasonSimulator
+from constants import PlayerPosition, PlayerStats
+from data_structures.referential_array import ArrayR
+from player import Player
+from ed_utils.decorators import number, visibility
+from random_gen import RandomGen
+from season import Season
+from team import Team
+from tests import test_task5
+from tests.helper import take_out_from_adt
+
+
+class TestBatchSimulator(TestCase):
+
+    SEEDS: list[int] = [123, 7, 2024]
+
+    def setUp(self) -> None:
+        RandomGen.set_seed(123)
+        self.teams = test_task5.Roster.generate_teams(6)
+        self.season = Season(self.teams)
+        self.results = BatchSeasonSimulator(self.season).simulate(self.SEEDS)
+
+    @number("6.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_buffer_layout(self):
+        games = len(list(self.season.get_next_game()))
+        self.assertEqual(self.results.num_games, games)
+        self.assertEqual(len(self.results.home_goals), len(self.SEEDS) * games)
+        self.assertEqual(len(self.results.scorers), len(self.SEEDS) * games * BatchResults.MAX_EVENTS)
+
+    @number("6.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_matches_simulate_season(self):
+        for replica, seed in enumerate(self.SEEDS):
+            for team in self.teams:
+                team.reset_stats()
+                for player in team.get_players():
+                    for stat in [PlayerStats.GAMES_PLAYED, PlayerStats.GOALS, PlayerStats.ASSISTS,
+                                 PlayerStats.TACKLES, PlayerStats.INTERCEPTIONS]:
+                        player[stat] = 0
+
+            season = Season(self.teams)
+            RandomGen.set_seed(seed)
+            season.simulate_season()
+
+            expected = season.get_leaderboard()
+            actual = self.results.get_leaderboard(replica)
+            for row in range(len(expected)):
+                for cell in range(9):
+                    self.assertEqual(expected[row][cell], actual[row][cell], f"Seed {seed} row {row} cell {cell}")
+                expected_form = take_out_from_adt(expected[row][9])
+                actual_form = take_out_from_adt(actual[row][9])
+                self.assertEqual(expected_form.to_list(), actual_form.to_list())
+
+            for team in self.teams:
+                for player in team.get_players():
+                    for stat in [PlayerStats.GAMES_PLAYED, PlayerStats.GOALS, PlayerStats.ASSISTS,
+                                 PlayerStats.TACKLES, PlayerStats.INTERCEPTIONS]:
+                        self.assertEqual(player[stat], self.results.get_player_stat(replica, player, stat),
+                                         f"Seed {seed} {player.get_name()} {stat}")
+
+    @number("6.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_player_stats_lookup(self):
+        stats = self.results.player_stats(1)
+        self.assertIs(self.results.player_stats(1), stats, "A replica's player stats should be computed once")
+        for i in range(len(self.results.players)):
+            player = self.results.players[i]
+            self.assertEqual(self.results.get_player_stat(1, player, PlayerStats.GOALS), stats[i][1])
+
+        stranger = Player("Stranger", PlayerPosition.STRIKER, 30)
+        self.assertRaises(KeyError, lambda: self.results.get_player_stat(0, stranger, PlayerStats.GOALS))
+        self.assertRaises(KeyError, lambda: self.results.get_player_stat(0, self.results.players[0], PlayerStats.HEIGHT))
+
+        empty = Season(ArrayR.from_list([Team("Empty A", []), Team("Empty B", [])]))
+        self.assertRaises(ValueError, lambda: BatchSeasonSimulator(empty))
@@ -0,0 +1,78 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from benchmarks import build_benchmarks, churn_benchmarks, probe_benchmarks, tail_benchmarks
+from benchmarks.adt_benchmarks import CASES
+from benchmarks.harness import BenchmarkResult, find_regressions, load_results, percentile, write_results
+from ed_utils.decorators import number, visibility
+
+
+class TestBenchmarks(TestCase):
+
+    def setUp(self) -> None:
+        self.results = [
+            BenchmarkResult("adt", "LinearProbeTable", "insert", 100, 2e-6, "s/op"),
+            BenchmarkResult("adt", "LinearProbeTable", "memory", 100, 4096, "bytes"),
+        ]
+
+    @number("10.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_result_files_round_trip(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for name in ["results.json", "results.csv"]:
+                path = os.path.join(directory, name)
+                write_results(self.results, path)
+                self.assertEqual(load_results(path), self.results, f"{name} did not round trip")
+
+    @number("10.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_find_regressions(self):
+        current = [
+            BenchmarkResult("adt", "LinearProbeTable", "insert", 100, 3e-6, "s/op"),
+            BenchmarkResult("adt", "LinearProbeTable", "memory", 100, 4200, "bytes"),
+            BenchmarkResult("adt", "LinearProbeTable", "lookup", 100, 1e-6, "s/op"),
+        ]
+        regressions = find_regressions(current, self.results, 0.2)
+        self.assertEqual([result.operation for result, _, _ in regressions], ["insert"])
+        self.assertAlmostEqual(regressions[0][2], 0.5)
+
+    @number("10.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_every_case_runs(self):
+        for case in CASES:
+            results = case.run([10], 1)
+            operations = {result.operation for result in results}
+            self.assertIn("insert", operations, f"{case.name} was not measured")
+            self.assertIn("memory", operations, f"{case.name} memory was not measured")
+
+    @number("10.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_churn_suite_runs(self):
+        results = churn_benchmarks.run([10], 1)
+        self.assertEqual(len(results), len(churn_benchmarks.LOAD_FACTORS) * len(churn_benchmarks.TABLE_TYPES))
+
+    @number("10.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_probe_suite_runs(self):
+        results = probe_benchmarks.run([100], 1)
+        robin_hood = {result.operation: result.value for result in results if result.name == "RobinHoodTable@0.85"}
+        self.assertGreaterEqual(robin_hood["hit probes mean"], 1)
+        self.assertLessEqual(robin_hood["hit probes p99"], robin_hood["hit probes max"])
+        self.assertEqual(percentile([5, 1, 3, 2, 4], 0.5), 3)
+
+    @number("10.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_tail_suite_runs(self):
+        results = tail_benchmarks.run([100], 1)
+        self.assertEqual(len(results), 3 * len(tail_benchmarks.TABLE_TYPES))
+        for result in results:
+            self.assertGreater(result.value, 0, f"{result.name} {result.operation} was not measured")
+
+    @number("10.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_build_suite_runs(self):
+        results = build_benchmarks.run([100], 1)
+        self.assertEqual(len(results), 2 * len(build_benchmarks.TABLE_TYPES))
+        for result in results:
+            self.assertGreater(result.value, 0, f"{result.name} {result.operation} was not measured")
@@ -0,0 +1,365 @@
+from unittest import TestCase
+
+from constants import PlayerPosition, PlayerStats, ResultStats, TeamStats
+from data_structures.bloom_filter import BloomFilter
+from data_structures.compact_hash_table import CompactLinearProbeTable
+from data_structures.cuckoo_table import CuckooTable
+from data_structures.hash_table import FullError, LinearProbeTable
+from data_structures.hash_table_separate_chaining import HashTableSeparateChaining, next_prime
+from data_structures.perfect_hash_table import MinimalPerfectHash, PerfectHashTable
+from data_structures.robin_hood_table import RobinHoodTable
+from ed_utils.decorators import number, visibility
+from hashy_perfection_table import HashyPerfectionTable
+from hashy_step_table import HashyStepTable
+from random_gen import RandomStream
+
+
+class TestHashTables(TestCase):
+
+    def churn(self, table, operations: int = 3000, key_space: int = 400) -> None:
+        """ Apply random inserts, updates and deletes to the table and to a dict, checking they agree. """
+        stream = RandomStream(2024)
+        expected = {}
+        for step in range(operations):
+            key = f"key{stream.randint(0, key_space)}"
+            if stream.random_chance(0.35) and key in expected:
+                del table[key]
+                del expected[key]
+            else:
+                table[key] = step
+                expected[key] = step
+            self.assertEqual(len(table), len(expected))
+
+        for i in range(key_space + 1):
+            key = f"key{i}"
+            self.assertEqual(key in table, key in expected, f"Membership of {key} is wrong")
+            if key in expected:
+                self.assertEqual(table[key], expected[key])
+        self.assertEqual(sorted(table.keys()), sorted(expected))
+        self.assertEqual(sorted(table.values()), sorted(expected.values()))
+
+    @number("9.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_compact_linear_probe_churn(self):
+        self.churn(CompactLinearProbeTable())
+
+    @number("9.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_compact_linear_probe_reuses_slots(self):
+        table = CompactLinearProbeTable()
+        table["Goals"] = 1
+        position = table._linear_probe("Goals", table.hash("Goals"), False)
+        table["Goals"] = 2
+        self.assertEqual(table._linear_probe("Goals", table.hash("Goals"), False), position)
+        self.assertEqual(table["Goals"], 2)
+        self.assertRaises(KeyError, lambda: table["Assists"])
+
+    @number("9.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_hashy_step_churn(self):
+        self.churn(HashyStepTable())
+
+    @number("9.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_hashy_step_tombstones(self):
+        table = HashyStepTable([97], tombstone_ratio=0.03)
+        table.hash = lambda _: 0
+        for letter in "ABCDE":
+            table[letter] = letter
+        del table["A"]
+        self.assertEqual(table.dels, 1)
+
+        # A new key reuses the tombstone left by "A"
+        table["F"] = "F"
+        self.assertEqual(table.dels, 0)
+        self.assertEqual(table.array[0], ("F", "F"))
+
+        # Passing the tombstone ratio compacts the table in place
+        for letter in "BCDEF":
+            del table[letter]
+        self.assertEqual(table.table_size, 97)
+        self.assertLess(table.dels, 3)
+        self.assertTrue(table.is_empty())
+        self.assertGreater(table.probe_max, 1)
+
+    @number("9.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_separate_chaining_churn(self):
+        table = HashTableSeparateChaining()
+        self.churn(table)
+        self.assertGreater(table.table_size, HashTableSeparateChaining.DEFAULT_TABLE_SIZE, "The table should grow")
+        self.assertEqual(next_prime(table.table_size), table.table_size, "Table sizes should be prime")
+        self.assertLessEqual(table.load_factor(), table.max_load_factor)
+
+    @number("9.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_separate_chaining_chains(self):
+        table = HashTableSeparateChaining(table_size=5, max_load_factor=100)
+        table.full_hash = lambda _: 3
+        for letter in "ABC":
+            table[letter] = letter
+        self.assertEqual(table.max_chain_length(), 3)
+        self.assertEqual(table.average_chain_length(), 3.0)
+
+        # Updating rewrites the existing node, deleting the tail keeps appends reachable
+        node = table.table[3].head.link
+        table["B"] = "b"
+        self.assertIs(table.table[3].head.link, node)
+        del table["C"]
+        table["D"] = "D"
+        self.assertEqual([table[letter] for letter in "ABD"], ["A", "b", "D"])
+        self.assertEqual(table.max_chain_length(), 3)
+        for letter in "ABD":
+            del table[letter]
+        self.assertIsNone(table.table[3])
+        self.assertEqual(table.average_chain_length(), 0.0)
+
+    @number("9.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_backward_shift_churn(self):
+        # A single table size keeps the load high, so clusters are long and wrap around
+        for table in [LinearProbeTable([521]), CompactLinearProbeTable([521])]:
+            self.churn(table, key_space=300)
+
+    @number("9.8")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_backward_shift_wraps(self):
+        table = LinearProbeTable([7])
+        table.hash = lambda key: {"A": 5, "B": 5, "C": 6, "D": 0}[key]
+        for letter in "ABCD":
+            table[letter] = letter
+        self.assertEqual([table.array[i][0] for i in [5, 6, 0, 1]], ["A", "B", "C", "D"])
+
+        del table["A"]
+        # B moves home, C follows it, D is already home and stays
+        self.assertEqual([table.array[i] and table.array[i][0] for i in [5, 6, 0, 1]], ["B", "C", "D", None])
+        self.assertEqual([table[letter] for letter in "BCD"], ["B", "C", "D"])
+
+    @number("9.9")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_robin_hood_churn(self):
+        self.churn(RobinHoodTable())
+        table = RobinHoodTable([307])
+        self.churn(table, key_space=300)
+        self.assertLessEqual(len(table), 301)
+        for position in range(table.table_size):
+            if table.key_array[position] is not None:
+                home = table.hash_array[position] % table.table_size
+                self.assertEqual(table.distance_array[position], (position - home) % table.table_size,
+                                 "Stored probe distances should match the slots")
+
+    @number("9.10")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_robin_hood_order(self):
+        table = RobinHoodTable([11])
+        homes = {"A": 2, "B": 2, "C": 3, "D": 2, "E": 6, "F": 6, "X": 5}
+        table.hash = lambda key: homes[key]
+        for letter in "ABCD":
+            table[letter] = letter
+        # D is further from home than C at slot 4, so it takes the slot and C moves on
+        self.assertEqual([table.key_array[i] for i in range(2, 6)], ["A", "B", "D", "C"])
+        self.assertEqual([table.distance_array[i] for i in range(2, 6)], [0, 1, 2, 2])
+
+        table["E"] = "E"
+        table["F"] = "F"
+        # A miss homed at 5 stops at E, which is at home, instead of scanning on to F and the empty slot
+        self.assertEqual(table.probe_length("X"), 2)
+        self.assertRaises(KeyError, lambda: table["X"])
+
+        del table["A"]
+        self.assertEqual([table.key_array[i] for i in range(2, 8)], ["B", "D", "C", None, "E", "F"])
+        self.assertEqual([table.distance_array[i] for i in range(2, 5)], [0, 1, 1])
+        self.assertEqual([table[letter] for letter in "BCDEF"], ["B", "C", "D", "E", "F"])
+
+    @number("9.11")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_cuckoo_churn(self):
+        table = CuckooTable()
+        self.churn(table)
+        for key in table.keys():
+            key_hash = table.hash(key)
+            slots = [(side, table._slot(key_hash, side)) for side in range(2)]
+            in_slot = any(table.key_arrays[side][position] == key for side, position in slots)
+            in_stash = any(table.stash[i][0] == key for i in range(table.stash_count))
+            self.assertTrue(in_slot or in_stash, f"{key} is neither in one of its two slots nor in the stash")
+
+    @number("9.12")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_cuckoo_stash(self):
+        table = CuckooTable([29, 61])
+        table.hash = lambda key: 7
+        for i in range(2 + CuckooTable.STASH_SIZE):
+            table[str(i)] = i
+        self.assertEqual(table.stash_count, CuckooTable.STASH_SIZE, "Keys sharing both slots should go to the stash")
+
+        # Growing cannot separate keys with equal hashes
+        self.assertRaises(FullError, lambda: table.__setitem__("new", 0))
+        self.assertRaises(FullError, lambda: table.__setitem__("newer", 0))
+        self.assertEqual(len(table), 3 + CuckooTable.STASH_SIZE)
+        self.assertEqual([table[str(i)] for i in range(2 + CuckooTable.STASH_SIZE)], list(range(6)))
+
+        del table["new"]
+        del table["0"]
+        table["3"] = "three"
+        self.assertEqual(sorted(table.keys().to_list()), ["1", "2", "3", "4", "5"])
+        self.assertEqual(table["3"], "three")
+
+    @number("9.13")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_get_and_probe_index(self):
+        perfect = HashyPerfectionTable()
+        for i, stat in enumerate(PlayerStats):
+            perfect[stat.value] = i
+        tables = [LinearProbeTable(), HashyStepTable(), LinearProbeTable(bloom_filter=True),
+                  HashyStepTable(bloom_filter=True), CompactLinearProbeTable(), RobinHoodTable()]
+        for table in tables:
+            for i, stat in enumerate(PlayerStats):
+                table[stat.value] = i
+
+        for table in tables + [perfect]:
+            for i, stat in enumerate(PlayerStats):
+                position = table.probe_index(stat.value)
+                if isinstance(table, CompactLinearProbeTable):
+                    self.assertEqual(table.key_array[position], stat.value)
+                else:
+                    self.assertEqual(table.array[position][0], stat.value)
+                self.assertEqual(table.get(stat.value), i)
+            self.assertEqual(table.probe_index("Own Goals"), -1)
+            self.assertIsNone(table.get("Own Goals"))
+            self.assertEqual(table.get("Own Goals", 0), 0)
+            self.assertFalse("Own Goals" in table)
+
+        # A key the perfect hash sends to an occupied slot is not mistaken for its occupant
+        position = perfect.hash(PlayerStats.GOALS.value)
+        impostor = next(f"key{i}" for i in range(1000) if perfect.hash(f"key{i}") == position)
+        self.assertEqual(perfect.probe_index(impostor), -1)
+        self.assertRaises(KeyError, lambda: perfect[impostor])
+        self.assertRaises(KeyError, lambda: perfect.__delitem__(impostor))
+        self.assertEqual(len(perfect), len(PlayerStats))
+        self.assertEqual(sorted(key for key in perfect.keys() if key is not None),
+                         sorted(stat.value for stat in PlayerStats))
+
+    @number("9.14")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_bloom_filter_churn(self):
+        bloom = BloomFilter(1000)
+        for i in range(1000):
+            bloom.add(f"key{i}")
+        self.assertTrue(all(f"key{i}" in bloom for i in range(1000)), "A Bloom filter never misses an added key")
+        false_positives = sum(f"other{i}" in bloom for i in range(10000))
+        self.assertLess(false_positives, 300, "False positive rate is far above the 1% it was sized for")
+
+        for table in [LinearProbeTable(bloom_filter=True), HashyStepTable(bloom_filter=True)]:
+            self.churn(table)
+            self.assertLessEqual(table.bloom_stale, len(table), "Stale keys should trigger a rebuild")
+            self.assertTrue(all(key in table.bloom_filter for key in table.keys()))
+
+    @number("9.15")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_minimal_perfect_hash(self):
+        for stats in [PlayerPosition, PlayerStats, ResultStats, TeamStats]:
+            function = MinimalPerfectHash.build(stats)
+            slots = sorted(function.index(stat.value) for stat in stats)
+            self.assertEqual(slots, list(range(len(stats))), f"{stats.__name__} keys should fill every slot once")
+            self.assertEqual(function.index("Referee"), -1)
+
+        keys = [f"key{i}" for i in range(20000)]
+        function = MinimalPerfectHash.build(keys)
+        self.assertEqual(sorted(function.index(key) for key in keys), list(range(20000)))
+        self.assertEqual(sum(function.index(f"other{i}") >= 0 for i in range(1000)), 0)
+
+        # The parameters are found once per key set, whatever order the keys come in
+        self.assertIs(MinimalPerfectHash.build(reversed(keys)).displacements, function.displacements)
+        self.assertRaises(ValueError, lambda: MinimalPerfectHash.build([]))
+        self.assertRaises(ValueError, lambda: MinimalPerfectHash.build(["Goals", "Goals"]))
+
+        # The key hash does not depend on the run, so neither do the slots
+        self.assertEqual(MinimalPerfectHash.hash("Striker"), 0x2B821013DDB3AF16)
+
+        class NoDisplacement(MinimalPerfectHash):
+            MAX_DISPLACEMENT = 0
+        # Buckets of several keys can never be placed, so the build gives up instead of looping
+        self.assertRaises(ValueError, lambda: NoDisplacement.build([f"stuck{i}" for i in range(100)]))
+
+    @number("9.16")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_perfect_hash_table(self):
+        table = PerfectHashTable(PlayerPosition)
+        self.assertTrue(table.is_empty())
+        for i, position in enumerate(PlayerPosition):
+            table[position.value] = i
+        self.assertTrue(table.is_full())
+        self.assertEqual(table.table_size, len(PlayerPosition))
+        self.assertEqual([table[position.value] for position in PlayerPosition], list(range(len(PlayerPosition))))
+        self.assertRaises(KeyError, lambda: table.__setitem__("Referee", 0))
+        self.assertRaises(KeyError, lambda: table["Referee"])
+
+        del table[PlayerPosition.STRIKER.value]
+        self.assertEqual(len(table), len(PlayerPosition) - 1)
+        self.assertFalse(PlayerPosition.STRIKER.value in table)
+        self.assertEqual(table.get(PlayerPosition.STRIKER.value, "none"), "none")
+        self.assertRaises(KeyError, lambda: table.__delitem__(PlayerPosition.STRIKER.value))
+        table[PlayerPosition.STRIKER.value] = "back"
+        self.assertEqual(table[PlayerPosition.STRIKER.value], "back")
+
+        # A built function can be shared by tables over the same keys
+        shared = PerfectHashTable(table.perfect_hash)
+        self.assertIs(shared.perfect_hash, table.perfect_hash)
+        self.assertTrue(shared.is_empty())
+
+    @number("9.17")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_from_items_presizes(self):
+        items = [(f"key{i}", i) for i in range(1000)]
+        for table_type in [LinearProbeTable, HashyStepTable, HashTableSeparateChaining, CompactLinearProbeTable,
+                           RobinHoodTable]:
+            table = table_type.from_items(iter(items), len(items))
+            self.assertEqual(len(table), len(items))
+            self.assertEqual(sorted(table.values()), list(range(1000)))
+            self.assertEqual(table["key500"], 500, f"{table_type.__name__} lost a key")
+
+            # Sized for the keys up front, so no insert had to grow it
+            size = table.table_size
+            table.update_many([("key0", "first"), ("key0", "last")])
+            self.assertEqual(table.table_size, size)
+            self.assertEqual(table["key0"], "last")
+
+            table.update_many((f"more{i}", i) for i in range(2000))
+            self.assertEqual(len(table), 3000)
+            self.assertEqual(table["more1999"], 1999)
+
+        # The smallest size that holds 1000 keys below the maximum load
+        self.assertEqual(LinearProbeTable.from_items(items).table_size, 3079)
+        self.assertEqual(CompactLinearProbeTable.from_items(items).table_size, 3079)
+        self.assertEqual(RobinHoodTable.from_items(items).table_size, 1543)
+        self.assertEqual(HashyStepTable.from_items(items).table_size, 1543)
+        self.assertEqual(HashTableSeparateChaining.from_items(items).table_size, next_prime(1001))
+
+    @number("9.18")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_hashy_step_compact_keeps_probe_stats(self):
+        table = HashyStepTable([97], tombstone_ratio=0.5)
+        for letter in "ABCDEFGH":
+            table[letter] = letter
+        for letter in "ABC":
+            del table[letter]
+        stats = (table.probe_operations, table.probe_total, table.probe_max)
+
+        # Reinserting the live entries is not a lookup, so it is not counted
+        table._compact()
+        self.assertEqual(table.dels, 0)
+        self.assertEqual((table.probe_operations, table.probe_total, table.probe_max), stats)
+        self.assertEqual([table[letter] for letter in "DEFGH"], list("DEFGH"))
+
+    @number("9.19")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_empty_table_keys(self):
+        for table_type in [LinearProbeTable, CompactLinearProbeTable, RobinHoodTable, CuckooTable]:
+            table = table_type()
+            self.assertEqual((len(table.keys()), len(table.values())), (0, 0), f"{table_type.__name__} is empty")
+
+            # Emptied again after holding keys
+            table["A"] = 1
+            del table["A"]
+            self.assertEqual(list(table.keys()), [])
+            self.assertEqual(list(table.values()), [])
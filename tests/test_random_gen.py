@@ -0,0 +1,76 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from random_gen import RandomGen, RandomStream
+from season import Season
+from season_runner import ParallelSeasonRunner, simulate_seeded_season
+from tests import test_task5
+
+
+def build_season() -> Season:
+    return Season(test_task5.Roster.generate_teams(4))
+
+
+class TestRandomGen(TestCase):
+
+    @number("8.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_stream_matches_random_gen(self):
+        stream = RandomStream(123)
+        RandomGen.set_seed(123)
+        for _ in range(100):
+            self.assertEqual(stream.randint(0, 1000), RandomGen.randint(0, 1000))
+
+    @number("8.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_stream_jump(self):
+        for steps in [0, 1, 2, 17, 1000]:
+            stepped = RandomStream(42)
+            for _ in range(steps):
+                stepped.random()
+            jumped = RandomStream(42).jumped(steps)
+            self.assertEqual(stepped.random(), jumped.random(), f"Jump of {steps} draws is wrong")
+
+    @number("8.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_runner_independent_of_workers(self):
+        in_process = ParallelSeasonRunner(build_season, 123, max_workers=0).run(4)
+        one_worker = ParallelSeasonRunner(build_season, 123, max_workers=1).run(4)
+        two_workers = ParallelSeasonRunner(build_season, 123, max_workers=2).run(4)
+        self.assertEqual(in_process, one_worker)
+        self.assertEqual(in_process, two_workers)
+        self.assertEqual(in_process[0], simulate_seeded_season(build_season, 123))
+        self.assertNotEqual(in_process[0], in_process[1])
+
+    @number("8.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_random_block(self):
+        RandomGen.set_seed(123)
+        block = RandomGen.random_block(500)
+        after_block = RandomGen.random()
+        RandomGen.set_seed(123)
+        for i in range(500):
+            self.assertEqual(block[i], RandomGen.random(), f"Draw {i} of the block is wrong")
+        self.assertEqual(after_block, RandomGen.random())
+
+    @number("8.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_skip(self):
+        RandomGen.set_seed(99)
+        for _ in range(1234):
+            RandomGen.random()
+        expected = RandomGen.random()
+        RandomGen.set_seed(99)
+        RandomGen.skip(1234)
+        self.assertEqual(RandomGen.random(), expected)
+
+    @number("8.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_runner_seeds_do_not_wrap(self):
+        runner = ParallelSeasonRunner(build_season, 123, max_workers=0)
+        # 2^16 seasons of 2^32 draws used to cover the whole period and start again
+        indices = [0, 1, 2, 1 << 16, (1 << 16) + 1, runner.MAX_SEASONS - 1]
+        seeds = [runner.seed_for(index) for index in indices]
+        self.assertEqual(len(set(seeds)), len(indices), "Season streams should start at different states")
+        self.assertRaises(ValueError, lambda: runner.seed_for(runner.MAX_SEASONS))
+        self.assertRaises(ValueError, lambda: runner.run(runner.MAX_SEASONS + 1))
@@ -0,0 +1,140 @@
+from unittest import TestCase
+
+from data_structures.bset import BSet
+from data_structures.hash_set import HashSet
+from data_structures.roaring_set import ARRAY_LIMIT, ArrayContainer, BitmapContainer, RoaringSet
+from data_structures.sorted_aset import SortedASet, gallop
+from ed_utils.decorators import number, visibility
+from random_gen import RandomStream
+from tests.helper import take_out_from_adt
+
+
+class TestSets(TestCase):
+
+    def setUp(self) -> None:
+        # Spread over several 64 bit words, including both ends of a word
+        self.items = [1, 2, 63, 64, 65, 128, 129, 300, 1000]
+
+    @number("11.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_bset_iteration(self):
+        bset = BSet.from_iterable(reversed(self.items))
+        self.assertEqual(len(bset), len(self.items))
+        self.assertEqual(list(bset), self.items, "Iteration should give the elements in increasing order")
+        self.assertEqual(take_out_from_adt(bset).to_list(), self.items)
+        self.assertEqual(str(BSet.from_iterable([3, 1])), "{1, 3}")
+        self.assertEqual(list(BSet()), [])
+        self.assertRaises(TypeError, lambda: BSet.from_iterable([1, 0]))
+
+    @number("11.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_bset_rank_select(self):
+        items = sorted(set(RandomStream(8).randint(1, 5000) for _ in range(500)))
+        bset = BSet.from_iterable(items)
+        for k, item in enumerate(items, 1):
+            self.assertEqual(bset.select(k), item, f"select({k}) is wrong")
+            self.assertEqual(bset.rank(item), k, f"rank({item}) is wrong")
+        self.assertEqual(bset.rank(items[0] - 1) if items[0] > 1 else 0, 0)
+        self.assertRaises(IndexError, lambda: bset.select(len(items) + 1))
+        self.assertRaises(IndexError, lambda: bset.select(0))
+
+    @number("11.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_bset_in_place(self):
+        bset = BSet.from_iterable(self.items)
+        original = bset
+        bset |= BSet.from_iterable([5, 64])
+        bset -= BSet.from_iterable([1, 1000])
+        bset &= BSet.from_iterable([2, 5, 64, 300, 400])
+        self.assertIs(bset, original, "In-place operators should not create a new set")
+        self.assertEqual(list(bset), [2, 5, 64, 300])
+
+    @number("11.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_roaring_containers(self):
+        huge = [1, 2 ** 40 + 1, 2 ** 40 + 2, 10 ** 15]
+        roaring = RoaringSet.from_iterable(reversed(huge))
+        self.assertEqual(list(roaring), huge, "Iteration should give the elements in increasing order")
+        self.assertEqual(len(roaring.keys), 3, "Only chunks holding elements should be stored")
+        self.assertNotIn(2, roaring)
+        self.assertEqual(str(RoaringSet.from_iterable([3, 1])), "{1, 3}")
+
+        roaring = RoaringSet()
+        for item in range(1, ARRAY_LIMIT + 1):
+            roaring.add(item)
+        self.assertIsInstance(roaring.containers[0], ArrayContainer)
+        roaring.add(ARRAY_LIMIT + 1)
+        self.assertIsInstance(roaring.containers[0], BitmapContainer, "A full array container should become a bitmap")
+        roaring.add(ARRAY_LIMIT + 1)
+        self.assertEqual(len(roaring), ARRAY_LIMIT + 1)
+        roaring.remove(1)
+        self.assertIsInstance(roaring.containers[0], BitmapContainer, "A bitmap should not convert back right at the limit")
+        self.assertEqual(list(roaring), list(range(2, ARRAY_LIMIT + 2)))
+        self.assertRaises(KeyError, lambda: roaring.remove(1))
+        for item in range(2, ARRAY_LIMIT // 2 + 3):
+            roaring.remove(item)
+        self.assertIsInstance(roaring.containers[0], ArrayContainer, "A small bitmap should become an array again")
+        self.assertEqual(list(roaring), list(range(ARRAY_LIMIT // 2 + 3, ARRAY_LIMIT + 2)))
+        self.assertRaises(TypeError, lambda: roaring.add(0))
+
+    @number("11.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_roaring_algebra(self):
+        stream = RandomStream(17)
+        for universe, count in [(100, 40), (200_000, 20_000), (10 ** 9, 300)]:
+            first = set(stream.randint(1, universe) for _ in range(count))
+            second = set(stream.randint(1, universe) for _ in range(count))
+            a, b = RoaringSet.from_iterable(first), RoaringSet.from_iterable(second)
+            self.assertEqual(list(a | b), sorted(first | second), f"Union is wrong for universe {universe}")
+            self.assertEqual(list(a & b), sorted(first & second), f"Intersection is wrong for universe {universe}")
+            self.assertEqual(list(a - b), sorted(first - second), f"Difference is wrong for universe {universe}")
+            self.assertEqual(len(a | b), len(first | second))
+            self.assertEqual(list(a), sorted(first), "Set operations should not modify their operands")
+
+    @number("11.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_sorted_aset(self):
+        sorted_set = SortedASet.from_iterable([65, 1, 300, 1, 64])
+        self.assertEqual(take_out_from_adt(sorted_set).to_list(), [1, 64, 65, 300], "Duplicates should be dropped")
+        sorted_set.add(2)
+        sorted_set.add(2)
+        sorted_set.remove(65)
+        self.assertEqual(list(sorted_set), [1, 2, 64, 300])
+        self.assertIn(64, sorted_set)
+        self.assertNotIn(65, sorted_set)
+        self.assertRaises(KeyError, lambda: sorted_set.remove(65))
+        self.assertEqual(str(SortedASet.from_iterable(["b", "a"])), "{'a', 'b'}")
+
+        items = SortedASet.from_iterable(range(0, 100, 3))
+        for target in range(-1, 101):
+            expected = min([i for i in range(len(items)) if items.array[i] >= target], default=len(items))
+            self.assertEqual(gallop(items.array, target, 0, len(items)), expected, f"gallop({target}) is wrong")
+
+    @number("11.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_hash_set(self):
+        hash_set = HashSet.from_iterable(["Goals", "Assists", "Goals"])
+        self.assertEqual(len(hash_set), 2)
+        self.assertEqual(sorted(take_out_from_adt(hash_set).to_list()), ["Assists", "Goals"])
+        hash_set.add("Tackles")
+        hash_set.remove("Goals")
+        self.assertEqual(sorted(hash_set), ["Assists", "Tackles"])
+        self.assertRaises(KeyError, lambda: hash_set.remove("Goals"))
+        hash_set.clear()
+        self.assertTrue(hash_set.is_empty())
+
+    @number("11.8")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_set_algebra_matches(self):
+        stream = RandomStream(23)
+        # Skewed sizes exercise the galloping paths of SortedASet
+        for first_count, second_count in [(0, 50), (500, 500), (20, 2000), (2000, 20)]:
+            first = set(stream.randint(1, 4000) for _ in range(first_count))
+            second = set(stream.randint(1, 4000) for _ in range(second_count))
+            for set_type in [SortedASet, HashSet]:
+                a, b = set_type.from_iterable(first), set_type.from_iterable(second)
+                name = set_type.__name__
+                self.assertEqual(sorted(a | b), sorted(first | second), f"{name} union is wrong")
+                self.assertEqual(sorted(a & b), sorted(first & second), f"{name} intersection is wrong")
+                self.assertEqual(sorted(a - b), sorted(first - second), f"{name} difference is wrong")
+                self.assertEqual(len(a - b), len(first - second))
@@ -0,0 +1,224 @@
+from unittest import TestCase
+
+from constants import GameResult, PlayerPosition, PlayerStats, ResultStats, TeamStats
+from data_structures.hash_table import LinearProbeTable
+from form_tracker import FormTracker
+from data_structures.referential_array import ArrayR
+from ed_utils.decorators import number, visibility
+from game_simulator import GameSimulator
+from match_stats import MatchStatsAccumulator
+from player import Player
+from random_gen import RandomGen
+from season import Season
+from stat_vector import StatVector
+from team import Team
+from team_registry import TeamRegistry
+from tests import test_task5
+
+
+class TestSimulation(TestCase):
+
+    def setUp(self) -> None:
+        self.players = [
+            Player("Alexey", PlayerPosition.STRIKER, 22),
+            Player("Maria", PlayerPosition.MIDFIELDER, 22),
+            Player("Brendon", PlayerPosition.DEFENDER, 22),
+            Player("Saksham", PlayerPosition.GOALKEEPER, 22),
+        ]
+        for i, player in enumerate(self.players):
+            player[PlayerStats.HEIGHT] = 150 + i
+            player[PlayerStats.STAR_SKILL] = i
+        self.team = Team("Sample Team", ArrayR.from_list(self.players))
+
+    @number("7.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_weighted_players_cached(self):
+        index = self.team.get_weighted_players(GameSimulator.SCORER_STATS, outfield_only=True)
+        self.assertIs(index, self.team.get_weighted_players(GameSimulator.SCORER_STATS, outfield_only=True))
+        self.assertEqual(len(index), 3, "Goalkeepers should not be weighted for outfield draws")
+
+        # Changing a non-weighting stat keeps the index
+        self.players[0][PlayerStats.GOALS] += 1
+        self.assertIs(index, self.team.get_weighted_players(GameSimulator.SCORER_STATS, outfield_only=True))
+
+    @number("7.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_weighted_players_invalidated(self):
+        index = self.team.get_weighted_players(GameSimulator.DEFENCE_STATS)
+        self.assertEqual(index.total, 150 + 151 + 152 + 153)
+
+        self.players[0][PlayerStats.HEIGHT] = 200
+        index = self.team.get_weighted_players(GameSimulator.DEFENCE_STATS)
+        self.assertEqual(index.total, 200 + 151 + 152 + 153)
+
+        self.team.remove_player(self.players[3])
+        index = self.team.get_weighted_players(GameSimulator.DEFENCE_STATS)
+        self.assertEqual(index.total, 200 + 151 + 152)
+
+    @number("7.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_incremental_leaderboard(self):
+        RandomGen.set_seed(123)
+        teams = test_task5.Roster.generate_teams(8)
+        season = Season(teams)
+        season.simulate_season()
+
+        self.assertTrue(season._leaderboard_is_sorted(), "Leaderboard should stay sorted during the season")
+        expected = sorted(teams, reverse=True)
+        for rank, team in enumerate(expected, 1):
+            self.assertEqual(season.get_rank(team), rank, f"{team.get_name()} has the wrong rank")
+
+    @number("7.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_match_stats_accumulator(self):
+        result = LinearProbeTable()
+        result[ResultStats.GOAL_SCORERS.value] = ArrayR.from_list(["Alexey", "Maria", "Alexey"])
+        result[ResultStats.GOAL_ASSISTS.value] = ArrayR.from_list(["Maria"])
+        result[ResultStats.TACKLES.value] = None
+        result[ResultStats.INTERCEPTIONS.value] = ArrayR.from_list(["Saksham"])
+
+        accumulator = MatchStatsAccumulator()
+        accumulator.add_result(result)
+        self.assertEqual(accumulator.get_count("Alexey", PlayerStats.GOALS), 2)
+        self.assertEqual(accumulator.get_count("Brendon", PlayerStats.GOALS), 0)
+
+        accumulator.apply(self.team.get_players())
+        expected = {
+            "Alexey": [1, 2, 0, 0, 0],
+            "Maria": [1, 1, 1, 0, 0],
+            "Brendon": [1, 0, 0, 0, 0],
+            "Saksham": [1, 0, 0, 0, 1],
+        }
+        for player in self.players:
+            actual = [player[stat] for stat in [PlayerStats.GAMES_PLAYED, PlayerStats.GOALS, PlayerStats.ASSISTS,
+                                                PlayerStats.TACKLES, PlayerStats.INTERCEPTIONS]]
+            self.assertEqual(actual, expected[player.get_name()], f"{player.get_name()} stats not applied correctly")
+
+    @number("7.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_iter_results(self):
+        RandomGen.set_seed(123)
+        teams = test_task5.Roster.generate_teams(4)
+        season = Season(teams)
+        played = 0
+        for result in season.iter_results():
+            played += 1
+            home_team = result["home team"]
+            self.assertEqual(sum(team[TeamStats.GAMES_PLAYED] for team in teams), 2 * played,
+                             "Each result should be applied before it is yielded")
+            self.assertIn(season.get_rank(home_team), range(1, 5))
+        self.assertEqual(played, 12)
+
+        # Streaming gives the same season as simulate_season
+        streamed = season.get_leaderboard()
+        RandomGen.set_seed(123)
+        other = Season(test_task5.Roster.generate_teams(4))
+        other.simulate_season()
+        simulated = other.get_leaderboard()
+        for row in range(4):
+            self.assertEqual(streamed[row].to_list()[:9], simulated[row].to_list()[:9])
+
+    @number("7.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_circle_schedule(self):
+        for num_teams in [2, 3, 6, 7]:
+            RandomGen.set_seed(123)
+            teams = test_task5.Roster.generate_teams(num_teams)
+            season = Season(teams, scheduler=Season.CIRCLE_SCHEDULER)
+            weeks = 2 * (num_teams - 1) if num_teams % 2 == 0 else 2 * num_teams
+            self.assertEqual(len(season.schedule), weeks, f"Wrong number of weeks for {num_teams} teams")
+
+            fixtures = set()
+            for week in season.schedule:
+                playing = [team.get_name() for game in week for team in (game.home_team, game.away_team)]
+                self.assertEqual(len(playing), len(set(playing)), "A team plays twice in one week")
+                self.assertEqual(len(playing), num_teams - num_teams % 2, "Every team without a bye should play")
+                for game in week:
+                    fixtures.add((game.home_team.get_name(), game.away_team.get_name()))
+            self.assertEqual(len(fixtures), num_teams * (num_teams - 1), "Every pair should meet home and away")
+
+        with self.assertRaises(ValueError):
+            Season(test_task5.Roster.generate_teams(4), scheduler="random")
+
+    @number("7.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_roster_snapshots(self):
+        roster = self.team.get_roster()
+        self.assertEqual(roster.to_list(), [player for player in self.team.get_players()])
+        self.assertIs(roster, self.team.get_roster(), "The snapshot should be reused while the roster is unchanged")
+        self.assertEqual([player.get_name() for player in self.team.get_outfield_roster()],
+                         ["Brendon", "Maria", "Alexey"])
+        self.assertEqual(self.team.get_roster(PlayerPosition.STRIKER).to_list(), [self.players[0]])
+
+        GameSimulator.simulate(self.team, self.team)
+        self.assertIs(roster, self.team.get_roster(), "Simulating a game should not rebuild the roster")
+
+        snapshots = self.team.position_snapshots
+        self.team.remove_player(self.players[0])
+        self.assertIsNone(self.team.get_roster(PlayerPosition.STRIKER))
+        self.assertIs(self.team.position_snapshots, snapshots, "A roster change should refill the snapshot table, not replace it")
+        self.assertIs(snapshots.perfect_hash, Team.POSITION_HASH)
+        self.assertEqual(len(self.team.get_roster()), 3)
+        self.team.add_player(self.players[0])
+        self.assertEqual(self.team.get_roster(PlayerPosition.STRIKER).to_list(), [self.players[0]])
+
+    @number("7.8")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_stat_vector(self):
+        stats = StatVector(TeamStats)
+        self.assertEqual(len(stats), len(TeamStats))
+        self.assertEqual(stats.slot(TeamStats.POINTS), 1)
+        stats[TeamStats.WINS] += 2
+        self.assertEqual(stats["Wins"], 2, "Stats should be readable by member value")
+        self.assertRaises(KeyError, lambda: stats[PlayerStats.GOALS])
+        stats.reset()
+        self.assertEqual(stats[TeamStats.WINS], 0)
+
+        # Resetting a player's stats invalidates the weighted indices built from them
+        index = self.team.get_weighted_players(GameSimulator.DEFENCE_STATS)
+        self.players[0].reset_stats()
+        self.assertEqual(self.players[0][PlayerStats.HEIGHT], 0)
+        self.assertEqual(self.team.get_weighted_players(GameSimulator.DEFENCE_STATS).total, index.total - 150)
+
+    @number("7.9")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_form_tracker(self):
+        form = FormTracker(3)
+        results = [GameResult.WIN, GameResult.DRAW, GameResult.LOSS, GameResult.WIN, GameResult.WIN]
+        for result in results:
+            form.push(result)
+        self.assertEqual(list(form), results[-3:], "Only the newest results should be kept, oldest first")
+        self.assertEqual(form.points(), 6)
+        self.assertEqual(form[0], GameResult.LOSS)
+
+        team = Team("Form Team", ArrayR.from_list(self.players), form_length=10)
+        self.assertIsNone(team.get_last_five_results())
+        for _ in range(12):
+            team[TeamStats.DRAWS] = team[TeamStats.DRAWS] + 1
+        last_results = team.get_last_five_results()
+        self.assertEqual(len(last_results), 10)
+        self.assertEqual(team.get_form_points(), 10)
+
+        team.reset_stats()
+        self.assertIsNone(team[TeamStats.LAST_FIVE_RESULTS])
+        self.assertEqual(len(last_results), 10, "Returned results should be a copy")
+
+    @number("7.10")
+    @visibility(visibility.VISIBILITY_SHOW)
+    def test_team_registry(self):
+        RandomGen.set_seed(123)
+        teams = test_task5.Roster.generate_teams(4)
+        registry = TeamRegistry()
+        self.assertEqual([registry.register(team) for team in teams], [1, 2, 3, 4])
+        self.assertEqual(registry.register(teams[2]), 3, "Registering twice should keep the ID")
+
+        registry.release(teams[1])
+        registry.release(teams[0])
+        self.assertNotIn(teams[0], registry)
+        self.assertEqual(registry.register(teams[1]), 1, "The smallest free ID should be reused first")
+        self.assertEqual(registry.register(teams[0]), 2)
+        self.assertRaises(KeyError, lambda: registry.release(self.team))
+
+        season = Season(teams)
+        self.assertEqual(sorted(season.team_ids.id_of(team) for team in teams), [1, 2, 3, 4],
+                         "Season IDs should not depend on how many teams were created before")
@@ -0,0 +1,96 @@
+"""
+Cumulative weight index used for weighted random choices during a game.
+
+The weights of a collection are summed once into prefix sums, and every draw is a
+binary search over them instead of a scan that re-reads every weight.
+"""
+from __future__ import annotations
+from array import array
+from bisect import bisect_left
+from typing import Generic, Iterable, TypeVar
+
+from constants import PlayerStats
+from random_gen import RandomGen
+
+T = TypeVar('T')
+
+
+class CumulativeWeights(Generic[T]):
+    """
+    Prefix sums over the weights of a fixed collection of items.
+
+    Draws consume `RandomGen` exactly like the linear scan in the original
+    `GameSimulator.__weighted_choice`: one `randint(0, total - 1)` when the total weight is
+    positive, otherwise a uniform `random_choice` over the items. The item returned is the
+    first one whose cumulative weight is >= the drawn value.
+
+    Attributes:
+        items (list[T]): the items to choose from
+        prefix (array[int]): prefix[i] is the sum of the weights of items[0..i]
+        version (tuple): caller supplied stamp of the data the weights were built from
+    """
+
+    def __init__(self, items: Iterable[T], weights: Iterable[int], version: tuple = ()) -> None:
+        """
+        Complexity:
+            Best/Worst Case Complexity: O(N) where N is the number of items.
+        """
+        self.items: list[T] = list(items)
+        self.prefix = array('q')
+        total = 0
+        for weight in weights:
+            total += weight
+            self.prefix.append(total)
+        if len(self.prefix) != len(self.items):
+            raise ValueError("Every item needs exactly one weight.")
+        self.version = version
+
+    @classmethod
+    def from_players(cls, players: Iterable, attributes: tuple[PlayerStats, ...], version: tuple = ()) -> CumulativeWeights:
+        """
+        Builds the index over players, weighting each by the sum of the given stats.
+
+        Complexity:
+            Best/Worst Case Complexity: O(N * A) where N is the number of players and A is len(attributes).
+        """
+        players = list(players)
+        return cls(players, [sum(player[attr] for attr in attributes) for player in players], version)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    @property
+    def total(self) -> int:
+        """ The sum of all weights. """
+        return self.prefix[-1] if len(self.prefix) else 0
+
+    def choose(self) -> T:
+        """
+        Selects an item based on its weight.
+
+        Complexity:
+            Best/Worst Case Complexity: O(log(N)) where N is the number of items.
+        """
+        total = self.total
+        if total == 0:  # Handle edge case where all weights are zero
+            return RandomGen.random_choice(self.items)
+        return self.items[bisect_left(self.prefix, RandomGen.randint(0, total - 1))]
+
+    @staticmethod
+    def choose_from_both(first: CumulativeWeights[T], second: CumulativeWeights[T]) -> T:
+        """
+        Selects an item as if `first` and `second` were one index with the items of
+        `first` followed by the items of `second`.
+
+        Complexity:
+            Best/Worst Case Complexity: O(log(N)) where N is len(first) + len(second).
+        """
+        first_total = first.total
+        total = first_total + second.total
+        if total == 0:
+            choice = RandomGen.randint(0, len(first) + len(second) - 1)
+            return first.items[choice] if choice < len(first) else second.items[choice - len(first)]
+        rand_val = RandomGen.randint(0, total - 1)
+        if len(first) and rand_val <= first_total:
+            return first.items[bisect_left(first.prefix, rand_val)]
+        return second.items[bisect_left(second.prefix, rand_val - first_total)]